@@ -3,17 +3,100 @@
 
 import logging
 import random
-import math
+import time
+from collections import namedtuple
 
+import numpy as np
 import pygame
 
+from airportgame.airfieldfactory import AirfieldFactory
+from airportgame.hitmap import RunwayHitMap
+from airportgame.metrics import METRICS
+from airportgame.placement import OccupancyGrid
 from airportgame.runway import Runway
-from airportgame.utilities import vec2tuple, distance_between
+from airportgame.tiledmap import TiledMap
+from airportgame.utilities import distances_to_segments
+
+
+LOGGER = logging.getLogger(__name__)
+GENERATION_TIMES = METRICS.histogram(
+    "airfield.generation_ms", (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000))
+RUNWAYS_GENERATED = METRICS.counter("airfield.runways_generated")
+
+
+class RunwayGeometry():
+    """Shapes of runways as read-only arrays, for calculations on all
+    runways at once. Row i of each array belongs to runway i.
+
+    Arguments:
+        runways {list[Runway]} -- Runways in the order of the table.
+    """
+
+    def __init__(self, runways):
+        shapes = [runway.shape for runway in runways]
+        self.starts = self._to_array([shape.start for shape in shapes], 2)
+        self.ends = self._to_array([shape.end for shape in shapes], 2)
+        self.directions = self._to_array(
+            [shape.direction for shape in shapes], 2)
+        self.angles = self._to_array([shape.angle for shape in shapes])
+        self.full_lengths = self._to_array(
+            [shape.full_length for shape in shapes])
+        self.approach_points = self._to_array(
+            [shape.approach_point for shape in shapes], 2)
+        self.midpoints = self._to_array(
+            [shape.midpoint for shape in shapes], 2)
+        self.bounding_boxes = self._to_array(
+            [shape.bounding_box for shape in shapes], 4)
+
+    @staticmethod
+    def _to_array(values, columns=None):
+        """Create a read-only array of floats.
+
+        Arguments:
+            values {list} -- Value of each runway.
+
+        Keyword Arguments:
+            columns {int} -- Length of each value, or None for numbers.
+                (default: {None})
+
+        Returns:
+            ndarray -- The array.
+        """
+
+        array = np.array(values, dtype=float)
+        if columns is not None:
+            array = array.reshape(-1, columns)
+        array.setflags(write=False)
+        return array
+
+    def __len__(self):
+        return len(self.starts)
+
+    def get_distances(self, points):
+        """Return the distances from points to every runway.
+
+        Arguments:
+            points {array_like} -- M points in world coordinates.
+
+        Returns:
+            ndarray -- (M, N) array of distances to the N runways.
+        """
+
+        return distances_to_segments(points, self.starts, self.ends)
+
+
+# Runways and the rendered map of an airfield that has not been shown yet.
+AirfieldLayout = namedtuple("AirfieldLayout", ["runways", "map"])
 
 
 class Airfield():
     """
     Airfield that contains runways.
+
+    If prefetch is more than zero, that many layouts are generated in the
+    background, so that resetting the airfield does not stall the game.
+    If layout is given, the airfield starts with it instead of random
+    runways.
     """
     FIELD_HEIGHT = 200
     FIELD_WIDTH = 400
@@ -23,40 +106,124 @@ class Airfield():
 
     EDGE_BUFFER = 15
 
-    def __init__(self, offset=(0, 0)):
-        self.logger = logging.getLogger(__name__ + "." + type(self).__name__)
+    def __init__(self, offset=(0, 0), prefetch=0, layout=None):
 
         # TODO: airfield size based on difficulty
-        self.max_runways = 10
-        self.min_runways = 3
+        self.min_runways, self.max_runways = self.get_runway_limits()
 
         self.offset = offset
+        self.version = 0
+        self.factory = None
+        self.hit_map = RunwayHitMap(self)
+
+        # The same map surface is drawn on for every new airfield
+        self.airfield_map = self.create_map()
 
         # Airfield is created here
-        self.reset_airfield()
+        if layout is None:
+            self.reset_airfield()
+        else:
+            self.apply_layout(layout)
+        if prefetch > 0:
+            self.factory = AirfieldFactory(self, prefetch)
+
+    def get_runway_limits(self):
+        """Return the minimum and maximum number of runways.
+
+        Returns:
+            tuple -- Minimum and maximum.
+        """
+
+        return 3, 10
+
+    def create_map(self):
+        """Create the surface the runways are drawn on.
+
+        Returns:
+            Surface -- The map.
+        """
+
+        airfield_map = pygame.Surface((self.FIELD_WIDTH, self.FIELD_HEIGHT))
+        if pygame.display.get_surface() is not None:
+            airfield_map = airfield_map.convert()
+        airfield_map.set_colorkey(self.TRANSPARENCY_COLORKEY, pygame.RLEACCEL)
+        return airfield_map
 
     def reset_airfield(self):
         """Reset current airfield and create a new one"""
-        self.logger.debug("Resetting airfield")
+        LOGGER.debug("Resetting airfield")
+        if self.factory is not None:
+            self.apply_layout(self.factory.get_layout())
+            return
         self.runway_list = []
-
         self.create_airfield()
-
-        self.airfield_map = pygame.Surface(
-            (self.FIELD_WIDTH, self.FIELD_HEIGHT))
-        self.airfield_map.fill(self.TRANSPARENCY_COLORKEY)
-        self.airfield_map.set_colorkey(self.TRANSPARENCY_COLORKEY)
         self.update_map()
+        self.version += 1
+
+    def generate_layout(self, surface=None):
+        """Create new runways and render them on a map, without changing the
+        current airfield. Can be called from a background thread.
+
+        Keyword Arguments:
+            surface {Surface} -- Surface to render the map on, or None to
+                create a new one. (default: {None})
+
+        Returns:
+            AirfieldLayout -- The new layout.
+        """
+
+        runways = self.generate_runways()
+        if surface is None:
+            surface = pygame.Surface((self.FIELD_WIDTH, self.FIELD_HEIGHT))
+        self.render_map(surface, runways)
+        return AirfieldLayout(runways, surface)
+
+    def apply_layout(self, layout):
+        """Replace the current airfield with a layout. The map of the layout
+        is copied to the map of the airfield, or drawn if the layout has no
+        map.
+
+        Arguments:
+            layout {AirfieldLayout} -- Layout from generate_layout or a
+                LayoutLibrary.
+        """
+
+        self.runway_list = list(layout.runways)
+        self.geometry = RunwayGeometry(self.runway_list)
+        self.hit_map.invalidate()
+        if layout.map is None:
+            self.update_map()
+        else:
+            self.airfield_map.blit(layout.map, (0, 0))
+            if self.factory is not None:
+                self.factory.recycle(layout.map)
+        self.version += 1
 
     def create_airfield(self):
         """
-        Randomly fills the airfield with runways
+        Randomly fills the airfield with runways.
+        """
+        self.runway_list.extend(self.generate_runways())
+        self.geometry = RunwayGeometry(self.runway_list)
+        self.hit_map.invalidate()
+
+    def generate_runways(self):
         """
+        Creates a random set of runways. The end points of the runways are
+        picked from an occupancy grid, so that they are never too close to
+        the runways already placed. If the airfield is full, it gets fewer
+        runways than planned.
+
+        Returns:
+            list[Runway] -- The runways.
+        """
+        start_time = time.perf_counter()
+        runways = []
         number_of_runways = random.randint(self.min_runways,
                                            self.max_runways)
 
-        # Initialize the list of runways
-        runways = [0] * number_of_runways
+        grid = OccupancyGrid(self.FIELD_WIDTH, self.FIELD_HEIGHT,
+                             self.EDGE_BUFFER)
 
         length = 0
         for i in range(number_of_runways):
@@ -70,67 +237,28 @@ class Airfield():
             # Get the full length of the runway.
             runway_length = Runway.RUNWAY_LENGTH_ENUM[length]
 
-            start_point_found = False
-
-            while not start_point_found:
-                s_x, s_y = self.get_random_point_inside_airfield()
-
-                start_point_found = self.compare_points((s_x, s_y), i)
-
-            start = (s_x, s_y)
-
-            end_point_found = False
-
-            # Counter to prevent infinite loops
-            temp = 0
-
-            while not end_point_found:
-
-                temp += 1
-
-                angle = random.random() * math.pi * 2.0
-                e_x = math.cos(angle) * runway_length
-                e_y = math.sin(angle) * runway_length
-
-                # Make sure the endpoints are inside the airfield
-                if s_x + e_x > self.FIELD_WIDTH or s_x + e_x < 0:
-                    e_x = s_x - e_x
-                else:
-                    e_x = s_x + e_x
-                if s_y + e_y > self.FIELD_HEIGHT or s_y + e_y < 0:
-                    e_y = s_y - e_y
-                else:
-                    e_y = s_y + e_y
-
-                e_x = int(e_x)
-                e_y = int(e_y)
-
-                end = (e_x, e_y)
-                end_point_found = (self.compare_points(end, i) and
-                                   self.point_inside_airfield(end))
-
-                if temp == 1000:
-                    # Just use this one if we actually end up here
-                    self.logger.warning(
-                        "Unoptimal runway end point for runway #%d !", (i + 1))
-                    end_point_found = True
+            segment = grid.find_segment(runway_length)
+            if segment is None:
+                LOGGER.warning(
+                    "No room for runway #%d, the airfield has %d runways",
+                    i + 1, i)
+                break
+            start, end = segment
 
             # start point should be to the left of end:
-            if e_x < s_x:
+            if end[0] < start[0]:
                 start, end = end, start
 
-            runways[i] = (start, end)
-
-            if not self.point_inside_airfield(start):
-                self.logger.warning("Runway %d start outside airfield!", i+1)
-            if not self.point_inside_airfield(end):
-                self.logger.warning("Runway %d end outside airfield!", i+1)
+            if i < number_of_runways - 1:
+                grid.occupy_segment(start, end, self.MINIMUM_DISTANCE)
 
             new_runway = Runway(self.add_offset_to_tuple(start),
                                 self.add_offset_to_tuple(end), i+1, length)
-            self.runway_list.append(new_runway)
+            runways.append(new_runway)
 
-        return
+        GENERATION_TIMES.observe((time.perf_counter() - start_time) * 1000.0)
+        RUNWAYS_GENERATED.inc(len(runways))
+        return runways
 
     def get_runways(self):
         """Return a list of the runways on the airfield.
@@ -141,35 +269,58 @@ class Airfield():
 
         return self.runway_list
 
-    def compare_points(self, point, index):
+    def get_runway_geometry(self):
+        """Return the start and end points of the runways as arrays.
+
+        Returns:
+            RunwayGeometry -- Geometry of the runways in get_runways order.
         """
-        Checks that the starting and ending points of all other runways are far enough
-        of the one being tested.
+
+        return self.geometry
+
+    def get_runway_at(self, point):
+        """Return the runway drawn at a point.
+
+        Arguments:
+            point {tuple} -- Point in world coordinates.
+
+        Returns:
+            Runway -- The topmost runway at the point, or None.
         """
-        if index == 0:
-            return True
-
-        for runway_i in range(index):
-            runway = self.runway_list[runway_i]
-            start, end = runway.get_start_and_end_pos()
-            start = self.remove_offset_from_tuple(start)
-            end = self.remove_offset_from_tuple(end)
-
-            if (distance_between(point, start) < self.MINIMUM_DISTANCE or
-                    distance_between(point, end) < self.MINIMUM_DISTANCE):
-                return False
-            if self.dist_to_segment(start, end, point) < (self.MINIMUM_DISTANCE):
-                return False
-        return True
+
+        index = self.hit_map.get_index(self.remove_offset_from_tuple(point))
+        if index == RunwayHitMap.EMPTY:
+            return None
+        return self.runway_list[index]
 
     def update_map(self):
         """Draws and paints the runways on the airfield map."""
 
-        for runway in self.runway_list:
-            runway.draw(self.airfield_map, self.get_offset())
+        self.render_map(self.airfield_map, self.runway_list)
+
+    def render_map(self, surface, runways):
+        """Clears the surface and draws and paints the runways on it.
+
+        Arguments:
+            surface {Surface} -- Surface to draw on.
+            runways {list[Runway]} -- Runways to draw.
+        """
+
+        surface.fill(self.TRANSPARENCY_COLORKEY)
+        for runway in runways:
+            runway.draw(surface, self.get_offset())
+
+        for runway in runways:
+            runway.paint(surface, self.get_offset())
+
+    def get_version(self):
+        """Return a number that changes whenever the airfield is reset.
+
+        Returns:
+            int -- Version of the airfield.
+        """
 
-        for runway in self.runway_list:
-            runway.paint(self.airfield_map, self.get_offset())
+        return self.version
 
     def get_airfield_map(self):
         """Return the map of the airfield.
@@ -180,14 +331,23 @@ class Airfield():
 
         return self.airfield_map
 
-    def draw(self, screen):
+    def draw(self, screen, camera=None):
         """Draws the airfield.
 
         Arguments:
             screen {Surface} -- Surface to draw on.
+
+        Keyword Arguments:
+            camera {Camera} -- Camera to view the airfield through, or None
+                to draw in world coordinates. (default: {None})
+
+        Returns:
+            Rect -- Bounding rectangle of the airfield.
         """
 
-        screen.blit(self.airfield_map, self.offset)
+        if camera is not None:
+            return camera.draw_surface(screen, self.airfield_map, self.offset)
+        return screen.blit(self.airfield_map, self.offset)
 
     def get_offset(self):
         """Return the offset of the airfield.
@@ -225,65 +385,135 @@ class Airfield():
         offset_x, offset_y = self.offset
         return (point[0] - offset_x, point[1] - offset_y)
 
-    def point_inside_airfield(self, point, use_buffer=True):
-        """Returns true if the given point is inside the airfield.
+    def dist_to_segment(self, start, end, point):
+        """Return the shortest distance between given segment a point.
 
         Arguments:
-            point {tuple} -- Coordinates of a point.
+            start {Vector2} -- Start point of segment
+            end {Vector2} -- End point of segment
+            point {Vector2} -- Point
 
-        Keyword Arguments:
-            use_buffer {bool} -- Whether EDGE_BUFFER should be used.
-                (default: {True})
+        Returns:
+            float -- Shortest distance between segment and point.
+        """
+
+        return float(distances_to_segments(point, start, end)[0, 0])
+
+
+class LargeAirfield(Airfield):
+    """
+    Airfield that can be many times larger than the default one and have
+    hundreds of runways. The map is split into tiles that are drawn only
+    when they become visible, and layouts are generated without a map.
+
+    Keyword Arguments:
+        size {tuple} -- Width and height of the field.
+            (default: {(4000, 2000)})
+
+    See Airfield for the other arguments.
+    """
+    TILE_SIZE = 256
+    # Runways per square unit of the field, the same as the default field
+    RUNWAY_DENSITY = 10 / (Airfield.FIELD_WIDTH * Airfield.FIELD_HEIGHT)
+    # How far the drawing of a runway reaches from its center line,
+    # including its number
+    RUNWAY_DRAW_MARGIN = 40
+
+    def __init__(self, offset=(0, 0), prefetch=0, layout=None,
+                 size=(4000, 2000)):
+        self.FIELD_WIDTH, self.FIELD_HEIGHT = size
+        super().__init__(offset, prefetch, layout)
+
+    def get_runway_limits(self):
+        """Return the minimum and maximum number of runways. The maximum
+        grows with the area of the field. The placement stops early if the
+        field is full.
 
         Returns:
-            bool -- True if point is inside the airfield.
+            tuple -- Minimum and maximum.
         """
 
-        buffer = self.EDGE_BUFFER if use_buffer else 0
-        is_inside = (
-            (buffer <= point[0] <= self.FIELD_WIDTH - buffer) and
-            (buffer <= point[1] <= self.FIELD_HEIGHT - buffer)
-        )
-        return is_inside
+        maximum = max(10, int(self.FIELD_WIDTH * self.FIELD_HEIGHT
+                              * self.RUNWAY_DENSITY))
+        return maximum // 2, maximum
 
-    def get_random_point_inside_airfield(self):
-        """Pick a random point inside the airfield.
+    def create_map(self):
+        """Create the tiled map the runways are drawn on.
 
         Returns:
-            int -- x-coordinate
-            int -- y-coordinate
+            TiledMap -- The map.
         """
 
-        x = random.randint(
-            self.EDGE_BUFFER, self.FIELD_WIDTH - self.EDGE_BUFFER)
-        y = random.randint(
-            self.EDGE_BUFFER, self.FIELD_HEIGHT - self.EDGE_BUFFER)
-        return x, y
+        return TiledMap(self.FIELD_WIDTH, self.FIELD_HEIGHT, self.render_tile,
+                        tile_size=self.TILE_SIZE,
+                        colorkey=self.TRANSPARENCY_COLORKEY)
 
-    def dist_to_segment(self, start, end, point):
-        """Return the shortest distance between given segment a point.
+    def generate_layout(self, surface=None):
+        """Create new runways without changing the current airfield. The
+        layout has no map, the tiles are drawn when they are needed.
+
+        Keyword Arguments:
+            surface {Surface} -- Not used. (default: {None})
+
+        Returns:
+            AirfieldLayout -- The new layout.
+        """
+
+        return AirfieldLayout(self.generate_runways(), None)
+
+    def apply_layout(self, layout):
+        """Replace the current airfield with a layout. Maps of layouts are
+        ignored.
 
         Arguments:
-            start {Vector2} -- Start point of segment
-            end {Vector2} -- End point of segment
-            point {Vector2} -- Point
+            layout {AirfieldLayout} -- The layout.
+        """
+
+        super().apply_layout(layout._replace(map=None))
+
+    def update_map(self):
+        """Forget the drawn tiles, so that they are drawn again."""
+
+        self.airfield_map.invalidate()
+
+    def render_tile(self, tile, rect):
+        """Draw the runways that overlap a tile.
+
+        Arguments:
+            tile {Surface} -- Surface of the tile.
+            rect {Rect} -- Area of the tile on the field.
+        """
+
+        geometry = self.geometry
+        offset = self.get_offset()
+        margin = self.RUNWAY_DRAW_MARGIN
+        starts = geometry.starts - offset
+        ends = geometry.ends - offset
+        near = ((np.minimum(starts[:, 0], ends[:, 0]) - margin < rect.right) &
+                (np.maximum(starts[:, 0], ends[:, 0]) + margin > rect.left) &
+                (np.minimum(starts[:, 1], ends[:, 1]) - margin < rect.bottom) &
+                (np.maximum(starts[:, 1], ends[:, 1]) + margin > rect.top))
+        runways = [self.runway_list[i] for i in np.flatnonzero(near)]
+        tile_offset = offset + pygame.math.Vector2(rect.topleft)
+
+        for runway in runways:
+            runway.draw(tile, tile_offset)
+
+        for runway in runways:
+            runway.paint(tile, tile_offset)
+
+    def draw(self, screen, camera=None):
+        """Draws the visible tiles of the airfield.
+
+        Arguments:
+            screen {Surface} -- Surface to draw on.
+
+        Keyword Arguments:
+            camera {Camera} -- Camera to view the airfield through, or None
+                to draw in world coordinates. (default: {None})
 
         Returns:
-            float -- Shortest distance between segment and point.
+            Rect -- Bounding rectangle of the drawn tiles, or None.
         """
 
-        # https://stackoverflow.com/a/1501725
-        segment_length = distance_between(start, end)
-        if segment_length == 0:
-            return distance_between(start, point)
-        try:
-            vec_a = point - start
-            vec_b = end - start
-        except TypeError:
-            start = pygame.math.Vector2(start)
-            vec_a = pygame.math.Vector2(point) - start
-            vec_b = pygame.math.Vector2(end) - start
-        projection = vec_a.dot(vec_b) / (segment_length ** 2)
-        t = max(0, min(1, projection))
-        projection_point = start + t * vec_b
-        return distance_between(point, vec2tuple(projection_point))
+        return self.airfield_map.draw(screen, self.offset, camera)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+"""Generation of airfield layouts in the background."""
+
+import logging
+import queue
+import threading
+import time
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AirfieldFactory():
+    """Generates airfield layouts in a background thread, so that resetting
+    the airfield only has to copy a finished layout. The maps of used
+    layouts are handed back with recycle and drawn on again.
+
+    Arguments:
+        airfield {Airfield} -- Airfield whose settings the layouts use.
+
+    Keyword Arguments:
+        size {int} -- Number of layouts kept ready. (default: {2})
+    """
+
+    # Seconds to wait before trying again after a layout could not be
+    # generated
+    RETRY_DELAY = 0.1
+
+    def __init__(self, airfield, size=2):
+        self.airfield = airfield
+        self._layouts = queue.Queue(maxsize=size)
+        self._spare_maps = queue.Queue()
+        self._running = True
+        self._thread = threading.Thread(target=self._run,
+                                        name="airfield factory", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """Generate layouts until stopped. Layouts that fail are logged and
+        generated again."""
+
+        while self._running:
+            try:
+                surface = self._spare_maps.get_nowait()
+            except queue.Empty:
+                surface = None
+            try:
+                layout = self.airfield.generate_layout(surface)
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception("Could not generate an airfield")
+                if surface is not None:
+                    self._spare_maps.put(surface)
+                time.sleep(self.RETRY_DELAY)
+                continue
+            while self._running:
+                try:
+                    self._layouts.put(layout, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+    def get_layout(self):
+        """Return the next layout, waiting for it if none is ready.
+
+        Returns:
+            AirfieldLayout -- The layout.
+        """
+
+        return self._layouts.get()
+
+    def recycle(self, surface):
+        """Give the map of a used layout back for drawing the next ones.
+
+        Arguments:
+            surface {Surface} -- Map that is no longer needed.
+        """
+
+        self._spare_maps.put(surface)
+
+    def stop(self):
+        """Stop generating layouts."""
+
+        self._running = False
+        self._thread.join()
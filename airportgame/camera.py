@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of the Camera class."""
+
+import numpy as np
+import pygame
+
+
+class Camera():
+    """Maps world coordinates to screen coordinates. The camera shows the
+    area of the world starting from its position, scaled by its zoom.
+
+    Arguments:
+        width {int} -- Width of the screen.
+        height {int} -- Height of the screen.
+
+    Keyword Arguments:
+        x {float} -- World x coordinate of the top-left corner of the view.
+            (default: {0.0})
+        y {float} -- World y coordinate of the top-left corner of the view.
+            (default: {0.0})
+        zoom {float} -- Screen pixels per world unit. (default: {1.0})
+    """
+    MIN_ZOOM = 0.1
+    MAX_ZOOM = 10.0
+
+    def __init__(self, width, height, x=0.0, y=0.0, zoom=1.0):
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+        self.zoom = zoom
+        self._initial_view = (x, y, zoom)
+
+    def get_key(self):
+        """Return a key that changes whenever the view changes.
+
+        Returns:
+            tuple -- Position and zoom of the camera.
+        """
+
+        return (self.x, self.y, self.zoom)
+
+    def pan(self, dx, dy):
+        """Move the view by the given amount of screen pixels.
+
+        Arguments:
+            dx {float} -- Movement along the x axis.
+            dy {float} -- Movement along the y axis.
+        """
+
+        self.x += dx / self.zoom
+        self.y += dy / self.zoom
+
+    def zoom_at(self, factor, screen_point):
+        """Zoom the view, keeping the given point in the same place.
+
+        Arguments:
+            factor {float} -- Zoom factor, larger than 1 to zoom in.
+            screen_point {tuple} -- Screen coordinates of the fixed point.
+        """
+
+        world_x, world_y = self.screen_to_world(screen_point)
+        self.zoom = max(self.MIN_ZOOM, min(self.zoom * factor, self.MAX_ZOOM))
+        self.x = world_x - screen_point[0] / self.zoom
+        self.y = world_y - screen_point[1] / self.zoom
+
+    def reset(self):
+        """Return to the view the camera was created with."""
+
+        self.x, self.y, self.zoom = self._initial_view
+
+    def world_to_screen(self, point):
+        """Convert world coordinates to screen coordinates.
+
+        Arguments:
+            point {tuple} -- World coordinates.
+
+        Returns:
+            tuple -- Integer screen coordinates.
+        """
+
+        return (int((point[0] - self.x) * self.zoom),
+                int((point[1] - self.y) * self.zoom))
+
+    def world_to_screen_points(self, points):
+        """Convert an array of world coordinates to screen coordinates.
+
+        Arguments:
+            points {ndarray} -- Array of shape (n, 2).
+
+        Returns:
+            ndarray -- Integer screen coordinates.
+        """
+
+        screen_points = (np.asarray(points, dtype=float)
+                         - (self.x, self.y)) * self.zoom
+        return screen_points.astype(int)
+
+    def screen_to_world(self, point):
+        """Convert screen coordinates to world coordinates.
+
+        Arguments:
+            point {tuple} -- Screen coordinates.
+
+        Returns:
+            tuple -- World coordinates.
+        """
+
+        return (point[0] / self.zoom + self.x, point[1] / self.zoom + self.y)
+
+    def get_view_rect(self):
+        """Return the area of the world that is visible.
+
+        Returns:
+            Rect -- Visible area in world coordinates.
+        """
+
+        return pygame.Rect(int(self.x), int(self.y),
+                           int(self.width / self.zoom) + 2,
+                           int(self.height / self.zoom) + 2)
+
+    def is_visible(self, rect, margin=0):
+        """Returns True if any part of the rectangle is visible.
+
+        Arguments:
+            rect {Rect} -- Rectangle in world coordinates.
+
+        Keyword Arguments:
+            margin {int} -- Extra screen pixels around the view that count as
+                visible. (default: {0})
+
+        Returns:
+            bool -- Whether the rectangle is visible.
+        """
+
+        view = self.get_view_rect()
+        if margin:
+            world_margin = int(margin / self.zoom) + 1
+            view.inflate_ip(2 * world_margin, 2 * world_margin)
+        return view.colliderect(rect)
+
+    def cull_points(self, xs, ys, margin=0):
+        """Return a mask of the points that are visible.
+
+        Arguments:
+            xs {ndarray} -- World x coordinates.
+            ys {ndarray} -- World y coordinates.
+
+        Keyword Arguments:
+            margin {int} -- Extra screen pixels around the view that count as
+                visible. (default: {0})
+
+        Returns:
+            ndarray -- Boolean array.
+        """
+
+        world_margin = margin / self.zoom
+        right = self.x + self.width / self.zoom
+        bottom = self.y + self.height / self.zoom
+        xs = np.asarray(xs)
+        ys = np.asarray(ys)
+        return ((xs >= self.x - world_margin) & (xs <= right + world_margin) &
+                (ys >= self.y - world_margin) & (ys <= bottom + world_margin))
+
+    def draw_surface(self, screen, surface, world_pos):
+        """Draw a surface placed in the world, scaled by the zoom.
+
+        Arguments:
+            screen {Surface} -- Surface to draw on.
+            surface {Surface} -- Surface to draw.
+            world_pos {tuple} -- World coordinates of the top-left corner.
+
+        Returns:
+            Rect -- Bounding rectangle of the drawn surface.
+        """
+
+        dest = self.world_to_screen(world_pos)
+        if self.zoom != 1.0:
+            width, height = surface.get_size()
+            surface = pygame.transform.scale(
+                surface, (max(1, int(width * self.zoom)),
+                          max(1, int(height * self.zoom))))
+        return screen.blit(surface, dest)
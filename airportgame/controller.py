@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+"""Automatic traffic controllers that land flights without the player."""
+
+import abc
+from collections import namedtuple
+
+from airportgame.flight import Flight
+from airportgame.runwayselector import RunwaySelector
+
+
+# State given to a controller after each update of the game. flights are
+# FlightSnapshots in the order of Game.incoming_flights. The airfield must
+# not be changed by the controller.
+ControllerState = namedtuple("ControllerState", ["flights", "airfield"])
+
+# Order to land the flight at index flight of ControllerState.flights on the
+# runway at index runway of the runway list of the airfield.
+LandingCommand = namedtuple("LandingCommand", ["flight", "runway"])
+
+
+class Controller(abc.ABC):
+    """Base class of the controllers. Game calls update after every update
+    of the game logic and carries out the returned commands.
+    """
+
+    @abc.abstractmethod
+    def update(self, state, elapsed_time):
+        """Decide what to do.
+
+        Arguments:
+            state {ControllerState} -- Current state of the game.
+            elapsed_time {float} -- Time elapsed since last call.
+
+        Returns:
+            list[LandingCommand] -- Commands to carry out.
+        """
+
+
+class GreedyController(Controller):
+    """Lands holding flights at a steady rate. The flights that have waited
+    the longest are landed first, each on the runway with the lowest cost
+    according to a RunwaySelector.
+
+    Keyword Arguments:
+        rate {float} -- Landing commands per second. (default: {0.5})
+    """
+
+    def __init__(self, rate=0.5):
+        self.rate = rate
+        # Commands that may be issued, grows with time
+        self._budget = 0.0
+
+    def update(self, state, elapsed_time):
+        """Decide which flights to land.
+
+        Arguments:
+            state {ControllerState} -- Current state of the game.
+            elapsed_time {float} -- Time elapsed since last call.
+
+        Returns:
+            list[LandingCommand] -- Commands to carry out.
+        """
+
+        self._budget += self.rate * elapsed_time / 1000.0
+        if self._budget < 1:
+            return []
+        holding = [index for index, flight in enumerate(state.flights)
+                   if flight.status == Flight.STATUS_NORMAL]
+        if not holding:
+            # Commands are not saved up while there is nothing to land
+            self._budget = 1.0
+            return []
+        count = min(int(self._budget), len(holding))
+        self._budget -= count
+
+        holding = holding[:count]
+        selector = RunwaySelector(state.airfield)
+        order, costs = selector.rank([state.flights[index]
+                                      for index in holding])
+        return [LandingCommand(index, int(order[i, 0]))
+                for i, index in enumerate(holding)
+                if costs.shape[1] > 0 and costs[i, 0] < float("inf")]
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of the EventRouter class."""
+
+import pygame
+
+
+def _get_event_types(names):
+    """Return the event types of this pygame version among names.
+
+    Arguments:
+        names {list[str]} -- Names of event types.
+
+    Returns:
+        tuple -- The event types that exist.
+    """
+
+    return tuple(getattr(pygame, name) for name in names
+                 if hasattr(pygame, name))
+
+
+# Events about the window. They are never blocked, because the display is
+# only updated in parts and has to be drawn again when the window has been
+# covered, minimized or resized.
+WINDOW_EVENTS = _get_event_types([
+    "ACTIVEEVENT", "VIDEOEXPOSE", "VIDEORESIZE", "WINDOWEVENT",
+    "WINDOWSHOWN", "WINDOWHIDDEN", "WINDOWEXPOSED", "WINDOWMINIMIZED",
+    "WINDOWMAXIMIZED", "WINDOWRESTORED", "WINDOWRESIZED",
+    "WINDOWSIZECHANGED"])
+
+# Events after which the contents of the window may have been lost. Older
+# pygame versions report restoring a minimized window as ACTIVEEVENT.
+if hasattr(pygame, "WINDOWRESTORED"):
+    EXPOSE_EVENTS = _get_event_types([
+        "VIDEOEXPOSE", "WINDOWEXPOSED", "WINDOWSHOWN", "WINDOWRESTORED",
+        "WINDOWSIZECHANGED"])
+else:
+    EXPOSE_EVENTS = _get_event_types(["VIDEOEXPOSE", "ACTIVEEVENT"])
+
+
+class EventRouter():
+    """Calls the handlers registered for each event. Handlers are looked up
+    by the type of the event and its key, so an event only costs one
+    dictionary lookup however many handlers there are for other events.
+    """
+
+    def __init__(self):
+        self._handlers = {}
+
+    def register(self, event_type, handler, key=None):
+        """Register a handler. Handlers of the same event are called in the
+        order they were registered.
+
+        Arguments:
+            event_type {int} -- Type of the event, e.g. pygame.KEYDOWN.
+            handler {callable} -- Function called with the event.
+
+        Keyword Arguments:
+            key {int} -- Key of KEYDOWN and KEYUP events, or None for events
+                without a key. (default: {None})
+        """
+
+        index = (event_type, key)
+        self._handlers[index] = self._handlers.get(index, ()) + (handler,)
+
+    def unregister(self, event_type, handler, key=None):
+        """Remove a registered handler.
+
+        Arguments:
+            event_type {int} -- Type of the event.
+            handler {callable} -- The handler.
+
+        Keyword Arguments:
+            key {int} -- Key the handler was registered with.
+                (default: {None})
+        """
+
+        index = (event_type, key)
+        handlers = tuple(registered for registered
+                         in self._handlers.get(index, ())
+                         if registered != handler)
+        if handlers:
+            self._handlers[index] = handlers
+        else:
+            self._handlers.pop(index, None)
+
+    def get_event_types(self):
+        """Return the event types that have handlers.
+
+        Returns:
+            list[int] -- Sorted event types.
+        """
+
+        return sorted({event_type for event_type, _ in self._handlers})
+
+    def set_allowed(self):
+        """Block the event types without handlers, so that they are never
+        put in the event queue. WINDOW_EVENTS are always allowed. Needs an
+        initialized display.
+        """
+
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(
+            sorted(set(self.get_event_types()) | set(WINDOW_EVENTS)))
+
+    def dispatch(self, events):
+        """Call the handlers of events.
+
+        Arguments:
+            events {list} -- Events to handle.
+        """
+
+        handlers = self._handlers
+        for event in events:
+            for handler in handlers.get(
+                    (event.type, getattr(event, "key", None)), ()):
+                handler(event)
@@ -9,8 +9,13 @@ import pygame.draw as pgdraw
 import pygame.math as pgmath
 
 import airportgame.colors as colors
-from airportgame.path import CatmullRomPathMemory
-from airportgame.utilities import vec2int
+from airportgame.metrics import METRICS
+from airportgame.path import CatmullRomPathMemory, PathCursor
+
+
+LOGGER = logging.getLogger(__name__)
+LANDING_PATHS = METRICS.counter("flights.landing_paths")
+LANDED_FLIGHTS = METRICS.counter("flights.landed")
 
 
 class Flight():
@@ -28,6 +33,13 @@ class Flight():
     STATUS_LANDING = 1
     STATUS_LANDED = 2
 
+    # Color of the icon for each status
+    ICON_COLORS = {
+        STATUS_NORMAL: colors.BLACK,
+        STATUS_LANDING: colors.BLACK,
+        STATUS_LANDED: colors.BLACK
+    }
+
     def __init__(self, name, plane, x=0, y=0):
         """
         plane must be a Plane object
@@ -40,30 +52,36 @@ class Flight():
         self.direction = random.random() * 360
         self.path = None
         self.path_pos = None
+        self.cursor = None
         self._status = Flight.STATUS_NORMAL
-        self.logger = logging.getLogger(__name__)
 
-    def draw(self, screen, draw_subpath=True):
-        """Draw the flight (and optinally its path).
+    def draw_subpath(self, screen, camera=None):
+        """Draw the rest of the landing path of the flight.
 
         Arguments:
             screen {Surface} -- Surface to draw on.
 
         Keyword Arguments:
-            draw_subpath {bool} -- Whether to draw the path of the flight.
-                (default: {True})
+            camera {Camera} -- Camera to view the flight through, or None to
+                draw in world coordinates. (default: {None})
+
+        Returns:
+            Rect -- Bounding rectangle of the path, or None if the flight is
+                not landing.
         """
 
-        pgdraw.circle(screen, (0, 0, 0), vec2int(self.get_pos()),
-                      self.ICON_SIZE, 0)
-        dir_vect = pgmath.Vector2(0, 1).rotate(-self.direction) * Flight.ICON_SIZE * 2
-        vect_point = dir_vect + self.get_pos()
-        new_x = int(vect_point[0])
-        new_y = int(vect_point[1])
-        pgdraw.line(screen, (0, 0, 0,), (self.x, self.y), (new_x, new_y))
+        if self.path is not None and self.is_landing():
+            return self.path.draw_subpath(screen, self.path_pos, camera)
+        return None
+
+    def get_color(self):
+        """Return the color of the icon of the flight.
 
-        if (self.path is not None and self.is_landing()) and draw_subpath:
-            self.path.draw_subpath(screen, self.path_pos)
+        Returns:
+            tuple -- Color.
+        """
+
+        return self.ICON_COLORS[self._status]
 
     def update(self, elapsed_time):
         """Update the flight.
@@ -74,15 +92,16 @@ class Flight():
 
         if self.path is not None:
             distance_travelled = elapsed_time * self.SPEED
-            self.path_pos += distance_travelled
-            new_pos = self.path.get_point_along_path(self.path_pos)
+            new_pos = self.cursor.advance(distance_travelled)
+            self.path_pos = self.cursor.get_distance()
             old_pos = self.get_pos()
             self.update_pos(new_pos)
             self.rotate_to_vector(new_pos-old_pos)
             if self._status == Flight.STATUS_LANDING:
-                if self.path.is_over(self.path_pos):
+                if self.cursor.is_over():
                     self._status = Flight.STATUS_LANDED
-                    self.logger.debug("FLIGHT HAS LANDED")
+                    LANDED_FLIGHTS.inc()
+                    LOGGER.debug("FLIGHT HAS LANDED")
 
     def rotate_to_vector(self, vec):
         """Rotates the flight so it points in the same direction as vec.
@@ -104,27 +123,46 @@ class Flight():
         self.x = vector_pos[0]
         self.y = vector_pos[1]
 
-    def draw_selection_box(self, screen):
+    def draw_selection_box(self, screen, camera=None):
         """Draws a selection box around the flight.
 
         Arguments:
             screen {Surface} -- Surface to draw on.
+
+        Keyword Arguments:
+            camera {Camera} -- Camera to view the flight through, or None to
+                draw in world coordinates. (default: {None})
+
+        Returns:
+            Rect -- Bounding rectangle of the selection box.
         """
 
-        pgdraw.rect(screen, colors.BLUE,
-                    [self.x - Flight.ICON_SIZE, self.y - Flight.ICON_SIZE,
-                     Flight.ICON_SIZE * 2, Flight.ICON_SIZE * 2],
-                    Flight.SELECTION_BOX_WIDTH)
+        x, y = self.x, self.y
+        if camera is not None:
+            x, y = camera.world_to_screen((x, y))
+        return pgdraw.rect(screen, colors.BLUE,
+                           [x - Flight.ICON_SIZE,
+                            y - Flight.ICON_SIZE,
+                            Flight.ICON_SIZE * 2, Flight.ICON_SIZE * 2],
+                           Flight.SELECTION_BOX_WIDTH)
 
-    def draw_path(self, screen):
+    def draw_path(self, screen, camera=None):
         """Draw the path of the flight.
 
         Arguments:
             screen {Surface} -- Surface to draw on.
+
+        Keyword Arguments:
+            camera {Camera} -- Camera to view the flight through, or None to
+                draw in world coordinates. (default: {None})
+
+        Returns:
+            Rect -- Bounding rectangle of the path, or None.
         """
 
         if self.path is not None:
-            self.path.draw(screen)
+            return self.path.draw(screen, camera)
+        return None
 
     def get_pos(self):
         """Return the position as a vector.
@@ -163,7 +201,9 @@ class Flight():
         # self.path = CatmullRomPath(points)
         self.path = CatmullRomPathMemory(points)
         self.path_pos = 0.0
+        self.cursor = PathCursor(self.path)
         self._status = Flight.STATUS_LANDING
+        LANDING_PATHS.inc()
 
     def is_landing(self):
         """Return true if the flight is landing.
@@ -174,10 +214,19 @@ class Flight():
 
         return self._status == Flight.STATUS_LANDING
 
-    def set_path(self, path):
-        """Set path that is not a landing path."""
+    def set_path(self, path, path_pos=0.0):
+        """Set path that is not a landing path.
+
+        Arguments:
+            path {PathEnsemble} -- Path to follow.
+
+        Keyword Arguments:
+            path_pos {float} -- Starting distance along the path.
+                (default: {0.0})
+        """
         self.path = path
-        self.path_pos = 0.0
+        self.path_pos = path_pos
+        self.cursor = PathCursor(path, path_pos)
 
     def get_status(self):
         """Return the status of the flight.
@@ -3,19 +3,39 @@
 
 
 import random
+import threading
+import time
 
 import logging
 
+import numpy as np
 import pygame
 
 from airportgame.colors import RED, GREEN
+from airportgame.controller import ControllerState
 from airportgame.textinput import TextInput
-from airportgame.pgtext import PgText
+from airportgame.pgtext import FONTS, PgText
 from airportgame.player import Player
-from airportgame.airfield import Airfield
+from airportgame.airfield import Airfield, LargeAirfield
+from airportgame.camera import Camera
+from airportgame.events import EXPOSE_EVENTS, EventRouter
+from airportgame.profiler import FrameProfiler
 from airportgame.flight import Flight
+from airportgame.holding import HoldingManager
+from airportgame.layouts import LayoutLibrary
+from airportgame.metrics import METRICS, MetricsWriter
 from airportgame.path import EllipticalPathEnsemble
 from airportgame.menu import Menu
+from airportgame.renderer import Renderer
+from airportgame.sprites import FlightSpriteAtlas
+from airportgame.snapshot import FlightSnapshot, GameSnapshot, SnapshotBuffer
+from airportgame.tasks import BackgroundTask
+
+
+LOGGER = logging.getLogger(__name__)
+SPAWNED_FLIGHTS = METRICS.counter("flights.spawned")
+INCOMING_FLIGHTS = METRICS.gauge("flights.incoming")
+HOLDING_FLIGHTS = METRICS.gauge("flights.holding")
 
 
 class Game():
@@ -24,12 +44,74 @@ class Game():
     """
     WINDOW_WIDTH = 800
     WINDOW_HEIGHT = 600
+    # Size of the area where flights circle, in world coordinates
+    WORLD_WIDTH = WINDOW_WIDTH
+    WORLD_HEIGHT = WINDOW_HEIGHT
     BORDER_MARGIN = 60
-
-    def __init__(self, skip_name_input=False):
+    # Space between a large airfield and the edges of the world
+    WORLD_MARGIN = 200
+    # Camera movement per key press, in screen pixels
+    PAN_STEP = 50
+    ZOOM_STEP = 1.25
+    # Keys handled by move_camera
+    CAMERA_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN,
+                   pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS,
+                   pygame.K_MINUS, pygame.K_KP_MINUS, pygame.K_HOME)
+    # The FPS counter is rounded to this precision
+    FPS_STEP = 0.5
+    # Fonts resolved in the background during startup
+    PRELOADED_FONTS = [("Consolas", 25), ("Consolas", 14)]
+    # Airfields generated in the background for resetting the airfield
+    PREFETCHED_AIRFIELDS = 2
+    # Directory of the saved airfield layouts
+    LAYOUT_DIRECTORY = "layouts"
+
+    def __init__(self, skip_name_input=False, threaded=False,
+                 profile_output=None, start=True, start_time=None,
+                 airfield_layout=None, airfield_size=None, controller=None,
+                 metrics_output=None):
         """
         Constructor
+
+        If threaded is True, the game logic is updated in a separate thread
+        and the main thread only handles events and draws the latest
+        snapshot of the game.
+
+        If profile_output is given, the frame times of the latest frames are
+        written to that CSV or JSON file when the game quits.
+
+        If start is False, the game loop is not started and the game can be
+        driven by calling update directly, for example in benchmarks.
+
+        start_time is the time.perf_counter() value the time to the first
+        frame is measured from. Defaults to the time the Game is created.
+
+        airfield_layout is the name of a layout in LAYOUT_DIRECTORY to start
+        with instead of a random airfield. F5 saves the current airfield
+        there. The world is sized for the field of the layout, and a
+        different airfield_size raises a ValueError.
+
+        airfield_size is the width and height of a LargeAirfield to play on,
+        or None for the default airfield. The world grows with the airfield
+        and the camera starts zoomed out to show all of it.
+
+        controller is a Controller that lands flights after every update of
+        the game logic, e.g. a GreedyController for soak tests, or None to
+        leave it to the player.
+
+        If metrics_output is given, METRICS is enabled and its values are
+        appended to that JSON lines file every second while the game runs.
         """
+        if start_time is None:
+            start_time = time.perf_counter()
+        self.start_time = start_time
+        # Milliseconds from start_time to the first frame on the display
+        self.time_to_first_frame = None
+
+        # Searching the system fonts can take a while, so it is done while
+        # the window is being opened
+        BackgroundTask(FONTS.preload, self.PRELOADED_FONTS)
+
         # Set up the font used by the game
         self.pgtext = PgText("Consolas", 25)
         self.clock = pygame.time.Clock()
@@ -37,84 +119,290 @@ class Game():
         self.textinput = TextInput(self.pgtext, color=RED)
 
         self.airfield = None
+        self.layouts = LayoutLibrary(self.LAYOUT_DIRECTORY)
+        self.airfield_layout = airfield_layout
+        if airfield_layout is not None:
+            size = self.layouts.get_size(airfield_layout)
+            if airfield_size is not None and tuple(airfield_size) != size:
+                raise ValueError(
+                    "Layout {0} has a field of {1}x{2}, not {3}x{4}".format(
+                        airfield_layout, size[0], size[1], *airfield_size))
+            if size != (Airfield.FIELD_WIDTH, Airfield.FIELD_HEIGHT):
+                airfield_size = size
+        self.airfield_size = airfield_size
+        if airfield_size is not None:
+            self.WORLD_WIDTH = airfield_size[0] + 2 * self.WORLD_MARGIN
+            self.WORLD_HEIGHT = airfield_size[1] + 2 * self.WORLD_MARGIN
 
         self.max_fps = 60
 
         self.time_since_last_flight_created = 0
         self.incoming_flights = []
         self.paths = []
+        self.holding = None
 
         self.selected_flight = None
         self.selected_runway = None
 
         self.skip_name_input = skip_name_input
+        self.controller = controller
 
         self._draw_subpaths = True
 
-        self.logger = logging.getLogger(__name__)
+        self.threaded = threaded
+        # Protects the game state from the simulation thread
+        self.state_lock = threading.RLock()
+        self.snapshots = SnapshotBuffer()
+        self._tick = 0
+        self._simulation_thread = None
+        self._simulation_running = False
+
+        self.profiler = FrameProfiler()
+        self.profile_output = profile_output
+        self.metrics_writer = None
+        if metrics_output is not None:
+            self.start_metrics(metrics_output)
+        self.show_profiler = False
+        self._profiler_lines = []
+        self.profiler_text = PgText("Consolas", 14)
 
         # Screen surface that has the size of 800 x 600
         self.screen = pygame.display.set_mode((self.WINDOW_WIDTH,
                                                self.WINDOW_HEIGHT))
+        self.renderer = Renderer(self.screen)
+        zoom = min(1.0, self.WINDOW_WIDTH / self.WORLD_WIDTH,
+                   self.WINDOW_HEIGHT / self.WORLD_HEIGHT)
+        self.camera = Camera(self.WINDOW_WIDTH, self.WINDOW_HEIGHT,
+                             zoom=max(zoom, Camera.MIN_ZOOM))
+        self.flight_sprites = FlightSpriteAtlas()
+        # The airfield and the holding paths are created while the menu is
+        # shown
+        self._world_task = BackgroundTask(self.create_world)
 
         self.show_main_menu = True
         self.menu = Menu(self.pgtext, self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
+        self.events = EventRouter()
+        self._running = True
+        self.register_event_handlers()
+        self.publish_snapshot()
 
         # Start game loop
-        self.game_loop()
+        if start:
+            self.game_loop()
 
     def game_loop(self):
         """
         Main game loop
         """
         running = True
+        if self.threaded:
+            self.start_simulation()
+        profiler = self.profiler
         while running:
+            profiler.begin_frame()
             # How much time has passed since the last call (milliseconds)
             # Limit FPS to max_fps
             elapsed_time = self.clock.tick(self.max_fps)
+            profiler.mark("tick")
 
             # Event handling
             events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT:
-                    running = False
-                if (event.type == pygame.KEYDOWN and
-                        event.key == pygame.K_ESCAPE):
-                    running = False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_r:
-                        if self.airfield is not None:
-                            self.airfield.reset_airfield()
-                    elif event.key == pygame.K_s:
-                        self._draw_subpaths = not self._draw_subpaths
-                if self.player is not None:
-                    # Only do this if game is properly initialized
-                    if event.type == pygame.MOUSEBUTTONUP:
-                        # Select flight
-                        mouse_x, mouse_y = pygame.mouse.get_pos()
-                        flight_under_mouse = self.find_closest_flight_in_range(mouse_x, mouse_y)
-                        runway_under_mouse = self.find_closest_runway_in_range(mouse_x, mouse_y)
-                        if self.selected_flight is None:
-                            self.selected_flight = flight_under_mouse
-                        else:
-                            if runway_under_mouse is not None:
-                                self.selected_runway = runway_under_mouse
-                                self.logger.debug("Runway %d selected", self.selected_runway.number)
-                                self.selected_flight.generate_landing_path(self.selected_runway)
-                            else:
-                                self.selected_runway = None
-                                self.selected_flight = flight_under_mouse
-                                self.logger.debug("Runway deselected")
-            # Update text input
-            if self.textinput.is_active:
-                self.textinput.update(elapsed_time, events)
-            if self.show_main_menu:
-                self.menu.update(elapsed_time, events)
-
-            self.update(elapsed_time)
+            profiler.mark("events")
+            with self.state_lock:
+                running = self.handle_events(elapsed_time, events)
+                profiler.mark("input")
+                if not self.threaded:
+                    self.update(elapsed_time)
+                    profiler.mark("update")
+                    self.publish_snapshot()
+                    profiler.mark("snapshot")
             self.draw(self.screen)
+            profiler.end_frame()
+            if self.time_to_first_frame is None:
+                self.time_to_first_frame = (
+                    (time.perf_counter() - self.start_time) * 1000.0)
+                LOGGER.info("First frame after %.1f ms",
+                            self.time_to_first_frame)
+        self.close()
+        if self.profile_output is not None:
+            self.profiler.dump(self.profile_output)
         return
 
+    def close(self):
+        """Stop the background threads of the game. Called when the game
+        loop ends, and must be called for games created with start=False.
+        """
+
+        self.stop_simulation()
+        self.stop_airfield_factory()
+        self.stop_metrics()
+
+    def start_metrics(self, filename):
+        """Enable METRICS and append its values to a file every second.
+
+        Arguments:
+            filename {str} -- JSON lines file to append to.
+        """
+
+        self.stop_metrics()
+        METRICS.enable()
+        self.metrics_writer = MetricsWriter(METRICS, filename)
+
+    def stop_metrics(self):
+        """Write the final values of METRICS and disable it."""
+
+        if self.metrics_writer is None:
+            return
+        self.metrics_writer.stop()
+        self.metrics_writer = None
+        METRICS.disable()
+
+    def register_event_handlers(self):
+        """Register the handlers of the game, the text input and the menu,
+        and block the events that none of them handle.
+        """
+
+        router = self.events
+        router.register(pygame.QUIT, self._on_quit)
+        router.register(pygame.KEYDOWN, self._on_quit, pygame.K_ESCAPE)
+        router.register(pygame.KEYDOWN, self._on_reset_airfield, pygame.K_r)
+        router.register(pygame.KEYDOWN, self._on_toggle_subpaths, pygame.K_s)
+        router.register(pygame.KEYDOWN, self._on_toggle_profiler,
+                        pygame.K_F3)
+        router.register(pygame.KEYDOWN, self._on_save_layout, pygame.K_F5)
+        for key in self.CAMERA_KEYS:
+            router.register(pygame.KEYDOWN, self._on_camera_key, key)
+        router.register(pygame.MOUSEBUTTONUP, self._on_click)
+        for event_type in EXPOSE_EVENTS:
+            router.register(event_type, self._on_window_exposed)
+        self.textinput.register_events(router)
+        self.menu.register_events(router)
+        router.set_allowed()
+
+    def handle_events(self, elapsed_time, events):
+        """Handle input events.
+
+        Arguments:
+            elapsed_time {float} -- Time elapsed since last call.
+            events {list} -- List of events to handle.
+
+        Returns:
+            bool -- False if the game should quit.
+        """
+
+        self._running = True
+        self.events.dispatch(events)
+        # Update text input
+        if self.textinput.is_active():
+            self.textinput.update(elapsed_time)
+        return self._running
+
+    def _on_quit(self, event):
+        self._running = False
+
+    def _on_window_exposed(self, event):
+        # Only the changed parts are updated on the display, so everything
+        # is drawn again after the window contents have been lost
+        self.renderer.invalidate()
+
+    def _on_reset_airfield(self, event):
+        if self.airfield is not None:
+            self.airfield.reset_airfield()
+
+    def _on_toggle_subpaths(self, event):
+        self._draw_subpaths = not self._draw_subpaths
+
+    def _on_toggle_profiler(self, event):
+        self.show_profiler = not self.show_profiler
+
+    def _on_save_layout(self, event):
+        self.save_airfield_layout()
+
+    def _on_camera_key(self, event):
+        self.move_camera(event.key)
+
+    def _on_click(self, event):
+        if self.player is None:
+            # Only do this if game is properly initialized
+            return
+        # Select flight
+        mouse_x, mouse_y = self.camera.screen_to_world(
+            pygame.mouse.get_pos())
+        flight_under_mouse = self.find_closest_flight_in_range(mouse_x, mouse_y)
+        runway_under_mouse = self.find_closest_runway_in_range(mouse_x, mouse_y)
+        if self.selected_flight is None:
+            self.selected_flight = flight_under_mouse
+        else:
+            if runway_under_mouse is not None:
+                self.selected_runway = runway_under_mouse
+                LOGGER.debug("Runway %d selected", self.selected_runway.number)
+                self.land_flight(self.selected_flight, self.selected_runway)
+            else:
+                self.selected_runway = None
+                self.selected_flight = flight_under_mouse
+                LOGGER.debug("Runway deselected")
+
+    def start_simulation(self):
+        """Start updating the game logic in a separate thread."""
+
+        self._simulation_running = True
+        self._simulation_thread = threading.Thread(
+            target=self.simulation_loop, name="simulation", daemon=True)
+        self._simulation_thread.start()
+
+    def stop_simulation(self):
+        """Stop the simulation thread if it is running."""
+
+        self._simulation_running = False
+        if self._simulation_thread is not None:
+            self._simulation_thread.join()
+            self._simulation_thread = None
+
+    def stop_airfield_factory(self):
+        """Stop generating airfield layouts in the background. Resetting the
+        airfield generates the layouts directly after this.
+        """
+
+        airfield = self.airfield
+        if airfield is None:
+            # The world may have been created while the menu was shown
+            airfield = self._world_task.result()[0]
+        if airfield.factory is not None:
+            airfield.factory.stop()
+            airfield.factory = None
+
+    def simulation_loop(self):
+        """Update the game logic and publish snapshots until stopped."""
+
+        clock = pygame.time.Clock()
+        while self._simulation_running:
+            elapsed_time = clock.tick(self.max_fps)
+            with self.state_lock:
+                self.update(elapsed_time)
+                self.publish_snapshot()
+
+    def publish_snapshot(self):
+        """Publish a snapshot of the current state for drawing."""
+
+        self._tick += 1
+        selected_flight = None
+        if self.selected_flight is not None:
+            selected_flight = FlightSnapshot.from_flight(self.selected_flight)
+        snapshot = GameSnapshot(
+            tick=self._tick,
+            background_key=self.get_background_key(),
+            show_main_menu=self.show_main_menu,
+            player_missing=self.player is None,
+            airfield=self.airfield,
+            paths=tuple(self.paths),
+            flights=tuple(FlightSnapshot.from_flight(flight)
+                          for flight in self.incoming_flights),
+            selected_flight=selected_flight,
+            selected_runway=self.selected_runway,
+            draw_subpaths=self._draw_subpaths
+        )
+        self.snapshots.publish(snapshot)
+
     def update(self, elapsed_time):
         """
         Update game logic.
@@ -137,58 +425,215 @@ class Game():
             else:
                 self.player = Player("Debug Mode On")
         elif self.player and self.airfield is None:
-            self.airfield = Airfield(offset=self.center_airfield())
-            self.create_circling_flight_paths()
+            # Usually ready long before the player has entered a name
+            self.airfield, self.paths, self.holding = self._world_task.result()
         elif self.player and self.airfield:
             # Game is running normally
             self.create_flight(elapsed_time)
             for flight in self.incoming_flights:
 
                 if flight.path is None:
-                    path_num = random.randint(0, len(self.paths) - 1)
-                    flight.set_path(self.paths[path_num])
+                    self.holding.assign(flight)
 
                 flight.update(elapsed_time)
+            self.holding.update(elapsed_time)
 
             self.remove_landed_flights()
+            if self.controller is not None:
+                self.run_controller(elapsed_time)
+            if METRICS.enabled:
+                INCOMING_FLIGHTS.set(len(self.incoming_flights))
+                HOLDING_FLIGHTS.set(sum(len(pattern) for pattern
+                                        in self.holding.patterns))
         return True
 
+    def land_flight(self, flight, runway):
+        """Take a flight off its holding path and land it on a runway.
+
+        Arguments:
+            flight {Flight} -- Flight to land.
+            runway {Runway} -- Runway to land on.
+        """
+
+        self.holding.release(flight)
+        flight.generate_landing_path(runway)
+
+    def run_controller(self, elapsed_time):
+        """Let the controller decide which flights to land and land them.
+
+        Arguments:
+            elapsed_time {float} -- Time elapsed since last call.
+        """
+
+        state = ControllerState(
+            flights=tuple(FlightSnapshot.from_flight(flight)
+                          for flight in self.incoming_flights),
+            airfield=self.airfield)
+        runways = self.airfield.get_runways()
+        for command in self.controller.update(state, elapsed_time):
+            flight = self.incoming_flights[command.flight]
+            if flight.get_status() != Flight.STATUS_NORMAL:
+                continue
+            self.land_flight(flight, runways[command.runway])
+
     def draw(self, screen):
-        """Draw the game.
+        """Draw the latest snapshot of the game. Only the moving parts are
+        drawn every frame, the rest is drawn on the background of the
+        renderer when it changes.
 
         Arguments:
             screen {Surface} -- Surface to draw on.
         """
 
-        screen.fill(GREEN)
-        self.pgtext.display_text("AirPortGame", screen)
-        if self.show_main_menu:
-            self.menu.draw(screen)
-        elif self.player is None:
-            self.pgtext.display_text("Please enter your name: ", screen, 100, 100, RED)
-            self.textinput.draw(screen)
-        elif self.player and self.airfield:
-            self.airfield.draw(screen)
-            for flight in self.incoming_flights:
-                flight.draw(screen, draw_subpath=self._draw_subpaths)
-            if self.selected_flight is not None:
-                self.selected_flight.draw_selection_box(screen)
-            if self.selected_runway is not None:
-                self.selected_runway.draw_selection_circle(screen)
-            if ((self.selected_flight is not None) and
-                    (self.selected_runway is not None)):
-                self.selected_flight.draw_path(screen)
-            for path in self.paths:
-                path.draw(screen)
-        self.show_fps(screen)
-        pygame.display.flip()
+        profiler = self.profiler
+        snapshot = self.snapshots.get_latest()
+        camera = self.camera
+        self.renderer.begin_frame(
+            (snapshot.background_key, camera.get_key()),
+            lambda background: self.draw_background(background, snapshot))
+        profiler.mark("background")
+
+        add = self.renderer.add
+        # The main menu is drawn on the background
+        if not snapshot.show_main_menu:
+            if snapshot.player_missing:
+                add(self.textinput.draw(screen))
+            elif snapshot.airfield is not None:
+                self.draw_world(screen, snapshot)
+        add(self.show_fps(screen))
+        if self.show_profiler:
+            self.renderer.add_all(self.show_frame_profile(screen))
+        profiler.mark("text")
+        self.renderer.present()
+        profiler.mark("present")
+
+    def draw_world(self, screen, snapshot):
+        """Draw the flights and the selection of a snapshot.
+
+        Arguments:
+            screen {Surface} -- Surface to draw on.
+            snapshot {GameSnapshot} -- Snapshot of the game.
+        """
+
+        profiler = self.profiler
+        camera = self.camera
+        add = self.renderer.add
+        selected_flight = snapshot.selected_flight
+        selected_runway = snapshot.selected_runway
+        if snapshot.draw_subpaths:
+            for flight in snapshot.flights:
+                if (flight.is_landing() and
+                        camera.is_visible(flight.path.get_bounding_rect())):
+                    add(flight.draw_subpath(screen, camera))
+        profiler.mark("subpaths")
+        flights = snapshot.flights
+        if flights:
+            visible = camera.cull_points(
+                [flight.x for flight in flights],
+                [flight.y for flight in flights],
+                margin=self.flight_sprites.half_size)
+            flights = [flight for flight, is_visible
+                       in zip(flights, visible) if is_visible]
+        self.renderer.add_all(
+            self.flight_sprites.draw(screen, flights, camera))
+        profiler.mark("flights")
+        if selected_flight is not None:
+            add(selected_flight.draw_selection_box(screen, camera))
+        if selected_runway is not None:
+            add(selected_runway.draw_selection_circle(screen, camera))
+        if ((selected_flight is not None) and
+                (selected_runway is not None)):
+            add(selected_flight.draw_path(screen, camera))
+        profiler.mark("selection")
+
+    def get_background_key(self):
+        """Return a key that changes whenever the background must be drawn
+        again.
+
+        Returns:
+            tuple -- Key of the background.
+        """
+
+        airfield_version = None
+        if self.airfield is not None:
+            airfield_version = self.airfield.get_version()
+        return (self.show_main_menu, self.player is None, self.airfield,
+                airfield_version, tuple(id(path) for path in self.paths))
+
+    def draw_background(self, background, snapshot):
+        """Draw the parts of the game that do not move.
+
+        Arguments:
+            background {Surface} -- Surface to draw on.
+            snapshot {GameSnapshot} -- Snapshot of the game.
+        """
+
+        background.fill(GREEN)
+        self.pgtext.display_text("AirPortGame", background)
+        if snapshot.show_main_menu:
+            self.menu.draw(background)
+        elif snapshot.player_missing:
+            self.pgtext.display_text("Please enter your name: ", background,
+                                     100, 100, RED)
+        elif snapshot.airfield is not None:
+            # The runways and the map of the airfield are changed in place
+            # when it is reset, so they are read under the lock like the
+            # rest of the live game state
+            with self.state_lock:
+                snapshot.airfield.draw(background, self.camera)
+            for path in snapshot.paths:
+                if self.camera.is_visible(path.get_bounding_rect()):
+                    path.draw(background, self.camera)
+
+    def move_camera(self, key):
+        """Pan or zoom the camera if the key is one of the camera keys.
+
+        Arguments:
+            key {int} -- Key that was pressed.
+        """
+
+        center = (self.WINDOW_WIDTH / 2, self.WINDOW_HEIGHT / 2)
+        if key == pygame.K_LEFT:
+            self.camera.pan(-self.PAN_STEP, 0)
+        elif key == pygame.K_RIGHT:
+            self.camera.pan(self.PAN_STEP, 0)
+        elif key == pygame.K_UP:
+            self.camera.pan(0, -self.PAN_STEP)
+        elif key == pygame.K_DOWN:
+            self.camera.pan(0, self.PAN_STEP)
+        elif key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+            self.camera.zoom_at(self.ZOOM_STEP, center)
+        elif key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.camera.zoom_at(1 / self.ZOOM_STEP, center)
+        elif key == pygame.K_HOME:
+            self.camera.reset()
 
     def show_fps(self, screen):
         """
         Displays the current FPS on screen
         """
         fps = self.clock.get_fps()
-        self.pgtext.display_text("FPS: {0:.2f}".format(fps), screen, 600, 10)
+        return self.pgtext.display_value("FPS: {0:.2f}", fps, screen, 600, 10,
+                                         step=self.FPS_STEP)
+
+    def show_frame_profile(self, screen):
+        """Displays the frame time percentiles of each phase on screen.
+
+        Arguments:
+            screen {Surface} -- Surface to draw on.
+
+        Returns:
+            list[Rect] -- Bounding rectangles of the lines.
+        """
+
+        # Calculating the percentiles every frame would be too slow
+        if self.profiler.frame_count % 30 == 0 or not self._profiler_lines:
+            self._profiler_lines = self.profiler.get_report_lines()
+        rects = []
+        for i, line in enumerate(self._profiler_lines):
+            rects.append(self.profiler_text.display_text(
+                line, screen, 560, 40 + i * 15))
+        return rects
 
     def center_airfield(self):
         """Get the offset coordinates for the Airfield so that it is centered.
@@ -197,8 +642,11 @@ class Game():
             tuple -- x and y offset coordinates.
         """
 
-        x = self.WINDOW_WIDTH / 2 - (Airfield.FIELD_WIDTH / 2)
-        y = self.WINDOW_HEIGHT / 2 - (Airfield.FIELD_HEIGHT / 2)
+        width, height = Airfield.FIELD_WIDTH, Airfield.FIELD_HEIGHT
+        if self.airfield_size is not None:
+            width, height = self.airfield_size
+        x = self.WORLD_WIDTH / 2 - (width / 2)
+        y = self.WORLD_HEIGHT / 2 - (height / 2)
         return (x, y)
 
     def create_flight(self, elapsed_time):
@@ -225,10 +673,11 @@ class Game():
             # TODO: Create name for flights
             name = ""
 
-            x = random.randint(0, self.WINDOW_WIDTH - 1)
-            y = random.randint(0, self.WINDOW_HEIGHT - 1)
+            x = random.randint(0, self.WORLD_WIDTH - 1)
+            y = random.randint(0, self.WORLD_HEIGHT - 1)
             new_flight = Flight(name, None, x=x, y=y)
             self.incoming_flights.append(new_flight)
+            SPAWNED_FLIGHTS.inc()
 
     def find_closest_flight_in_range(self, x, y, max_range=10):
         """
@@ -247,44 +696,82 @@ class Game():
     def find_closest_runway_in_range(self, x, y,
                                      max_range=Airfield.MINIMUM_DISTANCE):
         """
-        Returns the closest runway within max_range.
+        Returns the runway drawn at (x, y), or else the runway whose start
+        is closest to (x, y) within max_range.
         """
-        closest_runway = None
-        closest_distance = max_range
         point = pygame.math.Vector2(x, y)
-        for runway in self.airfield.get_runways():
-            distance = point.distance_to(runway.get_start_pos())
-            if distance < closest_distance:
-                closest_distance = distance
-                closest_runway = runway
-        # DEBUG
-        if closest_runway is not None:
-            self.logger.debug("Clicked at: %s, runway #%d at: %s", point,
-                              closest_runway.get_number(),
-                              (closest_runway.get_start_pos()))
+        closest_runway = self.airfield.get_runway_at(point)
+        starts = self.airfield.get_runway_geometry().starts
+        if closest_runway is None and len(starts):
+            distances = np.hypot(starts[:, 0] - x, starts[:, 1] - y)
+            closest = int(np.argmin(distances))
+            if distances[closest] < max_range:
+                closest_runway = self.airfield.get_runways()[closest]
+        # The arguments are only worth building if the message is logged
+        if closest_runway is not None and LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Clicked at: %s, runway #%d at: %s", point,
+                         closest_runway.get_number(), closest_runway.start_pos)
         return closest_runway
 
-    def create_circling_flight_paths(self, n=3):
+    def create_world(self):
+        """Create the airfield and the holding paths around it.
+
+        Returns:
+            tuple -- The Airfield, the list of paths and the HoldingManager
+                of the paths.
+        """
+
+        if self.airfield_layout is None and self.airfield_size is not None:
+            airfield = LargeAirfield(offset=self.center_airfield(),
+                                     prefetch=self.PREFETCHED_AIRFIELDS,
+                                     size=self.airfield_size)
+        elif self.airfield_layout is None:
+            airfield = Airfield(offset=self.center_airfield(),
+                                prefetch=self.PREFETCHED_AIRFIELDS)
+        else:
+            airfield = self.layouts.load(self.airfield_layout,
+                                         offset=self.center_airfield(),
+                                         prefetch=self.PREFETCHED_AIRFIELDS)
+        paths = self.create_circling_flight_paths(airfield)
+        return airfield, paths, HoldingManager(paths)
+
+    def save_airfield_layout(self):
+        """Save the current airfield to the layout library with a name
+        based on the current time."""
+
+        if self.airfield is None:
+            return
+        name = time.strftime("airfield-%Y%m%d-%H%M%S")
+        self.layouts.save(name, self.airfield)
+        LOGGER.info("Airfield saved as layout %s", name)
+
+    def create_circling_flight_paths(self, airfield, n=3):
         """Creates ellipticals paths around the airfield.
 
+        Arguments:
+            airfield {Airfield} -- Airfield to circle around.
+
         Keyword Arguments:
             n {int} -- Number of paths. (default: {3})
+
+        Returns:
+            list[EllipticalPathEnsemble] -- The paths.
         """
 
         left_x1 = Game.BORDER_MARGIN
-        airfield_offset = self.airfield.get_offset()
+        airfield_offset = airfield.get_offset()
         left_x2 = airfield_offset[0] - Game.BORDER_MARGIN
         assert left_x1 < left_x2
-        right_x1 = (airfield_offset[0] + self.airfield.FIELD_WIDTH
+        right_x1 = (airfield_offset[0] + airfield.FIELD_WIDTH
                     + Game.BORDER_MARGIN)
-        right_x2 = Game.WINDOW_WIDTH - Game.BORDER_MARGIN
+        right_x2 = self.WORLD_WIDTH - Game.BORDER_MARGIN
         assert right_x1 < right_x2
         top_y1 = Game.BORDER_MARGIN
         top_y2 = airfield_offset[1] - Game.BORDER_MARGIN
         assert top_y1 < top_y2
-        bottom_y1 = (airfield_offset[1] + self.airfield.FIELD_HEIGHT
+        bottom_y1 = (airfield_offset[1] + airfield.FIELD_HEIGHT
                      + Game.BORDER_MARGIN)
-        bottom_y2 = Game.WINDOW_HEIGHT - Game.BORDER_MARGIN
+        bottom_y2 = self.WORLD_HEIGHT - Game.BORDER_MARGIN
         assert bottom_y1 < bottom_y2
 
         left_dx = (left_x2 - left_x1) / (n - 1)
@@ -297,10 +784,12 @@ class Game():
 
         d_top_left = pygame.math.Vector2(left_dx, top_dy)
         d_bottom_right = pygame.math.Vector2(right_dx, bottom_dy)
+        paths = []
         for i in range(n):
             xy1 = top_left + i * d_top_left
             xy2 = bottom_right - i * d_bottom_right
-            self.paths.append(EllipticalPathEnsemble(xy1, xy2, circular=True))
+            paths.append(EllipticalPathEnsemble(xy1, xy2, circular=True))
+        return paths
 
     def remove_landed_flights(self):
         """Remove all landed flights from lists."""
@@ -308,4 +797,5 @@ class Game():
             if self.incoming_flights[i].get_status() == Flight.STATUS_LANDED:
                 if id(self.incoming_flights[i]) == id(self.selected_flight):
                     self.selected_flight = None
+                self.holding.release(self.incoming_flights[i])
                 del self.incoming_flights[i]
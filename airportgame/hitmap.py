@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of the RunwayHitMap class."""
+
+import numpy as np
+
+from airportgame.runway import Runway
+
+
+class RunwayHitMap():
+    """Index of the runway drawn at each pixel of an airfield, for finding
+    the runway under the mouse with a single lookup. The field is split
+    into square blocks that are filled in when a point inside them is first
+    looked up, from the same sprites the runways are drawn with.
+
+    Arguments:
+        airfield {Airfield} -- Airfield whose runways are looked up.
+
+    Keyword Arguments:
+        block_size {int} -- Width and height of the blocks.
+            (default: {256})
+    """
+
+    # Value of pixels without a runway
+    EMPTY = -1
+
+    def __init__(self, airfield, block_size=256):
+        self.airfield = airfield
+        self.block_size = block_size
+        self._blocks = {}
+
+    def invalidate(self):
+        """Forget the blocks, e.g. after the runways have changed."""
+
+        self._blocks.clear()
+
+    def get_index(self, point):
+        """Return the index of the runway at a point.
+
+        Arguments:
+            point {tuple} -- Point relative to the airfield.
+
+        Returns:
+            int -- Index in the runway list of the airfield, or EMPTY.
+        """
+
+        x = int(point[0])
+        y = int(point[1])
+        if not (0 <= x < self.airfield.FIELD_WIDTH and
+                0 <= y < self.airfield.FIELD_HEIGHT):
+            return self.EMPTY
+        key = (x // self.block_size, y // self.block_size)
+        block = self._blocks.get(key)
+        if block is None:
+            block = self._create_block(*key)
+            self._blocks[key] = block
+        return int(block[y % self.block_size, x % self.block_size])
+
+    def _create_block(self, column, row):
+        """Fill in the runway indices of a block.
+
+        Arguments:
+            column {int} -- Column of the block.
+            row {int} -- Row of the block.
+
+        Returns:
+            ndarray -- Runway indices indexed by [y, x].
+        """
+
+        size = self.block_size
+        left = column * size
+        top = row * size
+        block = np.full((size, size), self.EMPTY, dtype=np.int32)
+
+        airfield = self.airfield
+        offset = airfield.get_offset()
+        boxes = airfield.get_runway_geometry().bounding_boxes
+        # The sprites are rotated whole, so their corners can reach past the
+        # bounding boxes by a few pixels
+        margin = Runway.RUNWAY_WIDTH / 2 + 1
+        near = np.flatnonzero(
+            (boxes[:, 0] - offset[0] - margin < left + size) &
+            (boxes[:, 2] - offset[0] + margin > left) &
+            (boxes[:, 1] - offset[1] - margin < top + size) &
+            (boxes[:, 3] - offset[1] + margin > top))
+
+        # Later runways are drawn on top of the earlier ones
+        for index in near:
+            mask, (x, y) = airfield.runway_list[index].get_hit_mask(offset)
+            x -= left
+            y -= top
+            height, width = mask.shape
+            x_min, y_min = max(x, 0), max(y, 0)
+            x_max, y_max = min(x + width, size), min(y + height, size)
+            if x_min >= x_max or y_min >= y_max:
+                continue
+            area = block[y_min:y_max, x_min:x_max]
+            area[mask[y_min - y:y_max - y, x_min - x:x_max - x]] = index
+        return block
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+"""Assignment of incoming flights to holding patterns."""
+
+import bisect
+import heapq
+import itertools
+
+from airportgame.flight import Flight
+
+
+class HoldingPattern():
+    """Flights circling along one holding path.
+
+    All flights move along the path at the same speed, so the distances
+    between them never change. Positions are therefore stored relative to a
+    clock that advances with the flights, in a sorted list. The gaps between
+    neighbouring flights are kept in a heap, so that finding the largest one
+    takes logarithmic time.
+
+    Arguments:
+        path {PathEnsemble} -- Circular path the flights follow.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.length = path.length
+        # Sorted list of (position, serial) tuples
+        self._positions = []
+        # Heap of (-size, start, end) tuples, may contain stale gaps
+        self._gaps = []
+        self._serial = itertools.count()
+
+    def __len__(self):
+        return len(self._positions)
+
+    def find_largest_gap(self):
+        """Find the largest gap between flights on the path.
+
+        Returns:
+            float -- Relative position in the middle of the gap.
+        """
+
+        if not self._positions:
+            return 0.0
+        while True:
+            negative_size, start, end = self._gaps[0]
+            if self._is_valid_gap(start, end):
+                return (start[0] - negative_size * 0.5) % self.length
+            heapq.heappop(self._gaps)
+
+    def add(self, position):
+        """Add a flight to the path.
+
+        Arguments:
+            position {float} -- Relative position of the flight.
+
+        Returns:
+            tuple -- Entry that identifies the flight on the path.
+        """
+
+        entry = (position % self.length, next(self._serial))
+        index = bisect.bisect(self._positions, entry)
+        self._positions.insert(index, entry)
+        if len(self._positions) == 1:
+            self._push_gap(entry, entry)
+        else:
+            self._push_gap(self._positions[index - 1], entry)
+            self._push_gap(entry, self._positions[
+                (index + 1) % len(self._positions)])
+        return entry
+
+    def remove(self, entry):
+        """Remove a flight from the path.
+
+        Arguments:
+            entry {tuple} -- Entry returned by add.
+        """
+
+        index = bisect.bisect_left(self._positions, entry)
+        del self._positions[index]
+        if self._positions:
+            self._push_gap(self._positions[index - 1],
+                           self._positions[index % len(self._positions)])
+        if len(self._gaps) > 4 * len(self._positions) + 16:
+            self._rebuild_gaps()
+
+    def _push_gap(self, start, end):
+        """Push the gap between two neighbouring flights to the heap.
+
+        Arguments:
+            start {tuple} -- Entry of the first flight.
+            end {tuple} -- Entry of the flight after it.
+        """
+
+        size = (end[0] - start[0]) % self.length
+        if start == end:
+            size = self.length
+        heapq.heappush(self._gaps, (-size, start, end))
+
+    def _is_valid_gap(self, start, end):
+        """Returns True if the flights are still neighbours on the path.
+
+        Arguments:
+            start {tuple} -- Entry of the first flight.
+            end {tuple} -- Entry of the flight after it.
+
+        Returns:
+            bool -- Whether the gap still exists.
+        """
+
+        index = bisect.bisect_left(self._positions, start)
+        if (index == len(self._positions) or
+                self._positions[index] != start):
+            return False
+        return self._positions[(index + 1) % len(self._positions)] == end
+
+    def _rebuild_gaps(self):
+        """Drop stale gaps from the heap."""
+
+        self._gaps = []
+        for i, entry in enumerate(self._positions):
+            self._push_gap(entry,
+                           self._positions[(i + 1) % len(self._positions)])
+
+
+class HoldingManager():
+    """Assigns new flights to the least loaded holding path, in the middle
+    of the largest gap between the flights already on it.
+
+    Arguments:
+        paths {list[PathEnsemble]} -- Circular holding paths.
+    """
+
+    def __init__(self, paths):
+        self.patterns = [HoldingPattern(path) for path in paths]
+        self.clock = 0.0
+        # Heap of (load, index) tuples, may contain stale loads
+        self._loads = [(0, i) for i in range(len(self.patterns))]
+        heapq.heapify(self._loads)
+        # Flight -> (pattern index, entry)
+        self._flights = {}
+
+    def assign(self, flight):
+        """Put the flight on a holding path.
+
+        Arguments:
+            flight {Flight} -- Flight without a path.
+
+        Returns:
+            PathEnsemble -- Path given to the flight.
+        """
+
+        while True:
+            load, index = self._loads[0]
+            if load == len(self.patterns[index]):
+                break
+            heapq.heappop(self._loads)
+        pattern = self.patterns[index]
+
+        position = pattern.find_largest_gap()
+        entry = pattern.add(position)
+        self._flights[flight] = (index, entry)
+        heapq.heappush(self._loads, (len(pattern), index))
+
+        flight.set_path(pattern.path,
+                        (position + self.clock) % pattern.length)
+        return pattern.path
+
+    def release(self, flight):
+        """Remove the flight from its holding path. Does nothing if the
+        flight is not holding.
+
+        Arguments:
+            flight {Flight} -- Flight leaving the holding path.
+        """
+
+        if flight not in self._flights:
+            return
+        index, entry = self._flights.pop(flight)
+        pattern = self.patterns[index]
+        pattern.remove(entry)
+        heapq.heappush(self._loads, (len(pattern), index))
+        if len(self._loads) > 4 * len(self.patterns) + 16:
+            self._loads = [(len(p), i) for i, p in enumerate(self.patterns)]
+            heapq.heapify(self._loads)
+
+    def update(self, elapsed_time):
+        """Advance the clock along with the holding flights. Call this after
+        the flights have been updated.
+
+        Arguments:
+            elapsed_time {float} -- Time elapsed since last call.
+        """
+
+        self.clock += elapsed_time * Flight.SPEED
+
+    def get_load(self, path):
+        """Return the number of flights holding on the given path.
+
+        Arguments:
+            path {PathEnsemble} -- Holding path.
+
+        Returns:
+            int -- Number of flights.
+        """
+
+        for pattern in self.patterns:
+            if pattern.path is path:
+                return len(pattern)
+        return 0
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+
+"""Saving and loading airfield layouts."""
+
+import json
+import logging
+import os
+
+import pygame
+
+from airportgame.airfield import Airfield, AirfieldLayout, LargeAirfield
+from airportgame.runway import Runway
+
+
+LOGGER = logging.getLogger(__name__)
+
+# Version of the layout format, stored in every layout
+FORMAT_VERSION = 1
+
+
+def layout_to_dict(airfield):
+    """Convert the runways of an airfield to a dictionary that can be saved
+    as JSON.
+
+    Arguments:
+        airfield {Airfield} -- Airfield to convert.
+
+    Returns:
+        dict -- The layout. Runway points are relative to the airfield, and
+            each runway is [number, length, start x, start y, end x, end y].
+    """
+
+    runways = []
+    for runway in airfield.get_runways():
+        start, end = runway.get_start_and_end_pos()
+        start = airfield.remove_offset_from_tuple(start)
+        end = airfield.remove_offset_from_tuple(end)
+        runways.append([runway.get_number(), runway.length,
+                        start[0], start[1], end[0], end[1]])
+    return {
+        "version": FORMAT_VERSION,
+        "size": [airfield.FIELD_WIDTH, airfield.FIELD_HEIGHT],
+        "offset": list(airfield.offset),
+        "runways": runways
+    }
+
+
+def layout_from_dict(data, offset=None):
+    """Create the runways of a layout dictionary.
+
+    Arguments:
+        data {dict} -- Layout from layout_to_dict.
+
+    Keyword Arguments:
+        offset {tuple} -- Offset of the airfield, or None to use the offset
+            stored in the layout. (default: {None})
+
+    Returns:
+        tuple -- The runways and the offset.
+    """
+
+    if data.get("version") != FORMAT_VERSION:
+        raise ValueError("Unsupported layout version: {0}".format(
+            data.get("version")))
+    if offset is None:
+        offset = tuple(data["offset"])
+    offset_x, offset_y = offset
+    runways = [Runway((start_x + offset_x, start_y + offset_y),
+                      (end_x + offset_x, end_y + offset_y), number, length)
+               for number, length, start_x, start_y, end_x, end_y
+               in data["runways"]]
+    return runways, offset
+
+
+class LayoutLibrary():
+    """Airfield layouts stored in a directory. Each layout is a JSON file,
+    optionally with the rendered map of the airfield as an image next to
+    it, so that loading the layout does not have to draw the runways.
+
+    Arguments:
+        directory {str} -- Directory of the layouts. Created when the first
+            layout is saved.
+    """
+
+    LAYOUT_EXTENSION = ".json"
+    MAP_EXTENSIONS = (".png", ".bmp")
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def get_names(self):
+        """Return the names of the stored layouts.
+
+        Returns:
+            list[str] -- Sorted names.
+        """
+
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(
+            os.path.splitext(filename)[0]
+            for filename in os.listdir(self.directory)
+            if filename.endswith(self.LAYOUT_EXTENSION))
+
+    def save(self, name, airfield, save_map=True):
+        """Store the layout of an airfield.
+
+        Arguments:
+            name {str} -- Name of the layout.
+            airfield {Airfield} -- Airfield to store.
+
+        Keyword Arguments:
+            save_map {bool} -- Whether the rendered map is stored as well.
+                (default: {True})
+        """
+
+        os.makedirs(self.directory, exist_ok=True)
+        airfield_map = airfield.get_airfield_map()
+        # Tiled maps of large airfields are not stored
+        save_map = save_map and isinstance(airfield_map, pygame.Surface)
+        with open(self._get_path(name, self.LAYOUT_EXTENSION), "w") as file:
+            json.dump(layout_to_dict(airfield), file)
+        for extension in self.MAP_EXTENSIONS:
+            path = self._get_path(name, extension)
+            if os.path.exists(path):
+                os.remove(path)
+        if save_map:
+            # PNG needs the extended image formats of pygame
+            extension = self.MAP_EXTENSIONS[
+                0 if pygame.image.get_extended() else 1]
+            pygame.image.save(airfield_map, self._get_path(name, extension))
+        LOGGER.debug("Saved layout %s", name)
+
+    def load_layout(self, name, offset=None):
+        """Load a stored layout.
+
+        Arguments:
+            name {str} -- Name of the layout.
+
+        Keyword Arguments:
+            offset {tuple} -- Offset of the airfield, or None to use the
+                stored offset. (default: {None})
+
+        Returns:
+            tuple -- AirfieldLayout, with map None if no map was stored,
+                the offset and the size of the field.
+        """
+
+        data = self._read(name)
+        runways, offset = layout_from_dict(data, offset)
+        layout = AirfieldLayout(runways, self._load_map(name, data))
+        return layout, offset, tuple(data["size"])
+
+    def get_size(self, name):
+        """Return the size of the field of a stored layout, without creating
+        its runways or loading its map.
+
+        Arguments:
+            name {str} -- Name of the layout.
+
+        Returns:
+            tuple -- Width and height of the field.
+        """
+
+        return tuple(self._read(name)["size"])
+
+    def load(self, name, offset=None, prefetch=0):
+        """Create an airfield from a stored layout.
+
+        Arguments:
+            name {str} -- Name of the layout.
+
+        Keyword Arguments:
+            offset {tuple} -- Offset of the airfield, or None to use the
+                stored offset. (default: {None})
+            prefetch {int} -- Random layouts generated in the background for
+                resetting the airfield. (default: {0})
+
+        Returns:
+            Airfield -- The airfield, a LargeAirfield if the layout is not
+                of the default size.
+        """
+
+        layout, offset, size = self.load_layout(name, offset)
+        if size == (Airfield.FIELD_WIDTH, Airfield.FIELD_HEIGHT):
+            return Airfield(offset=offset, prefetch=prefetch, layout=layout)
+        return LargeAirfield(offset=offset, prefetch=prefetch, layout=layout,
+                             size=size)
+
+    def _load_map(self, name, data):
+        """Load the stored map of a layout.
+
+        Arguments:
+            name {str} -- Name of the layout.
+            data {dict} -- The layout.
+
+        Returns:
+            Surface -- The map, or None if it is missing or does not match
+                the size of the airfield.
+        """
+
+        for extension in self.MAP_EXTENSIONS:
+            path = self._get_path(name, extension)
+            if not os.path.exists(path):
+                continue
+            try:
+                surface = pygame.image.load(path)
+            except pygame.error:
+                LOGGER.warning("Could not load map %s", path)
+                return None
+            if list(surface.get_size()) != data["size"]:
+                return None
+            return surface
+        return None
+
+    def _read(self, name):
+        """Read the JSON file of a layout.
+
+        Arguments:
+            name {str} -- Name of the layout.
+
+        Returns:
+            dict -- The layout.
+        """
+
+        with open(self._get_path(name, self.LAYOUT_EXTENSION)) as file:
+            return json.load(file)
+
+    def _get_path(self, name, extension):
+        """Return the path of a file of a layout.
+
+        Arguments:
+            name {str} -- Name of the layout.
+            extension {str} -- Extension of the file.
+
+        Returns:
+            str -- The path.
+        """
+
+        return os.path.join(self.directory, name + extension)
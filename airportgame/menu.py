@@ -37,23 +37,36 @@ class Menu():
         self.buttons = []
         self.init_graphics()
 
-    def update(self, elapsed_time, events):
-        for event in events:
-            if event.type == pg.KEYDOWN:
-                if event.key == pg.K_1:
-                    return self.new_game_pressed()
-                if event.key == pg.K_2:
-                    return self.quit_pressed()
-            if event.type == pg.MOUSEBUTTONUP:
-                mouse_x, mouse_y = pg.mouse.get_pos()
-                for i, button in enumerate(self.buttons):
-                    button_rect = button.get_rect()
-                    if not button_rect.collidepoint(mouse_x, mouse_y):
-                        continue
-                    if i == MenuButtons.NEW_GAME:
-                        return self.new_game_pressed()
-                    if i == MenuButtons.QUIT:
-                        return self.quit_pressed()
+    def register_events(self, router):
+        """Register the key and mouse handlers of the menu.
+
+        Arguments:
+            router {EventRouter} -- Router of the game events.
+        """
+
+        router.register(pg.KEYDOWN, self.handle_key, pg.K_1)
+        router.register(pg.KEYDOWN, self.handle_key, pg.K_2)
+        router.register(pg.MOUSEBUTTONUP, self.handle_click)
+
+    def handle_key(self, event):
+        if not self.show_menu:
+            return None
+        if event.key == pg.K_1:
+            return self.new_game_pressed()
+        return self.quit_pressed()
+
+    def handle_click(self, event):
+        if not self.show_menu:
+            return None
+        mouse_x, mouse_y = pg.mouse.get_pos()
+        for i, button in enumerate(self.buttons):
+            button_rect = button.get_rect()
+            if not button_rect.collidepoint(mouse_x, mouse_y):
+                continue
+            if i == MenuButtons.NEW_GAME:
+                return self.new_game_pressed()
+            if i == MenuButtons.QUIT:
+                return self.quit_pressed()
         return None
 
     def new_game_pressed(self):
@@ -70,5 +83,4 @@ class Menu():
         self.buttons = [new_game, quit_game]
 
     def draw(self, screen):
-        for button in self.buttons:
-            button.draw(screen)
+        return [button.draw(screen) for button in self.buttons]
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+
+"""Counters, gauges and histograms of what the game is doing, and writing
+them to a file while the game runs."""
+
+import bisect
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Counter():
+    """Number of times something has happened.
+
+    Arguments:
+        registry {MetricsRegistry} -- Registry of the counter.
+    """
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.value = 0
+
+    def reset(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        """Increase the counter if metrics are enabled.
+
+        Keyword Arguments:
+            amount {int} -- Amount to add. (default: {1})
+        """
+
+        if self.registry.enabled:
+            with self.registry.lock:
+                self.value += amount
+
+    def get_value(self):
+        return self.value
+
+
+class Gauge():
+    """Latest value of something, e.g. the number of flights.
+
+    Arguments:
+        registry {MetricsRegistry} -- Registry of the gauge.
+    """
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.value = None
+
+    def reset(self):
+        self.value = None
+
+    def set(self, value):
+        """Set the value if metrics are enabled.
+
+        Arguments:
+            value {float} -- The value.
+        """
+
+        if self.registry.enabled:
+            self.value = value
+
+    def get_value(self):
+        return self.value
+
+
+class Histogram():
+    """Distribution of values in fixed buckets. Bucket i counts the values
+    that are at most buckets[i] and more than the previous bound, and the
+    last count is for the values above all bounds.
+
+    Arguments:
+        registry {MetricsRegistry} -- Registry of the histogram.
+        buckets {list[float]} -- Sorted upper bounds of the buckets.
+    """
+
+    def __init__(self, registry, buckets):
+        self.registry = registry
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def reset(self):
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        """Add a value if metrics are enabled.
+
+        Arguments:
+            value {float} -- The value.
+        """
+
+        if self.registry.enabled:
+            index = bisect.bisect_left(self.buckets, value)
+            with self.registry.lock:
+                self.counts[index] += 1
+                self.count += 1
+                self.sum += value
+
+    def get_value(self):
+        return {
+            "buckets": list(self.buckets),
+            "counts": list(self.counts),
+            "count": self.count,
+            "sum": self.sum
+        }
+
+
+class MetricsRegistry():
+    """Named metrics of the game. Metrics are created when the modules are
+    imported, but only change while the registry is enabled, so that
+    leaving the hooks in costs one attribute check per call.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self._metrics = OrderedDict()
+
+    def enable(self):
+        """Start recording."""
+
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording. The recorded values are kept."""
+
+        self.enabled = False
+
+    def counter(self, name):
+        """Return the counter with the given name, creating it if needed.
+
+        Arguments:
+            name {str} -- Name of the counter.
+
+        Returns:
+            Counter -- The counter.
+        """
+
+        return self._get(name, Counter)
+
+    def gauge(self, name):
+        """Return the gauge with the given name, creating it if needed.
+
+        Arguments:
+            name {str} -- Name of the gauge.
+
+        Returns:
+            Gauge -- The gauge.
+        """
+
+        return self._get(name, Gauge)
+
+    def histogram(self, name, buckets):
+        """Return the histogram with the given name, creating it if needed.
+
+        Arguments:
+            name {str} -- Name of the histogram.
+            buckets {list[float]} -- Sorted upper bounds of the buckets.
+
+        Returns:
+            Histogram -- The histogram.
+        """
+
+        return self._get(name, Histogram, buckets)
+
+    def _get(self, name, metric_type, *args):
+        with self.lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = metric_type(self, *args)
+                self._metrics[name] = metric
+        if not isinstance(metric, metric_type):
+            raise ValueError("Metric {0} is a {1}".format(
+                name, type(metric).__name__))
+        return metric
+
+    def get_snapshot(self):
+        """Return the current values of all metrics.
+
+        Returns:
+            dict -- Values by name.
+        """
+
+        with self.lock:
+            return OrderedDict((name, metric.get_value())
+                               for name, metric in self._metrics.items())
+
+    def reset(self):
+        """Set all metrics back to their initial values."""
+
+        with self.lock:
+            for metric in self._metrics.values():
+                metric.reset()
+
+
+class MetricsWriter():
+    """Appends snapshots of a registry to a JSON lines file from a
+    background thread. Each line has the time and the values of the
+    metrics.
+
+    Arguments:
+        registry {MetricsRegistry} -- Registry to write.
+        filename {str} -- File to append to.
+
+    Keyword Arguments:
+        interval {float} -- Seconds between snapshots. (default: {1.0})
+    """
+
+    def __init__(self, registry, filename, interval=1.0):
+        self.registry = registry
+        self.filename = filename
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics",
+                                        daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.write()
+
+    def write(self):
+        """Append a snapshot of the registry to the file."""
+
+        line = json.dumps({"time": time.time(),
+                           "metrics": self.registry.get_snapshot()})
+        try:
+            with open(self.filename, "a") as file:
+                file.write(line + "\n")
+        except OSError as error:
+            LOGGER.warning("Could not write metrics: %s", error)
+
+    def stop(self):
+        """Stop the thread and write a final snapshot."""
+
+        self._stopped.set()
+        self._thread.join()
+        self.write()
+
+
+# Metrics of the game.
+METRICS = MetricsRegistry()
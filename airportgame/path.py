@@ -4,12 +4,67 @@
 
 import logging
 import abc
+import bisect
+from itertools import accumulate
 
 import numpy as np
 import pygame
 
 import airportgame.colors as colors
-from airportgame.utilities import vec2int
+from airportgame.metrics import METRICS
+from airportgame.utilities import union_rects
+
+
+# Number of segments searched linearly from a hint before falling back to a
+# binary search.
+SEARCH_LOOKAHEAD = 2
+
+LOGGER = logging.getLogger(__name__)
+PATH_EVALUATIONS = METRICS.counter("path.evaluations")
+
+
+def find_interval(starts, distance, hint=0):
+    """Find the interval that contains distance, starting the search from
+    hint. Small steps forward from the hint and jumps back to the first
+    interval take constant time, other jumps take logarithmic time.
+
+    Arguments:
+        starts {list} -- Sorted start distances of the intervals.
+        distance {float} -- Distance to look up.
+
+    Keyword Arguments:
+        hint {int} -- Index of the interval to start from. (default: {0})
+
+    Returns:
+        int -- Index of the last interval starting at or before distance.
+    """
+
+    last = len(starts) - 1
+    hint = min(max(hint, 0), last)
+    if starts[hint] <= distance:
+        for i in range(hint, min(hint + SEARCH_LOOKAHEAD, last) + 1):
+            if i == last or distance < starts[i + 1]:
+                return i
+    elif distance < starts[min(1, last)]:
+        return 0
+    return max(bisect.bisect_right(starts, distance) - 1, 0)
+
+
+def draw_polyline(screen, points):
+    """Draw a path through the given points.
+
+    Arguments:
+        screen {Surface} -- Surface to draw on.
+        points {list[tuple]} -- Points of the path.
+
+    Returns:
+        Rect -- Bounding rectangle of the drawn line, or None if there are
+            less than two points.
+    """
+
+    if len(points) < 2:
+        return None
+    return pygame.draw.lines(screen, colors.BLUE, False, points, 2)
 
 
 class BasePath(abc.ABC):
@@ -24,35 +79,76 @@ class BasePath(abc.ABC):
     def __init__(self, points):
         self.points = points
         self.length = 0.0
-        self.logger = logging.getLogger(__name__ + type(self).__name__)
+        self._bounding_rect = None
 
-    @abc.abstractmethod
-    def draw(self, screen):
+    def draw(self, screen, camera=None):
         """Draw the path.
 
         Arguments:
             screen {Surface} -- Surface to draw on.
 
-        Raises:
-            NotImplementedError -- This is an abstract method.
+        Keyword Arguments:
+            camera {Camera} -- Camera to view the path through, or None to
+                draw in world coordinates. (default: {None})
+
+        Returns:
+            Rect -- Bounding rectangle of the drawn path.
         """
 
-        raise NotImplementedError()
+        return self.draw_subpath(screen, 0.0, camera)
 
-    @abc.abstractmethod
-    def draw_subpath(self, screen, distance):
+    def draw_subpath(self, screen, distance, camera=None):
         """Draw the path starting from 'distance'.
 
         Arguments:
             screen {Surface} -- Surface to draw on.
             distance {float} -- Starting distance for the subpath.
 
+        Keyword Arguments:
+            camera {Camera} -- Camera to view the path through, or None to
+                draw in world coordinates. (default: {None})
+
+        Returns:
+            Rect -- Bounding rectangle of the drawn path.
+        """
+
+        points = np.asarray(self.get_polyline(distance), dtype=float)
+        if camera is None:
+            points = points.astype(int)
+        else:
+            points = camera.world_to_screen_points(points)
+        return draw_polyline(screen, points.tolist())
+
+    @abc.abstractmethod
+    def get_polyline(self, distance=0.0):
+        """Get points along the path starting from 'distance', close enough
+        to each other to be drawn as straight lines.
+
+        Keyword Arguments:
+            distance {float} -- Starting distance. (default: {0.0})
+
         Raises:
             NotImplementedError -- This is an abstract method.
         """
 
         raise NotImplementedError()
 
+    def get_bounding_rect(self):
+        """Get the bounding rectangle of the path.
+
+        Returns:
+            Rect -- Bounding rectangle of the path.
+        """
+
+        if self._bounding_rect is None:
+            points = np.asarray(self.get_polyline(), dtype=float)
+            left, top = np.floor(points.min(axis=0))
+            right, bottom = np.ceil(points.max(axis=0))
+            self._bounding_rect = pygame.Rect(
+                int(left), int(top), int(right - left) + 1,
+                int(bottom - top) + 1)
+        return self._bounding_rect
+
     @abc.abstractmethod
     def get_length(self):
         """Get the length of the path.
@@ -76,6 +172,23 @@ class BasePath(abc.ABC):
 
         raise NotImplementedError()
 
+    def get_point_from_hint(self, distance, hint=None):
+        """Get the coordinates of a point on the path, using a hint returned
+        by an earlier call to speed up the search.
+
+        Arguments:
+            distance {float} -- The distance along the path.
+
+        Keyword Arguments:
+            hint -- Hint from a previous call or None. (default: {None})
+
+        Returns:
+            Vector2 -- The coordinates of the requested point.
+            object -- Hint for the next call.
+        """
+
+        return self.get_point_along_path(distance), hint
+
     def is_over(self, distance):
         """Returns True if the distance is longer than the path.
 
@@ -101,32 +214,21 @@ class PointsPath(BasePath):
         super().__init__(points)
         self.length = self.get_length()
         assert self.length is not None
+        segment_lengths = [previous_point.distance_to(point) for
+                           previous_point, point in zip(self.points,
+                                                        self.points[1:])]
+        self._segment_starts = [0.0] + list(accumulate(segment_lengths))[:-1]
 
-    def draw(self, screen):
-        """Draw the path.
-
-        Arguments:
-            screen {Surface} -- Surface to draw on.
-        """
-        previous_point = self.points[0]
-        for point in self.points[1:]:
-            pygame.draw.line(screen, colors.BLUE, vec2int(
-                previous_point), vec2int(point), 2)
-            previous_point = point
+    def get_polyline(self, distance=0.0):
+        """Get the points of the path starting from 'distance'.
 
-    def draw_subpath(self, screen, distance):
-        """Draw the path starting from 'distance'.
+        Keyword Arguments:
+            distance {float} -- Starting distance. (default: {0.0})
 
-        Arguments:
-            screen {Surface} -- Surface to draw on.
-            distance {float} -- Starting distance for the subpath.
+        Returns:
+            list -- List of points.
         """
-        subpath = self.get_subpath(distance)
-        previous_point = subpath[0]
-        for point in subpath[1:]:
-            pygame.draw.line(screen, colors.BLUE, vec2int(
-                previous_point), vec2int(point), 2)
-            previous_point = point
+        return self.get_subpath(distance)
 
     def get_length(self):
         """Get the length of the path.
@@ -168,7 +270,7 @@ class PointsPath(BasePath):
 
             length += current_length
             previous_point = point
-        self.logger.warning("This should never happen!")
+        LOGGER.warning("This should never happen!")
         return self.points[-1:]
 
     def get_point_along_path(self, distance):
@@ -180,24 +282,34 @@ class PointsPath(BasePath):
         Returns:
             Vector2 -- Vector with the coordinates of the requested point.
         """
-        if distance > self.length:
-            return self.points[-1]
-        if distance < 0.0:
-            return self.points[0]
-        length = 0.0
-        previous_point = self.points[0]
-        for point in self.points[1:]:
-            current_length = previous_point.distance_to(point)
-            if length <= distance <= length + current_length:
-                # Point in this part
-                relative_distance = distance - length
-                dir_vector = (point - previous_point).normalize()
-                return previous_point + dir_vector * relative_distance
+        return self.get_point_from_hint(distance)[0]
 
-            length += current_length
-            previous_point = point
-        self.logger.warning("This should never happen!")
-        return self.points[-1]
+    def get_point_from_hint(self, distance, hint=None):
+        """Get the coordinates of a point on the path, starting the search
+        from the segment given as hint.
+
+        Arguments:
+            distance {float} -- The distance along the path.
+
+        Keyword Arguments:
+            hint {int} -- Index of a segment or None. (default: {None})
+
+        Returns:
+            Vector2 -- Vector with the coordinates of the requested point.
+            int -- Index of the segment containing the point.
+        """
+        if distance > self.length or len(self.points) < 2:
+            return self.points[-1], hint
+        if distance < 0.0:
+            return self.points[0], hint
+        segment = find_interval(self._segment_starts, distance, hint or 0)
+        previous_point = self.points[segment]
+        point = self.points[segment + 1]
+        relative_distance = distance - self._segment_starts[segment]
+        if relative_distance <= 0.0 or previous_point == point:
+            return pygame.math.Vector2(previous_point), segment
+        dir_vector = (point - previous_point).normalize()
+        return previous_point + dir_vector * relative_distance, segment
 
 
 class CatmullRomPath(BasePath):
@@ -245,7 +357,7 @@ class CatmullRomPath(BasePath):
             [t ** 3]
         ], ndmin=2)
         point = pg_matrix.dot(t_vec)
-        return (point[0], point[1])
+        return (point[0, 0], point[1, 0])
 
     def _get_pg(self, segment):
         """Return the 'pg' matrix for the segment. Here p = the control points
@@ -274,40 +386,24 @@ class CatmullRomPath(BasePath):
         p_matrix = np.array(points).T
         return p_matrix.dot(self.SPLINE_MATRIX)
 
-    def draw(self, screen):
-        """Draw the path.
+    def get_polyline(self, distance=0.0):
+        """Get points along the path starting from 'distance'.
 
-        Arguments:
-            screen {Surface} -- Surface to draw on.
-        """
-        div = 1.0 / self.n
-        for segment in range(0, self._n_points - 1):
-            previous_point = vec2int(self.points[segment])
-            for t in np.linspace(div, 1, self.n):
-                point = vec2int(self.get_point(segment, t))
-                pygame.draw.line(screen, colors.BLUE, previous_point, point, 2)
-                previous_point = point
+        Keyword Arguments:
+            distance {float} -- Starting distance. (default: {0.0})
 
-    def draw_subpath(self, screen, distance):
-        """Draw the path starting from 'distance'.
-
-        Arguments:
-            screen {Surface} -- Surface to draw on.
-            distance {float} -- Starting distance for the subpath.
+        Returns:
+            list -- List of points.
         """
         segment_start, t_start = self.find_segment(distance)
         div = 1.0 / self.n
-        previous_point = self.get_point(segment_start, t_start)
+        points = [self.get_point(segment_start, t_start)]
         for t in np.linspace(t_start, 1, self.n):
-            point = vec2int(self.get_point(segment_start, t))
-            pygame.draw.line(screen, colors.BLUE, previous_point, point, 2)
-            previous_point = point
+            points.append(self.get_point(segment_start, t))
         for segment in range(segment_start + 1, self._n_points - 1):
             for t in np.linspace(div, 1, self.n):
-                point = vec2int(self.get_point(segment, t))
-                pygame.draw.line(screen, colors.BLUE, previous_point, point, 2)
-                previous_point = point
-            previous_point = point
+                points.append(self.get_point(segment, t))
+        return points
 
     def find_segment(self, distance):
         """Find the index of the segment given distance along the path.
@@ -320,15 +416,29 @@ class CatmullRomPath(BasePath):
             float -- The unit distance within that segment.
         """
 
-        if distance > self.length:
-            return self._n_points - 2, 1.0
-        total_length = 0.0
-        for i, segment in enumerate(self.segment_lengths):
-            if total_length <= distance < total_length + segment:
-                return i, (distance - total_length) / segment
+        return self.find_segment_from(distance, 0)
+
+    def find_segment_from(self, distance, segment):
+        """Find the index of the segment given distance along the path,
+        starting the search from the given segment.
+
+        Arguments:
+            distance {float} -- Distance along the path.
+            segment {int} -- Index of the segment to start the search from.
+
+        Returns:
+            int -- Index of the segment.
+            float -- The unit distance within that segment.
+        """
 
-            total_length += segment
-        return self._n_points - 2, 1.0
+        if distance > self.length or not self.segment_lengths:
+            return self._n_points - 2, 1.0
+        segment = find_interval(self._segment_starts, distance, segment)
+        segment_length = self.segment_lengths[segment]
+        if segment_length == 0:
+            return segment, 1.0
+        t = (distance - self._segment_starts[segment]) / segment_length
+        return segment, max(0.0, min(t, 1.0))
 
     def get_length(self):
         """Get the length of the path.
@@ -349,6 +459,8 @@ class CatmullRomPath(BasePath):
             )
             self.segment_lengths[segment] = (segment_length)
             total_length += segment_length
+        self._segment_starts = (
+            [0.0] + list(accumulate(self.segment_lengths))[:-1])
         return total_length
 
     def get_point_along_path(self, distance):
@@ -360,12 +472,28 @@ class CatmullRomPath(BasePath):
         Returns:
             Vector2 -- Vector with the coordinates of the requested point.
         """
+        return self.get_point_from_hint(distance)[0]
+
+    def get_point_from_hint(self, distance, hint=None):
+        """Get the coordinates of a point on the path, starting the search
+        from the segment given as hint.
+
+        Arguments:
+            distance {float} -- The distance along the path.
+
+        Keyword Arguments:
+            hint {int} -- Index of a segment or None. (default: {None})
+
+        Returns:
+            tuple -- Coordinates of the requested point.
+            int -- Index of the segment containing the point.
+        """
         try:
             distance = distance % self.length
         except ZeroDivisionError:
-            return self.points[0]
-        segment, t = self.find_segment(distance)
-        return self.get_point(segment, t)
+            return self.points[0], hint
+        segment, t = self.find_segment_from(distance, hint or 0)
+        return self.get_point(segment, t), segment
 
 
 class CatmullRomPathMemory(CatmullRomPath):
@@ -416,39 +544,34 @@ class CatmullRomPathMemory(CatmullRomPath):
         path = pg_matrix.dot(t_matrix)
         return path.T
 
-    def draw(self, screen):
-        """Draw the path.
+    def get_polyline(self, distance=0.0):
+        """Get the pre-calculated points of the path starting from 'distance'.
 
-        Arguments:
-            screen {Surface} -- Surface to draw on.
+        Keyword Arguments:
+            distance {float} -- Starting distance. (default: {0.0})
+
+        Returns:
+            ndarray -- Array of coordinates.
         """
-        int_points = self._path.astype(int)
-        previous_point = int_points[0, :]
-        for i in range(1, int_points.shape[0]):
-            point = int_points[i, :]
-            pygame.draw.line(screen, colors.BLUE, previous_point, point, 2)
-            previous_point = point
-        # for point in self.points:
-        #     pygame.draw.circle(screen, colors.BLUE, vec2int(point), 5)
+        segment_start, t_start = self.find_segment(distance)
+        j = self.find_sample(distance)
+        return np.vstack((self.get_point(segment_start, t_start),
+                          self._path[j:]))
 
-    def draw_subpath(self, screen, distance):
-        """Draw the path starting from 'distance'.
+    def find_sample(self, distance):
+        """Find the first pre-calculated sample that is further along the
+        path than distance.
 
         Arguments:
-            screen {Surface} -- Surface to draw on.
-            distance {float} -- Starting distance for the subpath.
+            distance {float} -- Distance along the path.
+
+        Returns:
+            int -- Index of the sample.
         """
-        segment_start, t_start = self.find_segment(distance)
-        previous_point = self.get_point(segment_start, t_start)
-        j = 0
-        for j, cumsum in enumerate(self._path_cumulative_length):
-            if cumsum > distance:
-                break
-        int_points = self._path.astype(int)
-        for i in range(j, int_points.shape[0]):
-            point = int_points[i, :]
-            pygame.draw.line(screen, colors.BLUE, previous_point, point, 2)
-            previous_point = point
+
+        j = np.searchsorted(self._path_cumulative_length, distance,
+                            side="right")
+        return max(min(int(j), self._path_cumulative_length.size - 1), 0)
 
 
 class CubicBSplinePath(CatmullRomPathMemory):
@@ -522,21 +645,37 @@ class PathEnsemble():
         self.length = 0.0
         self.circular = circular
 
-    def draw(self, screen):
+    def draw(self, screen, camera=None):
         """Draw the path.
 
         Arguments:
             screen {Surface} -- Surface to draw on.
+
+        Keyword Arguments:
+            camera {Camera} -- Camera to view the path through, or None to
+                draw in world coordinates. (default: {None})
+
+        Returns:
+            Rect -- Bounding rectangle of the drawn path.
         """
-        for path in self.paths:
-            path.draw(screen)
+        return union_rects([path.draw(screen, camera) for path in self.paths])
+
+    def get_bounding_rect(self):
+        """Get the bounding rectangle of the path.
+
+        Returns:
+            Rect -- Bounding rectangle of the path.
+        """
+        return union_rects([path.get_bounding_rect() for path in self.paths])
 
     def calculate_length(self):
         """Calculate the length of the ensemble.
         """
 
         self.length = 0.0
+        self._path_starts = []
         for path in self.paths:
+            self._path_starts.append(self.length)
             self.length += path.length
 
     def get_point_along_path(self, distance):
@@ -548,22 +687,33 @@ class PathEnsemble():
         Returns:
             Vector2 -- Vector with the coordinates of the requested point.
         """
-        length = 0.0
-        if self.circular:
-            if distance < 0.0:
-                while distance < 0.0:
-                    distance += self.length
-            elif distance > self.length:
-                while distance > self.length:
-                    distance -= self.length
-        for path in self.paths:
-            if length <= distance <= length + path.length:
-                return path.get_point_along_path(distance - length)
+        return self.get_point_from_hint(distance)[0]
+
+    def get_point_from_hint(self, distance, hint=None):
+        """Get the coordinates of a point on the path ensemble, starting the
+        search from the position given as hint.
+
+        Arguments:
+            distance {float} -- The distance along the path ensemble.
 
-            length += path.length
+        Keyword Arguments:
+            hint {tuple} -- Index of a path and the hint for that path, or
+                None. (default: {None})
 
-        # distance > self.length
-        return path.get_point_along_path(distance - (length - path.length))
+        Returns:
+            Vector2 -- Vector with the coordinates of the requested point.
+            tuple -- Hint for the next call.
+        """
+        if self.circular and self.length > 0.0:
+            distance = distance % self.length
+        path_index, path_hint = hint if hint is not None else (0, None)
+        new_index = find_interval(self._path_starts, distance, path_index)
+        if new_index != path_index:
+            path_hint = None
+        path = self.paths[new_index]
+        point, path_hint = path.get_point_from_hint(
+            distance - self._path_starts[new_index], path_hint)
+        return point, (new_index, path_hint)
 
 
 class RectanglePathEnsemble(PathEnsemble):
@@ -647,3 +797,79 @@ class EllipticalPathEnsemble(PathEnsemble):
         self.paths.append(path)
 
         self.calculate_length()
+
+
+class PathCursor():
+    """Position of a moving object along a path. Remembers where the previous
+    lookup ended, so that moving forward does not search the path from the
+    start again.
+
+    Arguments:
+        path {BasePath or PathEnsemble} -- Path to move along.
+
+    Keyword Arguments:
+        distance {float} -- Starting distance along the path.
+            (default: {0.0})
+    """
+
+    def __init__(self, path, distance=0.0):
+        self.path = path
+        self.distance = distance
+        self.point = None
+        self._hint = None
+        self.seek(distance)
+
+    def seek(self, distance):
+        """Move the cursor to the given distance along the path.
+
+        Arguments:
+            distance {float} -- Distance along the path.
+
+        Returns:
+            Vector2 -- The coordinates of the new position.
+        """
+
+        self.distance = distance
+        self.point, self._hint = self.path.get_point_from_hint(distance,
+                                                               self._hint)
+        PATH_EVALUATIONS.inc()
+        return self.point
+
+    def advance(self, distance):
+        """Move the cursor forward along the path.
+
+        Arguments:
+            distance {float} -- Distance to move.
+
+        Returns:
+            Vector2 -- The coordinates of the new position.
+        """
+
+        return self.seek(self.distance + distance)
+
+    def get_distance(self):
+        """Return the distance of the cursor along the path.
+
+        Returns:
+            float -- Distance along the path.
+        """
+
+        return self.distance
+
+    def get_point(self):
+        """Return the coordinates of the current position.
+
+        Returns:
+            Vector2 -- The coordinates of the current position.
+        """
+
+        return self.point
+
+    def is_over(self):
+        """Returns True if the cursor has moved past the end of the path.
+
+        Returns:
+            bool -- Whether the cursor is past the end of the path.
+        """
+
+        return self.path.is_over(self.distance)
@@ -3,30 +3,149 @@
 # -*- coding: utf-8 -*-
 
 
+import math
+import threading
+from collections import OrderedDict
+
 import pygame
 from airportgame.colors import *
 
 
+class FontRegistry():
+    """
+    Resolves system fonts once and keeps the Font objects for reuse, since
+    pygame.font.SysFont searches the system fonts on every call. Also keeps
+    pre-rendered digits for drawing numbers without rendering them again.
+    """
+    DIGITS = "0123456789"
+
+    def __init__(self):
+        self._fonts = {}
+        self._digits = {}
+        self._lock = threading.Lock()
+
+    def get_font(self, name, size, bold=False, italic=False):
+        """
+        Returns the Font with the given name, size and style.
+        """
+        key = (name, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is None:
+            with self._lock:
+                font = self._fonts.get(key)
+                if font is None:
+                    font = pygame.font.SysFont(name, size, bold, italic)
+                    self._fonts[key] = font
+        return font
+
+    def get_digits(self, name, size, color):
+        """
+        Returns a dictionary of Surfaces with each digit rendered in the
+        given font and color.
+        """
+        key = (name, size, tuple(color))
+        digits = self._digits.get(key)
+        if digits is None:
+            font = self.get_font(name, size)
+            with self._lock:
+                digits = {digit: font.render(digit, True, color)
+                          for digit in self.DIGITS}
+                self._digits[key] = digits
+        return digits
+
+    def preload(self, fonts):
+        """
+        Resolves the given (name, size) pairs, so that they are ready when
+        they are first used. Can be called from a background thread.
+        """
+        for name, size in fonts:
+            self.get_font(name, size)
+
+    def clear(self):
+        """
+        Forgets all fonts and digits, e.g. after pygame.font.quit().
+        """
+        with self._lock:
+            self._fonts.clear()
+            self._digits.clear()
+
+
+# Registry used for all text in the game.
+FONTS = FontRegistry()
+
+
 class PgText():
     """
     Helper class for creating and drawing text using PyGame
+
+    Rendered text surfaces are kept in a least recently used cache of
+    cache_size entries, keyed by the text, color and antialiasing. The font
+    is resolved when the first text is created.
     """
 
-    def __init__(self, font, size=25):
-        self.font = pygame.font.SysFont(font, size)
+    def __init__(self, font, size=25, cache_size=128):
+        self.font_name = font
+        self.size = size
+        self._font = None
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def font(self):
+        """
+        The Font used for the text.
+        """
+        if self._font is None:
+            self._font = FONTS.get_font(self.font_name, self.size)
+        return self._font
 
-    def create_text(self, string, color=BLACK):
+    def create_text(self, string, color=BLACK, antialias=True):
         """
-        Returns a new Surface with string written on it using self.font and
-        antialiasing. Default color is BLACK.
+        Returns a Surface with string written on it using self.font and
+        antialiasing. Default color is BLACK. The Surface may be shared with
+        other callers, so it must not be drawn on.
         """
-        return self.font.render(string, True, color)
+        key = (string, tuple(color), antialias)
+        surface = self._cache.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = self.font.render(string, antialias, color)
+        self._cache[key] = surface
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return surface
 
     def display_text(self, text, screen, x=10, y=10, color=BLACK):
         """
-        Displays the text in 'text' on the screen.
+        Displays the text in 'text' on the screen. Returns the Rect of the
+        area that was drawn on.
+        """
+        return screen.blit(self.create_text(text, color), [x, y])
+
+    def display_value(self, template, value, screen, x=10, y=10,
+                      color=BLACK, step=1.0):
+        """
+        Displays a number formatted with 'template' on the screen. The value
+        is rounded to a multiple of 'step' first, so that a value that changes
+        every frame produces only a few different strings and the rendered
+        text can be reused from the cache.
+        """
+        if math.isfinite(value):
+            value = round(value / step) * step
+        return self.display_text(template.format(value), screen, x, y, color)
+
+    def clear_cache(self):
+        """
+        Empties the cache of rendered text and resets the counters.
         """
-        screen.blit(self.create_text(text, color), [x, y])
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
 
 
 class PgTextObject():
@@ -39,7 +158,7 @@ class PgTextObject():
         self._text_surface = text_surface
 
     def draw(self, screen):
-        screen.blit(self._text_surface, [self._x, self._y])
+        return screen.blit(self._text_surface, [self._x, self._y])
 
     def get_rect(self):
         return self._text_surface.get_rect().move(self._x, self._y)
@@ -65,7 +184,36 @@ def draw_text(font, size, text, screen, dest, color):
         screen {Surface} -- Surface to draw on.
         dest {tuple} -- Position to draw to.
         color {tuple} -- Color of the text.
+
+    Returns:
+        Rect -- Bounding rectangle of the drawn text.
+    """
+
+    if text and all(char in FontRegistry.DIGITS for char in text):
+        return draw_number(font, size, text, screen, dest, color)
+    font = FONTS.get_font(font, size)
+    return screen.blit(font.render(text, True, color), dest)
+
+
+def draw_number(font, size, number, screen, dest, color):
+    """Draw a number on screen using pre-rendered digits.
+
+    Arguments:
+        font {str} -- Name of font.
+        size {int} -- Size of font.
+        number {str} -- The digits to draw.
+        screen {Surface} -- Surface to draw on.
+        dest {tuple} -- Position to draw to.
+        color {tuple} -- Color of the text.
+
+    Returns:
+        Rect -- Bounding rectangle of the drawn number.
     """
 
-    font = pygame.font.SysFont(font, size)
-    screen.blit(font.render(text, True, color), dest)
+    digits = FONTS.get_digits(font, size, color)
+    x, y = dest
+    rects = []
+    for digit in number:
+        rects.append(screen.blit(digits[digit], (x, y)))
+        x += digits[digit].get_width()
+    return rects[0].unionall(rects[1:])
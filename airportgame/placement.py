@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""Occupancy grid for placing runways on the airfield."""
+
+import math
+import random
+
+import numpy as np
+
+from airportgame.utilities import distances_to_segments
+
+
+class OccupancyGrid():
+    """Marks which integer points of an area are free for new runway end
+    points. A point is free if it is inside the area, not closer than
+    margin to its edges and far enough from every segment that has been
+    occupied. Checking a point takes constant time, and random points are
+    only picked among the free ones.
+
+    Arguments:
+        width {int} -- Width of the area.
+        height {int} -- Height of the area.
+
+    Keyword Arguments:
+        margin {int} -- Distance from the edges where points are never free.
+            (default: {0})
+    """
+
+    # Number of directions tried for the end point of a segment
+    N_ANGLES = 360
+    # Random points tried before searching among the free points only
+    N_RANDOM_TRIES = 100
+
+    def __init__(self, width, height, margin=0):
+        self.width = width
+        self.height = height
+        # Indexed by [y, x], both edges included
+        self.free = np.zeros((height + 1, width + 1), dtype=bool)
+        self.free[margin:height - margin + 1, margin:width - margin + 1] = True
+
+    def is_free(self, point):
+        """Return True if the point is free.
+
+        Arguments:
+            point {tuple} -- Integer coordinates of the point.
+
+        Returns:
+            bool -- Whether the point is free.
+        """
+
+        x, y = point
+        if not (0 <= x <= self.width and 0 <= y <= self.height):
+            return False
+        return bool(self.free[y, x])
+
+    def occupy_segment(self, start, end, distance):
+        """Mark the points closer than distance to the segment as not free.
+
+        Arguments:
+            start {tuple} -- Start point of the segment.
+            end {tuple} -- End point of the segment.
+            distance {float} -- Minimum distance of free points from the
+                segment.
+        """
+
+        x_min = max(int(math.floor(min(start[0], end[0]) - distance)), 0)
+        x_max = min(int(math.ceil(max(start[0], end[0]) + distance)),
+                    self.width)
+        y_min = max(int(math.floor(min(start[1], end[1]) - distance)), 0)
+        y_max = min(int(math.ceil(max(start[1], end[1]) + distance)),
+                    self.height)
+        if x_min > x_max or y_min > y_max:
+            return
+        xs, ys = np.meshgrid(np.arange(x_min, x_max + 1),
+                             np.arange(y_min, y_max + 1))
+        distances = distances_to_segments(
+            np.column_stack((xs.ravel(), ys.ravel())), start, end)
+        self.free[y_min:y_max + 1, x_min:x_max + 1] &= (
+            distances.reshape(xs.shape) >= distance)
+
+    def find_segment(self, length):
+        """Find a random segment of the given length with both ends on free
+        points.
+
+        Arguments:
+            length {float} -- Length of the segment. The end point is
+                rounded down to integer coordinates.
+
+        Returns:
+            tuple -- Start and end points of the segment, or None if there
+                is no room for it.
+        """
+
+        angles = (np.arange(self.N_ANGLES) + random.random()) * (
+            2.0 * math.pi / self.N_ANGLES)
+        offsets = (np.cos(angles) * length, np.sin(angles) * length)
+
+        # While most of the area is free, random points are found quickly
+        for _ in range(self.N_RANDOM_TRIES):
+            start = (random.randint(0, self.width),
+                     random.randint(0, self.height))
+            if self.free[start[1], start[0]]:
+                end = self._find_end(start, offsets)
+                if end is not None:
+                    return start, end
+
+        # Otherwise go through the free points in random order
+        indices = np.flatnonzero(self.free)
+        shuffle = np.random.RandomState(random.getrandbits(32))
+        for index in shuffle.permutation(indices):
+            y, x = divmod(int(index), self.width + 1)
+            end = self._find_end((x, y), offsets)
+            if end is not None:
+                return (x, y), end
+        return None
+
+    def _find_end(self, start, offsets):
+        """Pick a random free end point for a segment.
+
+        Arguments:
+            start {tuple} -- Start point of the segment.
+            offsets {tuple} -- Arrays of the x and y offsets of the possible
+                end points from the start point.
+
+        Returns:
+            tuple -- End point, or None if none of the end points is free.
+        """
+
+        end_x = np.trunc(start[0] + offsets[0]).astype(int)
+        end_y = np.trunc(start[1] + offsets[1]).astype(int)
+        inside = ((0 <= end_x) & (end_x <= self.width) &
+                  (0 <= end_y) & (end_y <= self.height))
+        end_x = end_x[inside]
+        end_y = end_y[inside]
+        ends = np.flatnonzero(self.free[end_y, end_x])
+        if ends.size == 0:
+            return None
+        end = ends[random.randrange(ends.size)]
+        return int(end_x[end]), int(end_y[end])
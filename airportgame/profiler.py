@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+"""Per-phase frame time measurement."""
+
+import csv
+import json
+import time
+
+import numpy as np
+
+
+class FrameProfiler():
+    """Measures how long each phase of a frame takes and keeps the results
+    of the latest frames in a ring buffer.
+
+    A frame is started with begin_frame. Each call to mark records the time
+    since the previous mark (or the start of the frame) for the named phase,
+    and end_frame stores the frame in the buffer.
+
+    Keyword Arguments:
+        size {int} -- Number of frames kept in the buffer. (default: {600})
+        max_phases {int} -- Maximum number of different phases.
+            (default: {32})
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, size=600, max_phases=32):
+        self.size = size
+        self.max_phases = max_phases
+        self.phases = []
+        self._phase_index = {}
+        # Milliseconds spent in each phase, NaN if the phase did not run
+        self._buffer = np.full((size, max_phases), np.nan)
+        self._current = np.full(max_phases, np.nan)
+        self._next = 0
+        self.frame_count = 0
+        self._last_mark = None
+
+    def begin_frame(self):
+        """Start measuring a new frame."""
+
+        self._current.fill(np.nan)
+        self._last_mark = time.perf_counter()
+
+    def mark(self, phase):
+        """Record the time since the previous mark for the given phase.
+
+        Arguments:
+            phase {str} -- Name of the phase that just ended.
+        """
+
+        now = time.perf_counter()
+        if self._last_mark is None:
+            self._last_mark = now
+            return
+        index = self._phase_index.get(phase)
+        if index is None:
+            if len(self.phases) == self.max_phases:
+                self._last_mark = now
+                return
+            index = len(self.phases)
+            self.phases.append(phase)
+            self._phase_index[phase] = index
+        elapsed = (now - self._last_mark) * 1000.0
+        if np.isnan(self._current[index]):
+            self._current[index] = elapsed
+        else:
+            self._current[index] += elapsed
+        self._last_mark = now
+
+    def end_frame(self):
+        """Store the measurements of the current frame."""
+
+        self._buffer[self._next] = self._current
+        self._next = (self._next + 1) % self.size
+        self.frame_count += 1
+        self._last_mark = None
+
+    def get_frames(self):
+        """Return the stored frames from the oldest to the newest.
+
+        Returns:
+            ndarray -- Array of shape (frames, phases) in milliseconds.
+        """
+
+        n_phases = len(self.phases)
+        if self.frame_count < self.size:
+            return self._buffer[:self.frame_count, :n_phases].copy()
+        return np.roll(self._buffer, -self._next, axis=0)[:, :n_phases]
+
+    def get_percentiles(self):
+        """Calculate the percentiles of each phase over the stored frames.
+
+        Returns:
+            dict -- Phase name to a tuple of percentiles in milliseconds,
+                in the order of PERCENTILES.
+        """
+
+        frames = self.get_frames()
+        result = {}
+        for i, phase in enumerate(self.phases):
+            times = frames[:, i]
+            times = times[~np.isnan(times)]
+            if times.size == 0:
+                continue
+            result[phase] = tuple(np.percentile(times, self.PERCENTILES))
+        return result
+
+    def get_report_lines(self):
+        """Format the percentiles as lines of text.
+
+        Returns:
+            list[str] -- One line per phase.
+        """
+
+        header = "{0:<11}".format("ms") + "".join(
+            "{0:>7}".format("p{0}".format(p)) for p in self.PERCENTILES)
+        lines = [header]
+        for phase, values in self.get_percentiles().items():
+            lines.append("{0:<11}".format(phase[:11]) + "".join(
+                "{0:>7.2f}".format(value) for value in values))
+        return lines
+
+    def dump(self, filename):
+        """Write the stored frames to a CSV or JSON file, depending on the
+        extension of the filename.
+
+        Arguments:
+            filename {str} -- Name of the file.
+        """
+
+        frames = self.get_frames()
+        if filename.lower().endswith(".json"):
+            data = {
+                "phases": self.phases,
+                "percentiles": {phase: dict(zip(self.PERCENTILES, values))
+                                for phase, values
+                                in self.get_percentiles().items()},
+                "frames": [[None if np.isnan(value) else value
+                            for value in frame] for frame in frames.tolist()]
+            }
+            with open(filename, "w") as json_file:
+                json.dump(data, json_file, indent=1)
+            return
+        with open(filename, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(self.phases)
+            for frame in frames.tolist():
+                writer.writerow(["" if np.isnan(value) else "{0:.4f}".format(
+                    value) for value in frame])
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of the Renderer class."""
+
+import pygame
+
+from airportgame.metrics import METRICS
+
+
+PRESENTED_FRAMES = METRICS.counter("draw.frames")
+UPDATED_RECTS = METRICS.histogram("draw.updated_rects",
+                                  (0, 1, 2, 5, 10, 20, 50, 100, 200, 500))
+
+
+class BackgroundCompositor():
+    """Merges the static layers of the screen into one surface in the pixel
+    format of the display, so that drawing it takes a single opaque blit.
+    The layers are only drawn again when their key changes.
+
+    Arguments:
+        size {tuple} -- Size of the background.
+    """
+
+    def __init__(self, size):
+        self.surface = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        self._key = None
+        self._valid = False
+
+    def invalidate(self):
+        """Draw the layers again on the next update."""
+
+        self._valid = False
+
+    def update(self, key, draw_layers):
+        """Draw the layers if the key has changed since the last update.
+
+        Arguments:
+            key {object} -- Anything that compares unequal when the static
+                layers have changed.
+            draw_layers {callable} -- Function that draws the layers on the
+                Surface it is given.
+
+        Returns:
+            bool -- True if the layers were drawn.
+        """
+
+        if self._valid and key == self._key:
+            return False
+        draw_layers(self.surface)
+        self._key = key
+        self._valid = True
+        return True
+
+
+class Renderer():
+    """Draws frames on top of a static background and only updates the parts
+    of the display that changed since the previous frame.
+
+    Everything that moves is drawn on the screen each frame and its bounding
+    rectangle is passed to add. At the start of the next frame those areas
+    are restored from the background, and both the old and the new areas are
+    updated on the display.
+
+    Arguments:
+        screen {Surface} -- The display surface.
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.background = BackgroundCompositor(screen.get_size())
+        self._full_update = True
+        self._rects = []
+        self._previous_rects = []
+
+    def invalidate(self):
+        """Redraw the background and the whole display on the next frame,
+        e.g. when the window has been uncovered and its contents are lost.
+        """
+
+        self.background.invalidate()
+        self._full_update = True
+
+    def begin_frame(self, key, draw_background):
+        """Start a new frame by erasing what was drawn in the previous one.
+
+        Arguments:
+            key {object} -- Key of the background, see
+                BackgroundCompositor.update.
+            draw_background {callable} -- Function that draws the static
+                background on the Surface it is given. Only called when the
+                key has changed or the background has been invalidated.
+        """
+
+        background = self.background.surface
+        if self.background.update(key, draw_background):
+            self._full_update = True
+            self.screen.blit(background, (0, 0))
+            return
+        for rect in self._previous_rects:
+            self.screen.blit(background, rect, rect)
+
+    def add(self, rect):
+        """Mark an area of the screen as drawn on in this frame.
+
+        Arguments:
+            rect {Rect} -- Bounding rectangle of the drawing, or None.
+        """
+
+        if rect is not None:
+            self._rects.append(pygame.Rect(rect))
+
+    def add_all(self, rects):
+        """Mark several areas of the screen as drawn on in this frame.
+
+        Arguments:
+            rects {list[Rect]} -- Bounding rectangles of the drawings.
+        """
+
+        for rect in rects:
+            self.add(rect)
+
+    def present(self):
+        """Update the changed areas of the display."""
+
+        PRESENTED_FRAMES.inc()
+
+        if self._full_update:
+            pygame.display.flip()
+            self._full_update = False
+        else:
+            rects = self._previous_rects + self._rects
+            UPDATED_RECTS.observe(len(rects))
+            pygame.display.update(rects)
+        self._previous_rects = self._rects
+        self._rects = []
@@ -3,6 +3,8 @@
 """Implementation of the Runway class."""
 
 import logging
+import threading
+from collections import OrderedDict, namedtuple
 
 import pygame
 
@@ -11,6 +13,16 @@ from airportgame.pgtext import draw_text
 from airportgame.utilities import vec2tuple
 
 
+LOGGER = logging.getLogger(__name__)
+
+# Derived geometry of a runway, computed once when the runway is created.
+# Points and vectors are tuples, the bounding box is (left, top, right,
+# bottom) of the drawn runway.
+RunwayShape = namedtuple("RunwayShape", [
+    "start", "end", "direction", "angle", "full_length", "approach_point",
+    "midpoint", "bounding_box"])
+
+
 class Runway():
     """
     A part of an airfield
@@ -34,14 +46,13 @@ class Runway():
         length (int): 1...3
         """
         self.number = number
-        self.start_pos = start_pos
-        self.end_pos = end_pos
         self.taken = False
         self.cooldown = 0
         self.length = length
 
         # Debugging
         assert(self.length in [1, 2, 3])
+        self.shape = self.create_shape(start_pos, end_pos, length)
 
         self.flight = None
         self.queue = []
@@ -53,8 +64,48 @@ class Runway():
         # TODO: Add Flight.INCOMING_DISTANCE to wait time
         self.cool_down_time = self.wait_time
 
-        self.logger = logging.getLogger(type(self).__name__)
+    @classmethod
+    def create_shape(cls, start_pos, end_pos, length):
+        """Calculate the geometry of a runway.
+
+        Arguments:
+            start_pos {tuple} -- Starting point of the runway.
+            end_pos {tuple} -- Ending point of the runway.
+            length {int} -- Length class of the runway, 1...3.
+
+        Returns:
+            RunwayShape -- The geometry.
+        """
 
+        start = (start_pos[0], start_pos[1])
+        end = (end_pos[0], end_pos[1])
+        full_length = cls.RUNWAY_LENGTH_ENUM[length]
+        vector = pygame.math.Vector2(end[0] - start[0], end[1] - start[1])
+        angle = vector.angle_to(pygame.math.Vector2(0, full_length))
+        direction = vector.normalize()
+        approach_point = (pygame.math.Vector2(start)
+                          - direction * 0.5 * full_length)
+        half_width = cls.RUNWAY_WIDTH / 2
+        bounding_box = (min(start[0], end[0]) - half_width,
+                        min(start[1], end[1]) - half_width,
+                        max(start[0], end[0]) + half_width,
+                        max(start[1], end[1]) + half_width)
+        return RunwayShape(
+            start, end, vec2tuple(direction), angle, full_length,
+            vec2tuple(approach_point),
+            ((start[0] + end[0]) / 2, (start[1] + end[1]) / 2), bounding_box)
+
+    @property
+    def start_pos(self):
+        """Starting point of the runway as a tuple."""
+
+        return self.shape.start
+
+    @property
+    def end_pos(self):
+        """Ending point of the runway as a tuple."""
+
+        return self.shape.end
 
     def get_start_and_end_pos(self):
         """Get the start and end positions of the runway.
@@ -82,21 +133,35 @@ class Runway():
             offset {Vector} -- Offset of the Airfield.
         """
 
-        runway_background = pygame.Surface(
-            (self.RUNWAY_WIDTH, self.get_full_length()), pygame.SRCALPHA)
-        runway_background.fill(self.RUNWAY_COLOR)
-        runway_background = pygame.transform.rotate(runway_background,
-                                                    self.get_angle())
+        runway_background = SPRITES.get_background(self.length,
+                                                   self.get_angle())
         w, h = runway_background.get_size()
-        start_pos = self.get_unoffsetted_point_tuple(self.start_pos,
-                                                     vec2tuple(offset))
-        end_pos = self.get_unoffsetted_point_tuple(self.end_pos,
-                                                   vec2tuple(offset))
-        mid_x = (start_pos[0] + end_pos[0]) / 2
-        mid_y = (start_pos[1] + end_pos[1]) / 2
+        mid_x, mid_y = self.get_unoffsetted_point_tuple(self.shape.midpoint,
+                                                        vec2tuple(offset))
         dest = (mid_x - w / 2, mid_y - h / 2)
         screen.blit(runway_background, dest)
 
+    def get_hit_mask(self, offset):
+        """Return the pixels covered by the runway when it is drawn.
+
+        Arguments:
+            offset {Vector} -- Offset of the Airfield.
+
+        Returns:
+            tuple -- Boolean ndarray indexed by [y, x], and the position of
+                its top-left corner relative to the offset.
+        """
+
+        runway_background = SPRITES.get_background(self.length,
+                                                   self.get_angle())
+        w, h = runway_background.get_size()
+        mid_x, mid_y = self.get_unoffsetted_point_tuple(self.shape.midpoint,
+                                                        vec2tuple(offset))
+        # Blit truncates the destination the same way
+        dest = (int(mid_x - w / 2), int(mid_y - h / 2))
+        mask = pygame.surfarray.array_alpha(runway_background).T > 127
+        return mask, dest
+
 
     def paint(self, screen, offset):
         """Paints the middle line and the number of the runway.
@@ -106,34 +171,13 @@ class Runway():
             offset {Vector} -- Offset of the Airfield.
         """
 
-        runway_background = pygame.Surface(
-            (self.RUNWAY_WIDTH, self.get_full_length()), pygame.SRCALPHA)
-
-        edge_offset = 5
-        line_length = 5
-        line_width = 2
         number_size = 18
 
-        x = self.RUNWAY_WIDTH / 2
-        final_y = self.get_full_length() - edge_offset
-        start_y = edge_offset
-
-        painted = False
-        while not painted:
-            end_y = start_y + line_length
-            if end_y > final_y:
-                end_y = final_y
-                painted = True
-            pygame.draw.line(runway_background, colors.WHITE, (x, start_y), (x, end_y),
-                             line_width)
-            start_y = end_y + line_length
-
-        runway_background = pygame.transform.rotate(runway_background, self.get_angle())
+        runway_background = SPRITES.get_markings(self.length,
+                                                 self.get_angle())
         w, h = runway_background.get_size()
-        start_pos = self.get_unoffsetted_point_tuple(self.start_pos, vec2tuple(offset))
-        end_pos = self.get_unoffsetted_point_tuple(self.end_pos, vec2tuple(offset))
-        mid_x = (start_pos[0] + end_pos[0]) / 2
-        mid_y = (start_pos[1] + end_pos[1]) / 2
+        mid_x, mid_y = self.get_unoffsetted_point_tuple(self.shape.midpoint,
+                                                        vec2tuple(offset))
         dest = (mid_x - w / 2, mid_y - h / 2)
         screen.blit(runway_background, dest)
 
@@ -147,7 +191,7 @@ class Runway():
                 colors.BLACK
             )
         except pygame.error:
-            self.logger.error("Could not draw text!")
+            LOGGER.error("Could not draw text!")
 
     def get_full_length(self):
         """Get the full length of the runway.
@@ -156,13 +200,7 @@ class Runway():
             int -- Length of the runway.
         """
 
-        assert(self.length in [1, 2, 3])
-        length = self.RUNWAY_LENGTH_ENUM.get(self.length, None)
-
-        if length is None:
-            self.logger.error("Runway length is None. This should never happen!")
-        return length
-
+        return self.shape.full_length
 
     def get_angle(self):
         """Get the angle of the runway. Returns the angle in degrees, with
@@ -173,11 +211,7 @@ class Runway():
             float -- angle of the runway.
         """
 
-        unrotated = pygame.math.Vector2(0, self.get_full_length())
-        rotated = pygame.math.Vector2(self.end_pos[0] - self.start_pos[0],
-                                      self.end_pos[1] - self.start_pos[1])
-        return rotated.angle_to(unrotated)
-
+        return self.shape.angle
 
     def get_start_pos(self):
         """Return the starting point of the runway.
@@ -186,7 +220,7 @@ class Runway():
             Vector2 -- Starting point of the runway.
         """
 
-        return pygame.math.Vector2(self.start_pos)
+        return pygame.math.Vector2(self.shape.start)
 
     def get_end_pos(self):
         """Return the ending point of the runway.
@@ -194,18 +228,26 @@ class Runway():
         Returns:
             Vector2 -- Ending point of the runway.
         """
-        return pygame.math.Vector2(self.end_pos)
+        return pygame.math.Vector2(self.shape.end)
 
-    def draw_selection_circle(self, screen):
+    def draw_selection_circle(self, screen, camera=None):
         """Draw a circle indicating that this runway has been selected.
 
         Arguments:
             screen {Surface} -- Surface to draw to.
+
+        Keyword Arguments:
+            camera {Camera} -- Camera to view the runway through, or None to
+                draw in world coordinates. (default: {None})
+
+        Returns:
+            Rect -- Bounding rectangle of the circle.
         """
 
-        pos = self.get_start_pos()
-        pos = (int(pos.x), int(pos.y))
-        pygame.draw.circle(screen, colors.YELLOW, pos, 20, 3)
+        pos = (int(self.start_pos[0]), int(self.start_pos[1]))
+        if camera is not None:
+            pos = camera.world_to_screen(self.start_pos)
+        return pygame.draw.circle(screen, colors.YELLOW, pos, 20, 3)
 
     def get_direction_vector(self):
         """Return an unit vector that points in the same direction as the
@@ -215,10 +257,7 @@ class Runway():
             Vector2 -- Unit vector.
         """
 
-        return pygame.math.Vector2(self.end_pos[0] -
-                                   self.start_pos[0],
-                                   self.end_pos[1] -
-                                   self.start_pos[1]).normalize()
+        return pygame.math.Vector2(self.shape.direction)
 
     def get_approach_point(self):
         """Get an "approach" point that all landing flights must pass through.
@@ -227,12 +266,7 @@ class Runway():
             Vector2 -- Point.
         """
 
-        my_vect = self.get_direction_vector()
-        if my_vect is None:
-            self.logger.error("Direction vector is None!")
-        if self.get_full_length() is None:
-            self.logger.error("Runway has None length!")
-        return self.get_start_pos() - my_vect * 0.5 * self.get_full_length()
+        return pygame.math.Vector2(self.shape.approach_point)
 
     @staticmethod
     def get_unoffsetted_point_tuple(point, offset):
@@ -247,3 +281,121 @@ class Runway():
         """
 
         return (point[0] - offset[0], point[1] - offset[1])
+
+
+class RunwaySprites():
+    """Cache of runway surfaces. Unrotated surfaces are created once per
+    length class, and rotated versions are kept in a least recently used
+    cache keyed by the length class and the angle rounded to angle_step.
+
+    Keyword Arguments:
+        angle_step {float} -- Precision of the angles in degrees.
+            (default: {0.5})
+        cache_size {int} -- Maximum number of rotated surfaces.
+            (default: {256})
+    """
+
+    def __init__(self, angle_step=0.5, cache_size=256):
+        self.angle_step = angle_step
+        self.cache_size = cache_size
+        self._bases = {}
+        self._rotated = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_background(self, length, angle):
+        """Return the rotated background of a runway.
+
+        Arguments:
+            length {int} -- Length class of the runway, 1...3.
+            angle {float} -- Angle of the runway in degrees.
+
+        Returns:
+            Surface -- The background of the runway.
+        """
+
+        return self._get_rotated("background", length, angle)
+
+    def get_markings(self, length, angle):
+        """Return the rotated middle line of a runway.
+
+        Arguments:
+            length {int} -- Length class of the runway, 1...3.
+            angle {float} -- Angle of the runway in degrees.
+
+        Returns:
+            Surface -- The markings of the runway.
+        """
+
+        return self._get_rotated("markings", length, angle)
+
+    def _get_rotated(self, kind, length, angle):
+        """Return a rotated surface from the cache, creating it if needed.
+
+        Arguments:
+            kind {str} -- "background" or "markings".
+            length {int} -- Length class of the runway, 1...3.
+            angle {float} -- Angle of the runway in degrees.
+
+        Returns:
+            Surface -- The rotated surface.
+        """
+
+        steps = int(round(angle / self.angle_step))
+        steps %= int(round(360 / self.angle_step))
+        key = (kind, length, steps)
+        with self._lock:
+            surface = self._rotated.get(key)
+            if surface is not None:
+                self._rotated.move_to_end(key)
+                return surface
+            base = self._bases.get((kind, length))
+            if base is None:
+                base = self._create_base(kind, length)
+                self._bases[(kind, length)] = base
+            surface = pygame.transform.rotate(base, steps * self.angle_step)
+            self._rotated[key] = surface
+            if len(self._rotated) > self.cache_size:
+                self._rotated.popitem(last=False)
+            return surface
+
+    @staticmethod
+    def _create_base(kind, length):
+        """Create an unrotated runway surface.
+
+        Arguments:
+            kind {str} -- "background" or "markings".
+            length {int} -- Length class of the runway, 1...3.
+
+        Returns:
+            Surface -- The surface.
+        """
+
+        full_length = Runway.RUNWAY_LENGTH_ENUM[length]
+        surface = pygame.Surface((Runway.RUNWAY_WIDTH, full_length),
+                                 pygame.SRCALPHA)
+        if kind == "background":
+            surface.fill(Runway.RUNWAY_COLOR)
+            return surface
+
+        edge_offset = 5
+        line_length = 5
+        line_width = 2
+
+        x = Runway.RUNWAY_WIDTH / 2
+        final_y = full_length - edge_offset
+        start_y = edge_offset
+
+        painted = False
+        while not painted:
+            end_y = start_y + line_length
+            if end_y > final_y:
+                end_y = final_y
+                painted = True
+            pygame.draw.line(surface, colors.WHITE, (x, start_y), (x, end_y),
+                             line_width)
+            start_y = end_y + line_length
+        return surface
+
+
+# Sprites shared by all runways.
+SPRITES = RunwaySprites()
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+"""Automatic runway selection for incoming flights."""
+
+import numpy as np
+
+from airportgame.flight import Flight
+
+
+class RunwaySelector():
+    """Ranks the runways of an airfield for one or more flights.
+
+    The cost of landing a flight on a runway is estimated in seconds and
+    evaluated for all flights and runways at once with numpy. It consists of
+    the flying time along an approximation of the landing path created by
+    Flight.generate_landing_path, the current queue delay of the runway and a
+    penalty for using a runway that is longer than the plane needs. Runways
+    that are too short for the plane get an infinite cost.
+
+    Arguments:
+        airfield {Airfield} -- Airfield whose runways are evaluated.
+    """
+
+    # Penalty in seconds per unnecessary runway length class
+    SIZE_MISMATCH_PENALTY = 2.0
+    # Penalty in seconds for a 180 degree turn onto the final approach
+    TURN_PENALTY = 4.0
+    DEFAULT_PLANE_SIZE = 1
+
+    def __init__(self, airfield):
+        self.airfield = airfield
+
+    def evaluate(self, flights):
+        """Calculate the landing cost of every flight on every runway.
+
+        Arguments:
+            flights {list[Flight]} -- Flights to evaluate.
+
+        Returns:
+            ndarray -- Array of shape (flights, runways) with the costs.
+        """
+
+        runways = self.airfield.get_runways()
+        if not flights or not runways:
+            return np.zeros((len(flights), len(runways)))
+
+        positions = np.array([(flight.x, flight.y) for flight in flights],
+                             dtype=float)
+        headings = np.radians([flight.direction for flight in flights])
+        directions = np.stack((np.sin(headings), np.cos(headings)), axis=1)
+        plane_sizes = np.array([self._get_plane_size(flight)
+                                for flight in flights])
+
+        geometry = self.airfield.get_runway_geometry()
+        lengths = geometry.full_lengths
+        runway_units = geometry.directions
+        approach_points = geometry.approach_points
+        length_classes = np.array([runway.length for runway in runways])
+        delays = np.array([self.get_queue_delay(runway)
+                           for runway in runways], dtype=float)
+
+        # Same control points as in Flight.generate_landing_path
+        lead_points = (positions[:, np.newaxis, :]
+                       + directions[:, np.newaxis, :]
+                       * 0.5 * lengths[np.newaxis, :, np.newaxis])
+        to_approach = approach_points[np.newaxis, :, :] - lead_points
+        to_approach_length = np.linalg.norm(to_approach, axis=2)
+        path_length = to_approach_length + 2.0 * lengths[np.newaxis, :]
+
+        # Penalize sharp turns from the lead point onto the runway axis.
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cos_turn = np.sum(to_approach * runway_units[np.newaxis, :, :],
+                              axis=2) / to_approach_length
+        cos_turn = np.where(np.isfinite(cos_turn), cos_turn, 1.0)
+        turn_cost = 0.5 * (1.0 - cos_turn) * self.TURN_PENALTY
+
+        flying_time = path_length / (Flight.SPEED * 1000.0)
+
+        size_difference = (length_classes[np.newaxis, :]
+                           - plane_sizes[:, np.newaxis])
+        size_cost = np.where(size_difference < 0, np.inf,
+                             size_difference * self.SIZE_MISMATCH_PENALTY)
+
+        return flying_time + turn_cost + size_cost + delays[np.newaxis, :]
+
+    def rank(self, flights):
+        """Rank the runways for each of the given flights.
+
+        Arguments:
+            flights {list[Flight]} -- Flights to rank the runways for.
+
+        Returns:
+            ndarray -- Runway indices for each flight, best first.
+            ndarray -- Costs of the runways in the same order.
+        """
+
+        costs = self.evaluate(flights)
+        order = np.argsort(costs, axis=1, kind="stable")
+        return order, np.take_along_axis(costs, order, axis=1)
+
+    def rank_runways(self, flight):
+        """Return the usable runways for a single flight, best first.
+
+        Arguments:
+            flight {Flight} -- Flight to rank the runways for.
+
+        Returns:
+            list[tuple] -- (Runway, cost) pairs sorted by cost.
+        """
+
+        runways = self.airfield.get_runways()
+        order, costs = self.rank([flight])
+        return [(runways[i], cost) for i, cost in zip(order[0], costs[0])
+                if np.isfinite(cost)]
+
+    def best_runways(self, flights):
+        """Return the best runway for each of the given flights.
+
+        Arguments:
+            flights {list[Flight]} -- Flights to find runways for.
+
+        Returns:
+            list -- Best Runway for each flight, or None if no runway is
+                usable.
+        """
+
+        runways = self.airfield.get_runways()
+        order, costs = self.rank(flights)
+        best = []
+        for i in range(len(flights)):
+            if costs.shape[1] > 0 and np.isfinite(costs[i, 0]):
+                best.append(runways[order[i, 0]])
+            else:
+                best.append(None)
+        return best
+
+    @staticmethod
+    def get_queue_delay(runway):
+        """Estimate how long a new flight would wait for the runway.
+
+        Arguments:
+            runway {Runway} -- Runway.
+
+        Returns:
+            float -- Delay in seconds.
+        """
+
+        return runway.cooldown + len(runway.queue) * runway.wait_time
+
+    def _get_plane_size(self, flight):
+        """Return the size of the plane of the flight.
+
+        Arguments:
+            flight {Flight} -- Flight.
+
+        Returns:
+            int -- Size of the plane, 1...3.
+        """
+
+        if flight.plane is None:
+            return self.DEFAULT_PLANE_SIZE
+        return flight.plane.size
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+"""Immutable snapshots of the game state for drawing."""
+
+import threading
+from collections import namedtuple
+
+import pygame.math as pgmath
+
+from airportgame.flight import Flight
+
+
+class FlightSnapshot(namedtuple("FlightSnapshot", [
+        "x", "y", "direction", "status", "path", "path_pos", "plane"])):
+    """State of a Flight at the end of a simulation tick. Has the same
+    drawing methods as Flight."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_flight(cls, flight):
+        """Take a snapshot of a flight.
+
+        Arguments:
+            flight {Flight} -- Flight.
+
+        Returns:
+            FlightSnapshot -- Snapshot of the flight.
+        """
+
+        return cls(flight.x, flight.y, flight.direction, flight.get_status(),
+                   flight.path, flight.path_pos, flight.plane)
+
+    def get_pos(self):
+        """Return the position as a vector.
+
+        Returns:
+            Vector2 -- Position.
+        """
+
+        return pgmath.Vector2(self.x, self.y)
+
+    def get_color(self):
+        """Return the color of the icon of the flight.
+
+        Returns:
+            tuple -- Color.
+        """
+
+        return Flight.ICON_COLORS[self.status]
+
+    def is_landing(self):
+        """Return true if the flight is landing.
+
+        Returns:
+            bool -- True if the Flight is landing.
+        """
+
+        return self.status == Flight.STATUS_LANDING
+
+    # Paths are not changed after they have been created, so the drawing
+    # methods of Flight work on snapshots as well.
+    draw_subpath = Flight.draw_subpath
+    draw_selection_box = Flight.draw_selection_box
+    draw_path = Flight.draw_path
+
+
+# State of the whole game at the end of a simulation tick.
+GameSnapshot = namedtuple("GameSnapshot", [
+    "tick",
+    "background_key",
+    "show_main_menu",
+    "player_missing",
+    "airfield",
+    "paths",
+    "flights",
+    "selected_flight",
+    "selected_runway",
+    "draw_subpaths",
+])
+
+
+class SnapshotBuffer():
+    """Double buffer for handing snapshots from the simulation to the
+    renderer. The simulation writes to the back buffer and then swaps it with
+    the front buffer, so the renderer always reads a complete snapshot.
+    """
+
+    def __init__(self):
+        self._buffers = [None, None]
+        self._front = 0
+        self._lock = threading.Lock()
+
+    def publish(self, snapshot):
+        """Make a new snapshot available to the renderer.
+
+        Arguments:
+            snapshot {GameSnapshot} -- Snapshot of the current tick.
+        """
+
+        back = 1 - self._front
+        self._buffers[back] = snapshot
+        with self._lock:
+            self._front = back
+
+    def get_latest(self):
+        """Return the latest published snapshot.
+
+        Returns:
+            GameSnapshot -- Snapshot, or None if nothing has been published.
+        """
+
+        with self._lock:
+            return self._buffers[self._front]
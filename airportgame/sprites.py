@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""Pre-rendered sprites for drawing many flights quickly."""
+
+import pygame
+import pygame.draw as pgdraw
+import pygame.math as pgmath
+
+import airportgame.colors as colors
+from airportgame.flight import Flight
+
+
+class FlightSpriteAtlas():
+    """Flight icons pre-rendered in every direction and color, so that all
+    flights can be drawn with a single call to Surface.blits.
+
+    Keyword Arguments:
+        angle_step {float} -- Angular resolution of the sprites in degrees.
+            (default: {5})
+        icon_colors {iterable} -- Colors to pre-render the sprites in.
+            (default: {all colors of Flight.ICON_COLORS})
+    """
+
+    def __init__(self, angle_step=5, icon_colors=None):
+        self.angle_step = angle_step
+        self.n_angles = int(round(360 / angle_step))
+        if icon_colors is None:
+            icon_colors = Flight.ICON_COLORS.values()
+        # Heading line is twice as long as the radius of the icon
+        self.half_size = Flight.ICON_SIZE * 2 + 1
+        self._sprites = {}
+        for color in set(icon_colors):
+            self._sprites[color] = [self._render(i * self.angle_step, color)
+                                    for i in range(self.n_angles)]
+
+    def _render(self, direction, color):
+        """Render the flight icon.
+
+        Arguments:
+            direction {float} -- Direction of the flight in degrees.
+            color {tuple} -- Color of the icon.
+
+        Returns:
+            Surface -- The icon.
+        """
+
+        size = self.half_size * 2 + 1
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        center = pgmath.Vector2(self.half_size, self.half_size)
+        pgdraw.circle(sprite, color, (self.half_size, self.half_size),
+                      Flight.ICON_SIZE, 0)
+        dir_vect = (pgmath.Vector2(0, 1).rotate(-direction)
+                    * Flight.ICON_SIZE * 2)
+        end = dir_vect + center
+        pgdraw.line(sprite, color, (self.half_size, self.half_size),
+                    (int(end[0]), int(end[1])))
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite
+
+    def get_sprite(self, direction, color=colors.BLACK):
+        """Return the sprite closest to the given direction.
+
+        Arguments:
+            direction {float} -- Direction of the flight in degrees.
+
+        Keyword Arguments:
+            color {tuple} -- Color of the icon. (default: {colors.BLACK})
+
+        Returns:
+            Surface -- The icon.
+        """
+
+        index = int(round(direction / self.angle_step)) % self.n_angles
+        return self._sprites[color][index]
+
+    def draw(self, screen, flights, camera=None):
+        """Draw the icons of all the flights. The icons have the same size
+        regardless of the zoom of the camera.
+
+        Arguments:
+            screen {Surface} -- Surface to draw on.
+            flights {list[Flight]} -- Flights to draw.
+
+        Keyword Arguments:
+            camera {Camera} -- Camera to view the flights through, or None to
+                draw in world coordinates. (default: {None})
+
+        Returns:
+            list[Rect] -- Bounding rectangles of the icons.
+        """
+
+        half_size = self.half_size
+        sequence = []
+        for flight in flights:
+            if camera is None:
+                x, y = int(flight.x), int(flight.y)
+            else:
+                x, y = camera.world_to_screen((flight.x, flight.y))
+            sequence.append((
+                self.get_sprite(flight.direction, flight.get_color()),
+                (x - half_size, y - half_size)))
+        if hasattr(screen, "blits"):
+            return screen.blits(sequence)
+        # Surface.blits is not available before pygame 1.9.4
+        return [screen.blit(sprite, dest) for sprite, dest in sequence]
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""Work done in the background while the game is running."""
+
+import threading
+
+
+class BackgroundTask():
+    """Calls a function in a separate thread. The result is collected with
+    result, which waits for the function to finish.
+
+    Arguments:
+        function {callable} -- Function to call.
+        *args -- Arguments for the function.
+    """
+
+    def __init__(self, function, *args):
+        self._function = function
+        self._args = args
+        self._result = None
+        self._error = None
+        self._thread = threading.Thread(target=self._run,
+                                        name=function.__name__, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            self._result = self._function(*self._args)
+        except Exception as error:  # pylint: disable=broad-except
+            self._error = error
+
+    def done(self):
+        """Return True if the function has finished.
+
+        Returns:
+            bool -- Whether the result is available without waiting.
+        """
+
+        return not self._thread.is_alive()
+
+    def result(self):
+        """Wait for the function to finish and return its return value.
+        Exceptions raised by the function are raised again here.
+
+        Returns:
+            object -- Return value of the function.
+        """
+
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._result
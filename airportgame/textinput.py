@@ -2,6 +2,9 @@
 
 """Implementation of the TextInput class."""
 
+import string
+
+import pygame
 from pygame.locals import *
 
 from airportgame.colors import BLACK
@@ -10,6 +13,10 @@ class TextInput():
     """
     Class for interpreting text input from keyboard.
     """
+    # Characters typed by the letter keys
+    KEY_CHARACTERS = {getattr(pygame, "K_" + character): character
+                      for character in string.ascii_lowercase}
+
     def __init__(self, pgtext, max_length = 0, color=BLACK):
         self.active = False
         self.return_pressed = False
@@ -22,12 +29,39 @@ class TextInput():
         self.show_cursor = True
         self.color = color
 
-    def update(self, elapsed_time, events):
-        """Update state and handle events.
+    def register_events(self, router):
+        """Register the key handlers of the text input.
+
+        Arguments:
+            router {EventRouter} -- Router of the game events.
+        """
+
+        for key in self.KEY_CHARACTERS:
+            router.register(KEYDOWN, self.handle_key, key)
+        for key in (K_BACKSPACE, K_RETURN, K_KP_ENTER):
+            router.register(KEYDOWN, self.handle_key, key)
+
+    def handle_key(self, event):
+        """Edit the text according to a pressed key.
+
+        Arguments:
+            event {Event} -- KEYDOWN event.
+        """
+
+        if not self.active or self.return_pressed:
+            return
+        if event.key == K_BACKSPACE:
+            self.value = self.value[:-1]
+        elif event.key == K_RETURN or event.key == K_KP_ENTER:
+            self.return_pressed = True
+        else:
+            self.value += self.KEY_CHARACTERS[event.key]
+
+    def update(self, elapsed_time):
+        """Update state.
 
         Arguments:
             elapsed_time {float} -- Time elapsed since last call.
-            events {list} -- List of events to handle.
         """
 
         self.cursor_tick += elapsed_time
@@ -35,51 +69,22 @@ class TextInput():
             self.show_cursor = not self.show_cursor
             self.cursor_tick = 0
 
-        # Process keyboard events:
-        for event in events:
-            if event.type == KEYDOWN and not self.return_pressed:
-                if event.key == K_BACKSPACE: self.value = self.value[:-1]
-                elif event.key == K_RETURN or event.key == K_KP_ENTER: self.return_pressed = True
-                elif event.key == K_a: self.value += "a"
-                elif event.key == K_b: self.value += "b"
-                elif event.key == K_c: self.value += "c"
-                elif event.key == K_d: self.value += "d"
-                elif event.key == K_e: self.value += "e"
-                elif event.key == K_f: self.value += "f"
-                elif event.key == K_g: self.value += "g"
-                elif event.key == K_h: self.value += "h"
-                elif event.key == K_i: self.value += "i"
-                elif event.key == K_j: self.value += "j"
-                elif event.key == K_k: self.value += "k"
-                elif event.key == K_l: self.value += "l"
-                elif event.key == K_m: self.value += "m"
-                elif event.key == K_n: self.value += "n"
-                elif event.key == K_o: self.value += "o"
-                elif event.key == K_p: self.value += "p"
-                elif event.key == K_q: self.value += "q"
-                elif event.key == K_r: self.value += "r"
-                elif event.key == K_s: self.value += "s"
-                elif event.key == K_t: self.value += "t"
-                elif event.key == K_u: self.value += "u"
-                elif event.key == K_v: self.value += "v"
-                elif event.key == K_w: self.value += "w"
-                elif event.key == K_x: self.value += "x"
-                elif event.key == K_y: self.value += "y"
-                elif event.key == K_z: self.value += "z"
-
     def draw(self, screen):
         """Draw the inputted text.
 
         Arguments:
             screen {Surface} -- Surface to draw on.
+
+        Returns:
+            Rect -- Bounding rectangle of the text, or None.
         """
 
         if not self.active:
-            return
+            return None
         text = self.value
         if self.show_cursor:
             text += "_"
-        self.pgtext.display_text(text, screen, self.x, self.y, self.color)
+        return self.pgtext.display_text(text, screen, self.x, self.y, self.color)
 
     def activate(self):
         """Activate the text input."""
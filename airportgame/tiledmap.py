@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of the TiledMap class."""
+
+import threading
+from collections import OrderedDict
+
+import pygame
+
+from airportgame.utilities import union_rects
+
+
+class TiledMap():
+    """A large map split into square tiles. Tiles are rendered when they are
+    first drawn and kept in a least recently used cache, so only the
+    visible part of the map costs memory and drawing time.
+
+    Arguments:
+        width {int} -- Width of the map.
+        height {int} -- Height of the map.
+        render_tile {callable} -- Function that draws a tile. Called with the
+            tile Surface and the Rect of the tile in map coordinates.
+
+    Keyword Arguments:
+        tile_size {int} -- Width and height of the tiles. (default: {256})
+        cache_size {int} -- Maximum number of rendered tiles kept.
+            (default: {256})
+        colorkey {tuple} -- Transparent color of the tiles, or None.
+            (default: {None})
+    """
+
+    def __init__(self, width, height, render_tile, tile_size=256,
+                 cache_size=256, colorkey=None):
+        self.width = width
+        self.height = height
+        self.render_tile = render_tile
+        self.tile_size = tile_size
+        self.cache_size = cache_size
+        self.colorkey = colorkey
+        self.columns = (width + tile_size - 1) // tile_size
+        self.rows = (height + tile_size - 1) // tile_size
+        self._tiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_size(self):
+        """Return the size of the map.
+
+        Returns:
+            tuple -- Width and height.
+        """
+
+        return (self.width, self.height)
+
+    def get_tile_rect(self, column, row):
+        """Return the area of a tile in map coordinates.
+
+        Arguments:
+            column {int} -- Column of the tile.
+            row {int} -- Row of the tile.
+
+        Returns:
+            Rect -- Area of the tile, clipped to the map.
+        """
+
+        x = column * self.tile_size
+        y = row * self.tile_size
+        return pygame.Rect(x, y, min(self.tile_size, self.width - x),
+                           min(self.tile_size, self.height - y))
+
+    def get_tile(self, column, row):
+        """Return a tile, rendering it if it is not in the cache.
+
+        Arguments:
+            column {int} -- Column of the tile.
+            row {int} -- Row of the tile.
+
+        Returns:
+            Surface -- The tile.
+        """
+
+        key = (column, row)
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is not None:
+                self._tiles.move_to_end(key)
+                return tile
+        rect = self.get_tile_rect(column, row)
+        tile = pygame.Surface(rect.size)
+        if pygame.display.get_surface() is not None:
+            tile = tile.convert()
+        if self.colorkey is not None:
+            tile.fill(self.colorkey)
+        self.render_tile(tile, rect)
+        if self.colorkey is not None:
+            tile.set_colorkey(self.colorkey, pygame.RLEACCEL)
+        with self._lock:
+            self._tiles[key] = tile
+            if len(self._tiles) > self.cache_size:
+                self._tiles.popitem(last=False)
+        return tile
+
+    def invalidate(self):
+        """Forget the rendered tiles, e.g. after the content has changed."""
+
+        with self._lock:
+            self._tiles.clear()
+
+    def get_visible_tiles(self, area):
+        """Return the tiles that overlap an area.
+
+        Arguments:
+            area {Rect} -- Area in map coordinates.
+
+        Returns:
+            list[tuple] -- Column and row of each tile.
+        """
+
+        area = area.clip(pygame.Rect(0, 0, self.width, self.height))
+        if area.width == 0 or area.height == 0:
+            return []
+        first_column = area.left // self.tile_size
+        last_column = (area.right - 1) // self.tile_size
+        first_row = area.top // self.tile_size
+        last_row = (area.bottom - 1) // self.tile_size
+        return [(column, row)
+                for row in range(first_row, last_row + 1)
+                for column in range(first_column, last_column + 1)]
+
+    def draw(self, screen, offset, camera=None):
+        """Draw the visible tiles of the map.
+
+        Arguments:
+            screen {Surface} -- Surface to draw on.
+            offset {tuple} -- World coordinates of the top-left corner of
+                the map.
+
+        Keyword Arguments:
+            camera {Camera} -- Camera to view the map through, or None to
+                draw in world coordinates. (default: {None})
+
+        Returns:
+            Rect -- Bounding rectangle of the drawn tiles, or None.
+        """
+
+        offset_x, offset_y = offset
+        if camera is None:
+            view = screen.get_rect()
+        else:
+            view = camera.get_view_rect()
+        view.move_ip(-int(offset_x) - 1, -int(offset_y) - 1)
+        view.inflate_ip(2, 2)
+
+        sequence = []
+        for column, row in self.get_visible_tiles(view):
+            tile = self.get_tile(column, row)
+            rect = self.get_tile_rect(column, row)
+            top_left = (rect.left + offset_x, rect.top + offset_y)
+            if camera is None:
+                sequence.append((tile, (int(top_left[0]), int(top_left[1]))))
+                continue
+            left, top = camera.world_to_screen(top_left)
+            right, bottom = camera.world_to_screen(
+                (top_left[0] + rect.width, top_left[1] + rect.height))
+            if (right - left, bottom - top) != rect.size:
+                # Scale to the next tile so that no gaps are left between
+                tile = pygame.transform.scale(
+                    tile, (max(1, right - left), max(1, bottom - top)))
+            sequence.append((tile, (left, top)))
+        return union_rects([screen.blit(tile, dest)
+                            for tile, dest in sequence])
@@ -3,6 +3,8 @@
 
 import math
 
+import numpy as np
+
 def vec2int(vector):
     """Vector to integer tuple.
 
@@ -37,3 +39,49 @@ def distance_between(a, b):
         b_y = b[1]
         distance = math.sqrt((a_x - b_x) ** 2 + (a_y - b_y) ** 2)
         return distance
+
+def union_rects(rects):
+    """Return the smallest rectangle that contains all the given rectangles.
+
+    Arguments:
+        rects {list[Rect]} -- Rectangles.
+
+    Returns:
+        Rect -- Union of the rectangles, or None if the list is empty.
+    """
+
+    rects = [rect for rect in rects if rect is not None]
+    if not rects:
+        return None
+    return rects[0].unionall(rects[1:])
+
+def distances_to_segments(points, starts, ends):
+    """Return the shortest distances from each point to each line segment.
+
+    Arguments:
+        points {array_like} -- M points, e.g. an (M, 2) array or a list of
+            tuples.
+        starts {array_like} -- Start points of N segments.
+        ends {array_like} -- End points of N segments.
+
+    Returns:
+        ndarray -- (M, N) array of distances.
+    """
+
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+    start_x = starts[:, 0]
+    start_y = starts[:, 1]
+    segment_x = ends[:, 0] - start_x
+    segment_y = ends[:, 1] - start_y
+    lengths_squared = segment_x * segment_x + segment_y * segment_y
+    # Segments of zero length are points
+    lengths_squared[lengths_squared == 0] = 1.0
+    to_x = points[:, 0:1] - start_x
+    to_y = points[:, 1:2] - start_y
+    t = np.clip((to_x * segment_x + to_y * segment_y) / lengths_squared,
+                0.0, 1.0)
+    to_x -= t * segment_x
+    to_y -= t * segment_y
+    return np.sqrt(to_x * to_x + to_y * to_y)
@@ -0,0 +1,423 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks for paths, airfields and the game update loop.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench --output results.json
+
+and compare a later run against the saved results with:
+
+    python -m benchmarks.bench --baseline results.json
+
+The exit status is 1 if any benchmark is slower than the baseline by more
+than the threshold.
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+# The game needs a display, but the benchmarks should not open a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from airportgame.airfield import Airfield
+from airportgame.controller import GreedyController
+from airportgame.flight import Flight
+from airportgame.game import Game
+from airportgame.layouts import LayoutLibrary
+from airportgame.path import (PointsPath, CatmullRomPath, CatmullRomPathMemory,
+                              CubicBSplinePath, PathCursor,
+                              EllipticalPathEnsemble, RectanglePathEnsemble)
+
+
+# Allowed slowdown compared to the baseline, 0.25 = 25 % slower
+DEFAULT_THRESHOLD = 0.25
+FLIGHT_COUNTS = (10, 100, 1000, 10000)
+RUNWAY_COUNTS = (3, 6, 10)
+N_LOOKUPS = 1000
+# Simulated time per game update in milliseconds
+UPDATE_STEP = 16
+# Flights kept in the game while a bot lands them, and its landing rate
+CONTROLLED_FLIGHTS = 100
+CONTROLLER_RATE = 30.0
+SEED = 1
+
+
+def measure(function, repeat=5, number=None, min_time=0.05):
+    """Time a function.
+
+    Arguments:
+        function {callable} -- Function to time, called without arguments.
+
+    Keyword Arguments:
+        repeat {int} -- Number of timed rounds. (default: {5})
+        number {int} -- Calls per round, or None to call the function
+            until a round takes at least min_time. (default: {None})
+        min_time {float} -- Minimum duration of a round in seconds when
+            number is None. (default: {0.05})
+
+    Returns:
+        dict -- Minimum, median and mean time of one call in milliseconds,
+            and the number of calls per round and rounds.
+    """
+
+    if number is None:
+        number = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                function()
+            if time.perf_counter() - start >= min_time or number >= 10**6:
+                break
+            number *= 10
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        times.append((time.perf_counter() - start) * 1000.0 / number)
+    return {
+        "min_ms": min(times),
+        "median_ms": float(np.median(times)),
+        "mean_ms": float(np.mean(times)),
+        "number": number,
+        "repeat": repeat
+    }
+
+
+def random_points(n, width=400, height=200):
+    """Return random points for the control points of a path.
+
+    Arguments:
+        n {int} -- Number of points.
+
+    Keyword Arguments:
+        width {int} -- Width of the area of the points. (default: {400})
+        height {int} -- Height of the area of the points. (default: {200})
+
+    Returns:
+        list[Vector2] -- The points.
+    """
+
+    return [pygame.math.Vector2(random.uniform(0, width),
+                                random.uniform(0, height))
+            for _ in range(n)]
+
+
+def lookup_benchmarks(name, path):
+    """Return benchmarks for random and sequential lookups along a path.
+
+    Arguments:
+        name {str} -- Prefix of the benchmark names.
+        path {BasePath} -- Path or PathEnsemble.
+
+    Returns:
+        list[tuple] -- (name, function) tuples.
+    """
+
+    distances = [random.uniform(0, path.length) for _ in range(N_LOOKUPS)]
+    step = path.length / N_LOOKUPS
+
+    def lookup():
+        for distance in distances:
+            path.get_point_along_path(distance)
+
+    def cursor():
+        path_cursor = PathCursor(path)
+        for _ in range(N_LOOKUPS):
+            path_cursor.advance(step)
+
+    return [(name + "/lookup", lookup), (name + "/cursor", cursor)]
+
+
+def path_benchmarks():
+    """Benchmarks for creating paths and finding points on them."""
+
+    points = random_points(10)
+    path_types = [PointsPath, CatmullRomPath, CatmullRomPathMemory,
+                  CubicBSplinePath]
+    benchmarks = []
+    for path_type in path_types:
+        name = "path/" + path_type.__name__
+        benchmarks.append((name + "/construct",
+                           lambda path_type=path_type: path_type(points)))
+        benchmarks += lookup_benchmarks(name, path_type(points))
+    ensembles = [
+        RectanglePathEnsemble((60, 60), (740, 540), circular=True),
+        EllipticalPathEnsemble((60, 60), (740, 540), circular=True)
+    ]
+    for ensemble in ensembles:
+        benchmarks += lookup_benchmarks(
+            "path/" + type(ensemble).__name__, ensemble)
+    return benchmarks
+
+
+def airfield_benchmarks():
+    """Benchmarks for generating airfields and landing paths."""
+
+    benchmarks = []
+    for n_runways in RUNWAY_COUNTS:
+        airfield = Airfield()
+        airfield.min_runways = n_runways
+        airfield.max_runways = n_runways
+
+        def create_airfield(airfield=airfield):
+            airfield.runway_list = []
+            airfield.create_airfield()
+
+        benchmarks.append(("airfield/create_airfield/{0}".format(n_runways),
+                           create_airfield))
+
+    airfield = Airfield()
+    runways = airfield.get_runways()
+    flights = [Flight("", None, x=random.uniform(0, 800),
+                      y=random.uniform(0, 600)) for _ in range(10)]
+
+    def generate_landing_paths():
+        for i, flight in enumerate(flights):
+            flight.generate_landing_path(runways[i % len(runways)])
+
+    benchmarks.append(("flight/generate_landing_path",
+                       generate_landing_paths))
+
+    directory = tempfile.TemporaryDirectory()
+    library = LayoutLibrary(directory.name)
+    library.save("layout", airfield)
+
+    def load_layout(directory=directory):
+        library.load("layout")
+
+    benchmarks.append(("airfield/load_layout", load_layout))
+    return benchmarks
+
+
+def add_flights(game, n_flights):
+    """Add flights at random positions to a game.
+
+    Arguments:
+        game {Game} -- The game.
+        n_flights {int} -- Number of flights.
+    """
+
+    for _ in range(n_flights):
+        game.incoming_flights.append(
+            Flight("", None, x=random.randint(0, Game.WORLD_WIDTH - 1),
+                   y=random.randint(0, Game.WORLD_HEIGHT - 1)))
+
+
+def create_game(n_flights, controller=None):
+    """Create a game without a game loop, with the given number of holding
+    flights.
+
+    Arguments:
+        n_flights {int} -- Number of flights.
+
+    Keyword Arguments:
+        controller {Controller} -- Controller of the game. (default: {None})
+
+    Returns:
+        Game -- The game.
+    """
+
+    game = Game(skip_name_input=True, start=False, controller=controller)
+    game.show_main_menu = False
+    while game.airfield is None:
+        game.update(UPDATE_STEP)
+    add_flights(game, n_flights)
+    # Assign the flights to holding paths before timing
+    game.update(UPDATE_STEP)
+    return game
+
+
+def game_benchmarks():
+    """Benchmarks for updating the game logic. The games are created one at
+    a time and each is closed when the next benchmark is requested, so that
+    their background threads do not run during the other benchmarks."""
+
+    for n_flights in FLIGHT_COUNTS:
+        game = create_game(n_flights)
+        try:
+            yield ("game/update/{0}".format(n_flights),
+                   lambda game=game: game.update(UPDATE_STEP))
+        finally:
+            game.close()
+
+    # Flights are landed by a bot and replaced as they land
+    game = create_game(CONTROLLED_FLIGHTS,
+                       GreedyController(rate=CONTROLLER_RATE))
+
+    def update_controlled():
+        add_flights(game, CONTROLLED_FLIGHTS - len(game.incoming_flights))
+        game.update(UPDATE_STEP)
+    try:
+        yield ("game/controller/{0}".format(CONTROLLED_FLIGHTS),
+               update_controlled)
+    finally:
+        game.close()
+
+
+BENCHMARK_GROUPS = [path_benchmarks, airfield_benchmarks, game_benchmarks]
+
+
+def run_benchmarks(name_filter="", repeat=5, min_time=0.05):
+    """Run the benchmarks.
+
+    Keyword Arguments:
+        name_filter {str} -- Only run benchmarks whose name contains this.
+            (default: {""})
+        repeat {int} -- Number of timed rounds. (default: {5})
+        min_time {float} -- Minimum duration of a round in seconds.
+            (default: {0.05})
+
+    Returns:
+        dict -- Benchmark name to the timings returned by measure.
+    """
+
+    results = {}
+    for group in BENCHMARK_GROUPS:
+        random.seed(SEED)
+        benchmarks = group()
+        try:
+            for name, function in benchmarks:
+                if name_filter not in name:
+                    continue
+                random.seed(SEED)
+                results[name] = measure(function, repeat=repeat,
+                                        min_time=min_time)
+        finally:
+            # Groups that are generators clean up when closed
+            if hasattr(benchmarks, "close"):
+                benchmarks.close()
+    return results
+
+
+def get_metadata():
+    """Return information about the environment the benchmarks ran in.
+
+    Returns:
+        dict -- Environment metadata.
+    """
+
+    try:
+        commit = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL,
+            cwd=os.path.dirname(os.path.abspath(__file__)))
+        commit = commit.decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pygame": pygame.version.ver,
+        "sdl": ".".join(str(part) for part in pygame.get_sdl_version()),
+        "commit": commit
+    }
+
+
+def compare_results(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Compare median times with a baseline.
+
+    The baseline can override the threshold of single benchmarks with a
+    "thresholds" dictionary of benchmark names to thresholds.
+
+    Arguments:
+        results {dict} -- Results returned by run_benchmarks.
+        baseline {dict} -- Contents of a saved results file.
+
+    Keyword Arguments:
+        threshold {float} -- Allowed relative slowdown.
+            (default: {DEFAULT_THRESHOLD})
+
+    Returns:
+        list[tuple] -- (name, baseline ms, current ms, ratio, regressed)
+            tuples for the benchmarks that are in both.
+    """
+
+    thresholds = baseline.get("thresholds", {})
+    comparison = []
+    for name, old in sorted(baseline["results"].items()):
+        if name not in results:
+            continue
+        old_time = old["median_ms"]
+        new_time = results[name]["median_ms"]
+        ratio = new_time / old_time if old_time > 0 else float("inf")
+        regressed = ratio > 1.0 + thresholds.get(name, threshold)
+        comparison.append((name, old_time, new_time, ratio, regressed))
+    return comparison
+
+
+def main(argv=None):
+    """Run the benchmarks from the command line.
+
+    Keyword Arguments:
+        argv {list[str]} -- Command line arguments. (default: {sys.argv})
+
+    Returns:
+        int -- Exit status.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output",
+                        help="save the results to this JSON file")
+    parser.add_argument("-b", "--baseline",
+                        help="compare the results to this JSON file")
+    parser.add_argument("-t", "--threshold", type=float,
+                        default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown compared to the baseline")
+    parser.add_argument("-k", "--filter", default="",
+                        help="only run benchmarks whose name contains this")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="number of timed rounds")
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="minimum duration of a round in seconds")
+    args = parser.parse_args(argv)
+
+    logging.getLogger("airportgame").setLevel(logging.ERROR)
+    pygame.init()
+    pygame.display.set_mode((Game.WINDOW_WIDTH, Game.WINDOW_HEIGHT))
+
+    results = run_benchmarks(args.filter, args.repeat, args.min_time)
+    pygame.quit()
+    for name, result in results.items():
+        print("{0:<45}{1:>12.4f} ms".format(name, result["median_ms"]))
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump({"metadata": get_metadata(), "results": results},
+                      output_file, indent=2)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        print()
+        for name, old_time, new_time, ratio, regressed in compare_results(
+                results, baseline, args.threshold):
+            print("{0:<45}{1:>12.4f}{2:>12.4f}{3:>8.2f}x{4}".format(
+                name, old_time, new_time, ratio,
+                "  REGRESSION" if regressed else ""))
+            if regressed:
+                status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
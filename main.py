@@ -2,32 +2,91 @@
 """Main function, initializes pygame and starts the game."""
 
 import logging
+import logging.handlers
+import queue
+import time
 
-import pygame
 
-from airportgame.game import Game
+# Level of the log messages shown, logging.DEBUG for a verbose run
+LOG_LEVEL = logging.INFO
+SKIP_NAME_INPUT = False
+# Update the game logic in a separate thread from drawing
+THREADED_SIMULATION = False
+# CSV or JSON file for the frame times of the latest frames, or None
+FRAME_PROFILE_OUTPUT = None
+# Name of a saved airfield layout to play on, or None for a random airfield
+AIRFIELD_LAYOUT = None
+# Width and height of a large airfield, e.g. (4000, 2000), or None for the
+# default airfield
+AIRFIELD_SIZE = None
+# Landing commands per second issued by a bot, or None to play normally
+CONTROLLER_RATE = None
+# JSON lines file for the runtime metrics, or None to disable them
+METRICS_OUTPUT = None
 
 
-SKIP_NAME_INPUT = False
+def setup_logging(level=LOG_LEVEL):
+    """Send log messages to stderr from a background thread, so that the
+    game does not wait for writing them. The message of a record is still
+    formatted by the QueueHandler before it is queued, because arguments
+    such as vectors and game objects may change before the background
+    thread gets to them.
+
+    Keyword Arguments:
+        level {int} -- Level of the messages shown. (default: {LOG_LEVEL})
+
+    Returns:
+        QueueListener -- The thread writing the messages. Stop it before
+            quitting to write the remaining messages.
+    """
+
+    log_queue = queue.Queue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    return listener
 
 
 def main():
     """The main function."""
+    start_time = time.perf_counter()
     # Initialize logging
-    logging.basicConfig(level=logging.DEBUG)
+    listener = setup_logging()
     logger = logging.getLogger(__name__)
 
-    # Initialize pygame
-    logger.debug("Initializing pygame")
-    pygame.init()
-    pygame.display.set_caption("AirController - Remastered")
+    try:
+        # Imported here so that the time to the first frame includes loading
+        # pygame and the game
+        import pygame
+        from airportgame.controller import GreedyController
+        from airportgame.game import Game
+
+        # Initialize pygame. Only the modules the game uses are initialized,
+        # pygame.init() would also open the audio device and joysticks.
+        logger.debug("Initializing pygame")
+        pygame.display.init()
+        pygame.font.init()
+        pygame.display.set_caption("AirController - Remastered")
 
-    # Initialize game
-    logger.debug("Initializing game")
-    Game(skip_name_input=SKIP_NAME_INPUT)
+        # Initialize game
+        logger.debug("Initializing game")
+        controller = None
+        if CONTROLLER_RATE is not None:
+            controller = GreedyController(rate=CONTROLLER_RATE)
+        Game(skip_name_input=SKIP_NAME_INPUT, threaded=THREADED_SIMULATION,
+             profile_output=FRAME_PROFILE_OUTPUT, start_time=start_time,
+             airfield_layout=AIRFIELD_LAYOUT, airfield_size=AIRFIELD_SIZE,
+             controller=controller, metrics_output=METRICS_OUTPUT)
 
-    logger.debug("Quiting the game")
-    pygame.quit()
+        logger.debug("Quiting the game")
+        pygame.quit()
+    finally:
+        # Write the remaining messages
+        listener.stop()
 
 
 if __name__ == "__main__":
@@ -1,8 +1,13 @@
 """Tests for airfield class."""
 
+import random
 import unittest
 
-from airportgame.airfield import Airfield
+import numpy as np
+
+from airportgame.airfield import Airfield, LargeAirfield
+from airportgame.airfieldfactory import AirfieldFactory
+from airportgame.utilities import distances_to_segments
 
 
 class TestAirfield(unittest.TestCase):
@@ -15,6 +20,116 @@ class TestAirfield(unittest.TestCase):
             c = (5, c_y)
             self.assertAlmostEqual(field.dist_to_segment(a, b, c), 5)
 
+    def test_distances_to_segments(self):
+        points = [(5, 0), (5, 5), (0, 12), (3, 3)]
+        starts = [(0, 0), (3, 3)]
+        ends = [(0, 10), (3, 3)]
+        distances = distances_to_segments(points, starts, ends)
+        self.assertEqual(distances.shape, (4, 2))
+        np.testing.assert_allclose(
+            distances,
+            [[5, 13 ** 0.5], [5, 8 ** 0.5], [2, 90 ** 0.5], [3, 0]])
+
+    def test_runway_geometry(self):
+        random.seed(2)
+        field = Airfield(offset=(100, 50))
+        runways = field.get_runways()
+        geometry = field.get_runway_geometry()
+        self.assertEqual(len(geometry), len(runways))
+        points = [runway.get_end_pos() for runway in runways]
+        distances = geometry.get_distances(points)
+        np.testing.assert_allclose(np.diag(distances), 0, atol=1e-9)
+        np.testing.assert_allclose(
+            geometry.approach_points,
+            [runway.get_approach_point() for runway in runways])
+        np.testing.assert_allclose(geometry.angles,
+                                   [runway.get_angle() for runway in runways])
+        with self.assertRaises(ValueError):
+            geometry.starts[0, 0] = 0
+        for i, runway in enumerate(runways):
+            start, end = runway.get_start_and_end_pos()
+            for j, point in enumerate(points):
+                self.assertAlmostEqual(
+                    distances[j, i], field.dist_to_segment(start, end, point))
+
+    def test_get_runway_at(self):
+        random.seed(4)
+        field = Airfield(offset=(100, 50))
+        for runway in field.get_runways():
+            start, end = runway.get_start_and_end_pos()
+            middle = ((start[0] + end[0]) / 2, (start[1] + end[1]) / 2)
+            self.assertIs(field.get_runway_at(middle), runway)
+        self.assertIsNone(field.get_runway_at((0, 0)))
+        # Every pixel of a runway is drawn on the map
+        airfield_map = field.get_airfield_map()
+        for x in range(0, Airfield.FIELD_WIDTH, 3):
+            for y in range(0, Airfield.FIELD_HEIGHT, 3):
+                if field.get_runway_at((x + 100, y + 50)) is not None:
+                    self.assertNotEqual(airfield_map.get_at((x, y))[:3],
+                                        Airfield.TRANSPARENCY_COLORKEY)
+
+    def test_prefetched_reset(self):
+        field = Airfield(prefetch=1)
+        airfield_map = field.get_airfield_map()
+        version = field.get_version()
+        runways = field.get_runways()
+        for _ in range(3):
+            field.reset_airfield()
+            self.assertIsNot(field.get_runways(), runways)
+            runways = field.get_runways()
+            self.assertEqual(len(field.get_runway_geometry()), len(runways))
+        field.factory.stop()
+        self.assertIs(field.get_airfield_map(), airfield_map)
+        self.assertEqual(field.get_version(), version + 3)
+        # The map of the layout has been copied to the airfield
+        layout = field.generate_layout()
+        field.factory = None
+        field.apply_layout(layout)
+        self.assertEqual(field.get_airfield_map().get_at((0, 0)),
+                         layout.map.get_at((0, 0)))
+
+    def test_factory_error(self):
+        field = Airfield()
+        generate_layout = field.generate_layout
+        calls = []
+
+        def fail_once(surface=None):
+            calls.append(surface)
+            if len(calls) == 1:
+                raise RuntimeError("no layout")
+            return generate_layout(surface)
+
+        field.generate_layout = fail_once
+        with self.assertLogs("airportgame.airfieldfactory", "ERROR"):
+            factory = AirfieldFactory(field, size=1)
+            try:
+                first = factory.get_layout()
+                second = factory.get_layout()
+            finally:
+                factory.stop()
+        self.assertGreater(len(first.runways), 0)
+        self.assertGreater(len(second.runways), 0)
+        self.assertGreaterEqual(len(calls), 3)
+
+    def test_large_airfield(self):
+        random.seed(6)
+        field = LargeAirfield(offset=(10, 20), size=(1200, 600))
+        self.assertGreater(len(field.get_runways()), 20)
+        runway = field.get_runways()[0]
+        start, end = runway.get_start_and_end_pos()
+        middle = field.remove_offset_from_tuple(
+            ((start[0] + end[0]) / 2, (start[1] + end[1]) / 2))
+        tile_map = field.get_airfield_map()
+        column = int(middle[0]) // tile_map.tile_size
+        row = int(middle[1]) // tile_map.tile_size
+        rect = tile_map.get_tile_rect(column, row)
+        tile = tile_map.get_tile(column, row)
+        color = tile.get_at((int(middle[0]) - rect.left,
+                             int(middle[1]) - rect.top))
+        self.assertNotEqual(color[:3], Airfield.TRANSPARENCY_COLORKEY)
+        self.assertIs(field.get_runway_at(
+            field.add_offset_to_tuple(middle)), runway)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,41 @@
+"""Tests for the benchmark helpers."""
+
+import unittest
+
+from benchmarks.bench import measure, compare_results
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_measure(self):
+        calls = []
+        result = measure(lambda: calls.append(1), repeat=3, number=4)
+        self.assertEqual(len(calls), 12)
+        self.assertEqual(result["number"], 4)
+        self.assertLessEqual(result["min_ms"], result["median_ms"])
+
+    def test_compare_results(self):
+        baseline = {
+            "results": {
+                "a": {"median_ms": 1.0},
+                "b": {"median_ms": 1.0},
+                "c": {"median_ms": 1.0},
+                "removed": {"median_ms": 1.0}
+            },
+            "thresholds": {"c": 1.0}
+        }
+        results = {
+            "a": {"median_ms": 1.1},
+            "b": {"median_ms": 1.5},
+            "c": {"median_ms": 1.5},
+            "new": {"median_ms": 1.0}
+        }
+        comparison = compare_results(results, baseline, threshold=0.25)
+        self.assertEqual([row[0] for row in comparison], ["a", "b", "c"])
+        self.assertEqual([row[4] for row in comparison],
+                         [False, True, False])
+        self.assertAlmostEqual(comparison[1][3], 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
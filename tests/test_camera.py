@@ -0,0 +1,37 @@
+"""Tests for camera class."""
+
+import unittest
+
+import pygame
+
+from airportgame.camera import Camera
+
+
+class TestCamera(unittest.TestCase):
+
+    def setUp(self):
+        self.camera = Camera(800, 600)
+
+    def test_round_trip(self):
+        self.camera.pan(120, -40)
+        self.camera.zoom_at(2.0, (400, 300))
+        world = self.camera.screen_to_world((100, 50))
+        self.assertEqual(self.camera.world_to_screen(world), (100, 50))
+
+    def test_zoom_keeps_point(self):
+        before = self.camera.screen_to_world((200, 100))
+        self.camera.zoom_at(1.5, (200, 100))
+        after = self.camera.screen_to_world((200, 100))
+        self.assertAlmostEqual(before[0], after[0])
+        self.assertAlmostEqual(before[1], after[1])
+
+    def test_culling(self):
+        self.camera.zoom_at(2.0, (0, 0))
+        self.assertTrue(self.camera.is_visible(pygame.Rect(390, 290, 5, 5)))
+        self.assertFalse(self.camera.is_visible(pygame.Rect(410, 310, 5, 5)))
+        mask = self.camera.cull_points([10, 500, -20], [10, 10, 10])
+        self.assertEqual(mask.tolist(), [True, False, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
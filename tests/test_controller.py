@@ -0,0 +1,56 @@
+"""Tests for the automatic controllers."""
+
+import random
+import unittest
+
+from airportgame.airfield import Airfield
+from airportgame.controller import (Controller, ControllerState,
+                                    GreedyController, LandingCommand)
+from airportgame.flight import Flight
+from airportgame.snapshot import FlightSnapshot
+
+
+class TestGreedyController(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(3)
+        self.airfield = Airfield()
+        self.flights = [Flight("", None, x=10 * i, y=300) for i in range(4)]
+
+    def get_state(self):
+        return ControllerState(
+            flights=tuple(FlightSnapshot.from_flight(flight)
+                          for flight in self.flights),
+            airfield=self.airfield)
+
+    def test_abstract(self):
+        with self.assertRaises(TypeError):
+            Controller()
+
+    def test_rate(self):
+        controller = GreedyController(rate=2.0)
+        self.assertEqual(controller.update(self.get_state(), 400), [])
+        commands = controller.update(self.get_state(), 600)
+        self.assertEqual([command.flight for command in commands], [0, 1])
+        runways = self.airfield.get_runways()
+        for command in commands:
+            self.assertIsInstance(command, LandingCommand)
+            self.assertLess(command.runway, len(runways))
+
+    def test_landing_flights_are_skipped(self):
+        controller = GreedyController(rate=1.0)
+        self.flights[0].generate_landing_path(self.airfield.get_runways()[0])
+        commands = controller.update(self.get_state(), 1000)
+        self.assertEqual([command.flight for command in commands], [1])
+
+    def test_nothing_to_land(self):
+        controller = GreedyController(rate=1.0)
+        self.flights = []
+        self.assertEqual(controller.update(self.get_state(), 10000), [])
+        # Time without flights is not saved up
+        self.flights = [Flight("", None, x=0, y=0) for _ in range(3)]
+        self.assertEqual(len(controller.update(self.get_state(), 0)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
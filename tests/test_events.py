@@ -0,0 +1,70 @@
+"""Tests for the event router."""
+
+import unittest
+
+import pygame
+
+from airportgame.events import EXPOSE_EVENTS, EventRouter
+from airportgame.textinput import TextInput
+
+
+def key_event(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key)
+
+
+class TestEventRouter(unittest.TestCase):
+
+    def setUp(self):
+        self.router = EventRouter()
+        self.handled = []
+
+    def handle(self, event):
+        self.handled.append(event)
+
+    def test_dispatch(self):
+        self.router.register(pygame.KEYDOWN, self.handle, pygame.K_a)
+        self.router.register(pygame.QUIT, self.handle)
+        events = [key_event(pygame.K_b), key_event(pygame.K_a),
+                  pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1)),
+                  pygame.event.Event(pygame.QUIT)]
+        self.router.dispatch(events)
+        self.assertEqual(self.handled, [events[1], events[3]])
+        self.assertEqual(self.router.get_event_types(),
+                         sorted([pygame.KEYDOWN, pygame.QUIT]))
+
+        self.router.unregister(pygame.QUIT, self.handle)
+        self.router.dispatch(events)
+        self.assertEqual(self.handled, [events[1], events[3], events[1]])
+        self.assertEqual(self.router.get_event_types(), [pygame.KEYDOWN])
+
+    def test_set_allowed(self):
+        pygame.display.init()
+        self.router.register(pygame.QUIT, self.handle)
+        try:
+            self.router.set_allowed()
+            self.assertTrue(pygame.event.get_blocked(pygame.MOUSEMOTION))
+            self.assertFalse(pygame.event.get_blocked(pygame.QUIT))
+            # The window events are needed for repainting the display
+            for event_type in EXPOSE_EVENTS:
+                self.assertFalse(pygame.event.get_blocked(event_type))
+        finally:
+            pygame.event.set_allowed(None)
+
+    def test_text_input(self):
+        textinput = TextInput(None)
+        textinput.register_events(self.router)
+        keys = [pygame.K_a, pygame.K_b, pygame.K_BACKSPACE, pygame.K_z]
+        self.router.dispatch([key_event(key) for key in keys])
+        # Keys are ignored until the text input is activated
+        self.assertEqual(textinput.get_value(), "")
+        textinput.activate()
+        self.router.dispatch([key_event(key) for key in keys])
+        self.assertEqual(textinput.get_value(), "az")
+        self.router.dispatch([key_event(pygame.K_RETURN),
+                              key_event(pygame.K_c)])
+        self.assertTrue(textinput.was_return_pressed())
+        self.assertEqual(textinput.get_value(), "az")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""Tests for game class."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pygame
+
+from airportgame.airfield import LargeAirfield
+from airportgame.game import Game
+from airportgame.layouts import LayoutLibrary
+from airportgame.metrics import METRICS
+
+
+class TestGame(unittest.TestCase):
+
+    def setUp(self):
+        pygame.display.init()
+        pygame.font.init()
+        self.game = Game(skip_name_input=True, start=False)
+
+    def tearDown(self):
+        self.game.close()
+        pygame.event.set_allowed(None)
+
+    def test_expose_redraws_display(self):
+        self.game.draw(self.game.screen)
+        self.assertTrue(self.game.handle_events(
+            0, [pygame.event.Event(pygame.VIDEOEXPOSE)]))
+        with mock.patch("pygame.display.flip") as flip:
+            self.game.draw(self.game.screen)
+        flip.assert_called_once_with()
+
+    def test_background_key(self):
+        game = self.game
+        game.show_main_menu = False
+        while game.airfield is None:
+            game.update(16)
+        key = game.get_background_key()
+        game.update(16)
+        self.assertEqual(game.get_background_key(), key)
+        game.airfield.reset_airfield()
+        self.assertNotEqual(game.get_background_key(), key)
+
+    def test_close_stops_metrics(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "metrics.jsonl")
+            self.game.start_metrics(filename)
+            self.assertTrue(METRICS.enabled)
+            self.game.show_main_menu = False
+            while self.game.airfield is None:
+                self.game.update(16)
+            self.assertIsNotNone(self.game.airfield.factory)
+            self.game.close()
+            self.assertFalse(METRICS.enabled)
+            self.assertIsNone(self.game.metrics_writer)
+            self.assertIsNone(self.game.airfield.factory)
+            with open(filename) as file:
+                self.assertIn("flights.spawned",
+                              json.loads(file.readline())["metrics"])
+        METRICS.reset()
+
+    def test_large_layout(self):
+        with tempfile.TemporaryDirectory() as directory, \
+                mock.patch.object(Game, "LAYOUT_DIRECTORY", directory):
+            LayoutLibrary(directory).save(
+                "large", LargeAirfield(size=(1200, 600)))
+            game = Game(skip_name_input=True, start=False,
+                        airfield_layout="large")
+            try:
+                self.assertEqual(game.airfield_size, (1200, 600))
+                self.assertEqual(game.WORLD_WIDTH,
+                                 1200 + 2 * Game.WORLD_MARGIN)
+                game.show_main_menu = False
+                while game.airfield is None:
+                    game.update(16)
+                self.assertIsInstance(game.airfield, LargeAirfield)
+                self.assertEqual(game.airfield.FIELD_WIDTH, 1200)
+                self.assertEqual(tuple(game.airfield.offset),
+                                 game.center_airfield())
+                self.assertEqual(len(game.paths), 3)
+            finally:
+                game.close()
+            with self.assertRaises(ValueError):
+                Game(skip_name_input=True, start=False,
+                     airfield_layout="large", airfield_size=(800, 400))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+"""Tests for holding manager class."""
+
+import unittest
+
+from airportgame.flight import Flight
+from airportgame.holding import HoldingManager
+from airportgame.path import EllipticalPathEnsemble
+
+
+class TestHoldingManager(unittest.TestCase):
+
+    def setUp(self):
+        self.paths = [
+            EllipticalPathEnsemble((0, 0), (300, 200), circular=True),
+            EllipticalPathEnsemble((50, 50), (250, 150), circular=True),
+        ]
+        self.manager = HoldingManager(self.paths)
+
+    def test_least_loaded_path(self):
+        flights = [Flight("", None) for _ in range(5)]
+        for flight in flights:
+            self.manager.assign(flight)
+        self.assertEqual(self.manager.get_load(self.paths[0]), 3)
+        self.assertEqual(self.manager.get_load(self.paths[1]), 2)
+        self.manager.release(flights[0])
+        self.manager.release(flights[2])
+        self.assertIs(self.manager.assign(Flight("", None)), self.paths[0])
+
+    def test_spacing(self):
+        flights = [Flight("", None) for _ in range(8)]
+        for flight in flights:
+            self.manager.assign(flight)
+            for _ in range(3):
+                for other in flights:
+                    if other.path is not None:
+                        other.update(100)
+                self.manager.update(100)
+        for path in self.paths:
+            length = path.length
+            positions = sorted(flight.path_pos % length for flight in flights
+                               if flight.path is path)
+            gaps = [b - a for a, b in zip(positions, positions[1:])]
+            gaps.append(positions[0] + length - positions[-1])
+            self.assertAlmostEqual(min(gaps), length / 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Tests for the airfield layout library."""
+
+import os
+import random
+import tempfile
+import unittest
+
+from airportgame.airfield import Airfield
+from airportgame.layouts import LayoutLibrary, layout_to_dict, layout_from_dict
+
+
+class TestLayoutLibrary(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(4)
+        self.directory = tempfile.TemporaryDirectory()
+        self.library = LayoutLibrary(os.path.join(self.directory.name, "l"))
+        self.airfield = Airfield(offset=(100, 50))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assert_same_runways(self, airfield, offset=(0, 0)):
+        runways = self.airfield.get_runways()
+        loaded = airfield.get_runways()
+        self.assertEqual(len(loaded), len(runways))
+        for runway, other in zip(runways, loaded):
+            self.assertEqual(other.get_number(), runway.get_number())
+            self.assertEqual(other.length, runway.length)
+            for point, other_point in zip(runway.get_start_and_end_pos(),
+                                          other.get_start_and_end_pos()):
+                self.assertEqual(other_point[0], point[0] + offset[0])
+                self.assertEqual(other_point[1], point[1] + offset[1])
+
+    def test_dict(self):
+        data = layout_to_dict(self.airfield)
+        runways, offset = layout_from_dict(data)
+        self.assertEqual(offset, (100, 50))
+        self.assertEqual(len(runways), len(self.airfield.get_runways()))
+        data["version"] = 0
+        with self.assertRaises(ValueError):
+            layout_from_dict(data)
+
+    def test_save_and_load(self):
+        self.assertEqual(self.library.get_names(), [])
+        self.library.save("first", self.airfield)
+        self.assertEqual(self.library.get_names(), ["first"])
+        layout, _, size = self.library.load_layout("first")
+        self.assertEqual(size, (Airfield.FIELD_WIDTH, Airfield.FIELD_HEIGHT))
+        self.assertIsNotNone(layout.map)
+
+        airfield = self.library.load("first")
+        self.assert_same_runways(airfield)
+        original = self.airfield.get_airfield_map()
+        loaded = airfield.get_airfield_map()
+        for point in [(0, 0), (200, 100), (123, 45)]:
+            self.assertEqual(loaded.get_at(point), original.get_at(point))
+
+    def test_without_map(self):
+        self.library.save("plain", self.airfield, save_map=False)
+        layout, _, _ = self.library.load_layout("plain")
+        self.assertIsNone(layout.map)
+        airfield = self.library.load("plain", offset=(110, 40))
+        self.assert_same_runways(airfield, offset=(10, -10))
+        self.assertEqual(airfield.get_airfield_map().get_size(),
+                         (Airfield.FIELD_WIDTH, Airfield.FIELD_HEIGHT))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""Tests for the metrics module."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from airportgame.metrics import MetricsRegistry, MetricsWriter
+
+
+class TestMetricsRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_disabled(self):
+        counter = self.registry.counter("counter")
+        gauge = self.registry.gauge("gauge")
+        histogram = self.registry.histogram("histogram", (1, 10))
+        counter.inc()
+        gauge.set(5)
+        histogram.observe(3)
+        self.assertEqual(self.registry.get_snapshot(), {
+            "counter": 0,
+            "gauge": None,
+            "histogram": {"buckets": [1, 10], "counts": [0, 0, 0],
+                          "count": 0, "sum": 0.0}
+        })
+
+    def test_enabled(self):
+        self.registry.enable()
+        counter = self.registry.counter("counter")
+        self.assertIs(self.registry.counter("counter"), counter)
+        counter.inc()
+        counter.inc(2)
+        self.registry.gauge("gauge").set(5)
+        histogram = self.registry.histogram("histogram", (1, 10))
+        for value in (0.5, 1, 3, 20):
+            histogram.observe(value)
+        snapshot = self.registry.get_snapshot()
+        self.assertEqual(snapshot["counter"], 3)
+        self.assertEqual(snapshot["gauge"], 5)
+        self.assertEqual(snapshot["histogram"]["counts"], [2, 1, 1])
+        self.assertEqual(snapshot["histogram"]["sum"], 24.5)
+        with self.assertRaises(ValueError):
+            self.registry.gauge("counter")
+
+        self.registry.reset()
+        snapshot = self.registry.get_snapshot()
+        self.assertEqual(snapshot["counter"], 0)
+        self.assertEqual(snapshot["histogram"]["counts"], [0, 0, 0])
+
+    def test_writer(self):
+        self.registry.enable()
+        self.registry.counter("counter").inc()
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "metrics.jsonl")
+            writer = MetricsWriter(self.registry, filename, interval=60)
+            writer.write()
+            self.registry.counter("counter").inc()
+            writer.stop()
+            with open(filename) as file:
+                lines = [json.loads(line) for line in file]
+        self.assertEqual([line["metrics"]["counter"] for line in lines],
+                         [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,11 @@
 
 import unittest
 
-from airportgame.path import EllipticalPathEnsemble
+from pygame.math import Vector2
+
+from airportgame.path import (CatmullRomPath, CatmullRomPathMemory,
+                              EllipticalPathEnsemble, PathCursor, PointsPath,
+                              RectanglePathEnsemble)
 from airportgame.utilities import distance_between
 
 
@@ -13,3 +17,39 @@ class TestEllipticalPathEnsemble(unittest.TestCase):
         start = path.get_point_along_path(0)
         end = path.get_point_along_path(path.length * 0.999999)
         self.assertLess(distance_between(start, end), 1e-5)
+
+
+class TestPathCursor(unittest.TestCase):
+
+    def setUp(self):
+        points = [Vector2(0, 0), Vector2(50, 10), Vector2(120, 90),
+                  Vector2(60, 150), Vector2(10, 100)]
+        self.paths = [
+            PointsPath(points),
+            CatmullRomPath(points),
+            CatmullRomPathMemory(points),
+            EllipticalPathEnsemble((0, 0), (200, 100), circular=True),
+            RectanglePathEnsemble((0, 0), (200, 100), circular=True),
+        ]
+
+    def assertSamePoint(self, a, b):
+        self.assertLess(distance_between(a, b), 1e-6)
+
+    def test_advance_matches_lookup(self):
+        for path in self.paths:
+            cursor = PathCursor(path)
+            distance = 0.0
+            while distance < path.length * 2.5:
+                distance += 3.7
+                point = cursor.advance(3.7)
+                self.assertSamePoint(point,
+                                     path.get_point_along_path(distance))
+
+    def test_seek(self):
+        for path in self.paths:
+            cursor = PathCursor(path)
+            for distance in [path.length * 0.9, 1.0, path.length * 0.5,
+                             path.length * 1.3, 0.0]:
+                point = cursor.seek(distance)
+                self.assertSamePoint(point,
+                                     path.get_point_along_path(distance))
@@ -0,0 +1,62 @@
+"""Tests for pgtext module."""
+
+import unittest
+
+import pygame
+
+from airportgame.colors import BLACK, RED
+from airportgame.pgtext import FONTS, PgText, draw_text
+
+
+class TestPgText(unittest.TestCase):
+
+    def setUp(self):
+        pygame.font.init()
+        self.pgtext = PgText(None, 20, cache_size=2)
+
+    def test_cache(self):
+        first = self.pgtext.create_text("abc", BLACK)
+        self.assertIs(self.pgtext.create_text("abc", BLACK), first)
+        self.assertIsNot(self.pgtext.create_text("abc", RED), first)
+        self.assertEqual((self.pgtext.hits, self.pgtext.misses), (1, 2))
+
+    def test_least_recently_used_is_dropped(self):
+        first = self.pgtext.create_text("a")
+        self.pgtext.create_text("b")
+        self.pgtext.create_text("a")
+        self.pgtext.create_text("c")
+        self.assertIs(self.pgtext.create_text("a"), first)
+        self.pgtext.create_text("b")
+        self.assertEqual(self.pgtext.misses, 4)
+
+    def test_display_value(self):
+        screen = pygame.Surface((100, 100))
+        for value in [59.9, 60.1, 59.8, 60.2]:
+            self.pgtext.display_value("{0:.2f}", value, screen, step=0.5)
+        self.assertEqual(self.pgtext.misses, 1)
+
+
+class TestFontRegistry(unittest.TestCase):
+
+    def setUp(self):
+        pygame.font.init()
+
+    def test_fonts_are_reused(self):
+        font = FONTS.get_font(None, 18)
+        self.assertIs(FONTS.get_font(None, 18), font)
+        self.assertIsNot(FONTS.get_font(None, 18, bold=True), font)
+
+    def test_preload(self):
+        FONTS.preload([(None, 19)])
+        self.assertIs(PgText(None, 19).font, FONTS.get_font(None, 19))
+
+    def test_draw_number(self):
+        screen = pygame.Surface((100, 100))
+        rect = draw_text(None, 18, "10", screen, (5, 5), BLACK)
+        digits = FONTS.get_digits(None, 18, BLACK)
+        self.assertEqual(rect.width,
+                         digits["1"].get_width() + digits["0"].get_width())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""Tests for the runway placement grid."""
+
+import random
+import unittest
+
+import numpy as np
+
+from airportgame.airfield import Airfield
+from airportgame.placement import OccupancyGrid
+
+
+class TestOccupancyGrid(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(3)
+        self.grid = OccupancyGrid(100, 50, margin=5)
+
+    def test_margin(self):
+        self.assertTrue(self.grid.is_free((5, 5)))
+        self.assertFalse(self.grid.is_free((4, 20)))
+        self.assertFalse(self.grid.is_free((20, 46)))
+        self.assertFalse(self.grid.is_free((101, 20)))
+
+    def test_occupy_segment(self):
+        field = Airfield()
+        start, end = (20, 10), (60, 30)
+        self.grid.occupy_segment(start, end, 10)
+        for x in range(5, 96):
+            for y in range(5, 46):
+                self.assertEqual(
+                    self.grid.is_free((x, y)),
+                    field.dist_to_segment(start, end, (x, y)) >= 10)
+
+    def test_find_segment(self):
+        for _ in range(20):
+            start, end = self.grid.find_segment(30)
+            self.assertTrue(self.grid.is_free(start))
+            self.assertTrue(self.grid.is_free(end))
+            length = ((end[0] - start[0]) ** 2
+                      + (end[1] - start[1]) ** 2) ** 0.5
+            self.assertAlmostEqual(length, 30, delta=1.5)
+
+    def test_full(self):
+        self.grid.occupy_segment((0, 25), (100, 25), 100)
+        self.assertIsNone(self.grid.find_segment(10))
+
+
+class TestRunwayPlacement(unittest.TestCase):
+
+    def test_runways_are_apart(self):
+        random.seed(5)
+        field = Airfield()
+        field.min_runways = 100
+        field.max_runways = 100
+        field.reset_airfield()
+        runways = field.get_runways()
+        self.assertGreater(len(runways), 3)
+        self.assertLess(len(runways), 100)
+        geometry = field.get_runway_geometry()
+        for i, runway in enumerate(runways):
+            for point in runway.get_start_and_end_pos():
+                x, y = field.remove_offset_from_tuple(point)
+                self.assertTrue(Airfield.EDGE_BUFFER <= x <=
+                                Airfield.FIELD_WIDTH - Airfield.EDGE_BUFFER)
+                self.assertTrue(Airfield.EDGE_BUFFER <= y <=
+                                Airfield.FIELD_HEIGHT - Airfield.EDGE_BUFFER)
+                # Far enough from the runways placed before it
+                distances = geometry.get_distances([point])[0, :i]
+                self.assertTrue(np.all(distances >= Airfield.MINIMUM_DISTANCE))
+
+
+if __name__ == '__main__':
+    unittest.main()
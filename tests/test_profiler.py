@@ -0,0 +1,58 @@
+"""Tests for profiler module."""
+
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from airportgame.profiler import FrameProfiler
+
+
+class TestFrameProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = FrameProfiler(size=4)
+        for _ in range(6):
+            self.profiler.begin_frame()
+            self.profiler.mark("a")
+            self.profiler.mark("b")
+            self.profiler.end_frame()
+        self.profiler.begin_frame()
+        self.profiler.mark("a")
+        self.profiler.end_frame()
+
+    def test_ring_buffer(self):
+        frames = self.profiler.get_frames()
+        self.assertEqual(frames.shape, (4, 2))
+        self.assertEqual(self.profiler.phases, ["a", "b"])
+        self.assertEqual(self.profiler.frame_count, 7)
+        # The newest frame did not have phase b
+        self.assertNotEqual(frames[-1, 1], frames[-1, 1])
+
+    def test_percentiles(self):
+        percentiles = self.profiler.get_percentiles()
+        self.assertEqual(set(percentiles), {"a", "b"})
+        for values in percentiles.values():
+            self.assertEqual(len(values), len(FrameProfiler.PERCENTILES))
+            self.assertLessEqual(values[0], values[-1])
+
+    def test_dump(self):
+        with tempfile.TemporaryDirectory() as directory:
+            csv_name = os.path.join(directory, "frames.csv")
+            self.profiler.dump(csv_name)
+            with open(csv_name) as csv_file:
+                rows = list(csv.reader(csv_file))
+            self.assertEqual(rows[0], ["a", "b"])
+            self.assertEqual(len(rows), 5)
+
+            json_name = os.path.join(directory, "frames.json")
+            self.profiler.dump(json_name)
+            with open(json_name) as json_file:
+                data = json.load(json_file)
+            self.assertEqual(len(data["frames"]), 4)
+            self.assertIsNone(data["frames"][-1][1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Tests for the renderer."""
+
+import unittest
+from unittest import mock
+
+import pygame
+
+from airportgame.airfield import Airfield
+from airportgame.renderer import BackgroundCompositor, Renderer
+
+
+class TestBackgroundCompositor(unittest.TestCase):
+
+    def setUp(self):
+        self.compositor = BackgroundCompositor((100, 80))
+        self.drawn = []
+
+    def draw_layers(self, surface):
+        self.drawn.append(surface)
+
+    def test_key(self):
+        self.assertTrue(self.compositor.update("a", self.draw_layers))
+        self.assertFalse(self.compositor.update("a", self.draw_layers))
+        self.assertEqual(len(self.drawn), 1)
+        self.assertTrue(self.compositor.update("b", self.draw_layers))
+        self.assertFalse(self.compositor.update("b", self.draw_layers))
+        self.assertEqual(len(self.drawn), 2)
+        self.assertIs(self.drawn[0], self.compositor.surface)
+
+        self.compositor.invalidate()
+        self.assertTrue(self.compositor.update("b", self.draw_layers))
+        self.assertEqual(len(self.drawn), 3)
+
+    def test_airfield_version(self):
+        airfield = Airfield()
+        for _ in range(3):
+            self.compositor.update((airfield, airfield.get_version()),
+                                   self.draw_layers)
+        self.assertEqual(len(self.drawn), 1)
+        airfield.reset_airfield()
+        for _ in range(3):
+            self.compositor.update((airfield, airfield.get_version()),
+                                   self.draw_layers)
+        self.assertEqual(len(self.drawn), 2)
+
+
+class TestRenderer(unittest.TestCase):
+
+    def setUp(self):
+        self.screen = pygame.Surface((100, 80))
+        self.renderer = Renderer(self.screen)
+        self.drawn = []
+
+    def draw_background(self, background):
+        self.drawn.append(background)
+        background.fill((10, 20, 30))
+
+    def draw_frame(self, rect=(5, 5, 10, 10)):
+        self.renderer.begin_frame("key", self.draw_background)
+        self.screen.fill((255, 0, 0), rect)
+        self.renderer.add(pygame.Rect(rect))
+        with mock.patch("pygame.display.flip") as flip, \
+                mock.patch("pygame.display.update") as update:
+            self.renderer.present()
+        return flip, update
+
+    def test_invalidate(self):
+        flip, update = self.draw_frame()
+        flip.assert_called_once_with()
+        update.assert_not_called()
+
+        # Only the changed areas are updated while the key stays the same
+        flip, update = self.draw_frame()
+        flip.assert_not_called()
+        update.assert_called_once()
+        self.assertEqual(len(self.drawn), 1)
+
+        self.renderer.invalidate()
+        flip, update = self.draw_frame()
+        flip.assert_called_once_with()
+        update.assert_not_called()
+        self.assertEqual(len(self.drawn), 2)
+
+    def test_dirty_rects(self):
+        self.draw_frame()
+        flip, update = self.draw_frame((50, 40, 10, 10))
+        flip.assert_not_called()
+        # The erased and the new drawing are both updated
+        update.assert_called_once_with([pygame.Rect(5, 5, 10, 10),
+                                        pygame.Rect(50, 40, 10, 10)])
+        self.assertEqual(self.screen.get_at((8, 8)), (10, 20, 30, 255))
+        self.assertEqual(self.screen.get_at((55, 45)), (255, 0, 0, 255))
+        self.assertEqual(len(self.drawn), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
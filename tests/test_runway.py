@@ -2,7 +2,7 @@
 
 import unittest
 
-from airportgame.runway import Runway
+from airportgame.runway import Runway, RunwaySprites
 
 
 class TestRunway(unittest.TestCase):
@@ -16,4 +16,31 @@ class TestRunway(unittest.TestCase):
 
         self.assertNotAlmostEqual(runway1.get_angle(), runway2.get_angle())
         self.assertAlmostEqual(runway1.get_angle(), 0)
-        self.assertAlmostEqual(runway2.get_angle(), 90)
\ No newline at end of file
+        self.assertAlmostEqual(runway2.get_angle(), 90)
+
+    def test_shape(self):
+        runway = Runway((10, 20), (10, 120), 5, 2)
+        shape = runway.shape
+        self.assertEqual(shape.direction, (0, 1))
+        self.assertEqual(shape.full_length, Runway.RUNWAY_LENGTH_MED)
+        self.assertEqual(shape.approach_point, (10, -30))
+        self.assertEqual(shape.midpoint, (10, 70))
+        half_width = Runway.RUNWAY_WIDTH / 2
+        self.assertEqual(shape.bounding_box, (10 - half_width, 20 - half_width,
+                                              10 + half_width, 120 + half_width))
+        self.assertEqual(runway.get_approach_point(), (10, -30))
+        # The returned vectors are copies
+        runway.get_start_pos().x += 5
+        self.assertEqual(runway.get_start_pos(), (10, 20))
+
+
+class TestRunwaySprites(unittest.TestCase):
+
+    def test_cache(self):
+        sprites = RunwaySprites(angle_step=1.0, cache_size=2)
+        first = sprites.get_background(1, 30.2)
+        self.assertIs(sprites.get_background(1, 29.9), first)
+        self.assertIs(sprites.get_background(1, 390.0), first)
+        self.assertIsNot(sprites.get_background(2, 30.0), first)
+        self.assertIsNot(sprites.get_markings(1, 30.0), first)
+        self.assertIsNot(sprites.get_background(1, 30.0), first)
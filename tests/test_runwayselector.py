@@ -0,0 +1,61 @@
+"""Tests for runway selector class."""
+
+import unittest
+
+import numpy as np
+from pygame.math import Vector2
+
+from airportgame.airfield import RunwayGeometry
+from airportgame.flight import Flight
+from airportgame.plane import Plane
+from airportgame.runway import Runway
+from airportgame.runwayselector import RunwaySelector
+
+
+class FakeAirfield():
+
+    def __init__(self, runways):
+        self.runways = runways
+
+    def get_runways(self):
+        return self.runways
+
+    def get_runway_geometry(self):
+        return RunwayGeometry(self.runways)
+
+
+class TestRunwaySelector(unittest.TestCase):
+
+    def setUp(self):
+        self.near = Runway((100, 100), (170, 100), 1, 1)
+        self.far = Runway((600, 100), (750, 100), 2, 3)
+        self.selector = RunwaySelector(FakeAirfield([self.near, self.far]))
+
+    def test_closest_runway_is_best(self):
+        flight = Flight("", None, x=0, y=100)
+        flight.rotate_to_vector(Vector2(1, 0))
+        ranked = self.selector.rank_runways(flight)
+        self.assertEqual(ranked[0][0], self.near)
+        self.assertEqual(len(ranked), 2)
+
+    def test_too_short_runway_is_excluded(self):
+        flight = Flight("", Plane(3, 100, 100), x=0, y=100)
+        ranked = self.selector.rank_runways(flight)
+        self.assertEqual([runway for runway, _ in ranked], [self.far])
+
+    def test_queue_delay(self):
+        flight = Flight("", None, x=0, y=100)
+        self.near.queue = [None] * 10
+        self.assertEqual(self.selector.best_runways([flight]), [self.far])
+
+    def test_batch_matches_single(self):
+        flights = [Flight("", None, x=x, y=300) for x in range(0, 800, 100)]
+        costs = self.selector.evaluate(flights)
+        self.assertEqual(costs.shape, (len(flights), 2))
+        for i, flight in enumerate(flights):
+            np.testing.assert_allclose(costs[i],
+                                       self.selector.evaluate([flight])[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+"""Tests for snapshot module."""
+
+import unittest
+
+from airportgame.flight import Flight
+from airportgame.snapshot import FlightSnapshot, SnapshotBuffer
+
+
+class TestSnapshotBuffer(unittest.TestCase):
+
+    def test_latest(self):
+        buffer = SnapshotBuffer()
+        self.assertIsNone(buffer.get_latest())
+        for i in range(3):
+            buffer.publish(i)
+            self.assertEqual(buffer.get_latest(), i)
+
+
+class TestFlightSnapshot(unittest.TestCase):
+
+    def test_snapshot_does_not_change(self):
+        flight = Flight("", None, x=10, y=20)
+        snapshot = FlightSnapshot.from_flight(flight)
+        flight.update_pos((30, 40))
+        self.assertEqual((snapshot.x, snapshot.y), (10, 20))
+        self.assertEqual(snapshot.get_color(), flight.get_color())
+        self.assertFalse(snapshot.is_landing())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+"""Tests for sprites module."""
+
+import unittest
+
+import pygame
+
+from airportgame.colors import BLACK
+from airportgame.flight import Flight
+from airportgame.sprites import FlightSpriteAtlas
+
+
+class TestFlightSpriteAtlas(unittest.TestCase):
+
+    def setUp(self):
+        self.atlas = FlightSpriteAtlas(angle_step=10, icon_colors=[BLACK])
+
+    def test_get_sprite(self):
+        self.assertIs(self.atlas.get_sprite(4), self.atlas.get_sprite(0))
+        self.assertIs(self.atlas.get_sprite(-90), self.atlas.get_sprite(270))
+        self.assertIs(self.atlas.get_sprite(356), self.atlas.get_sprite(0))
+        self.assertIsNot(self.atlas.get_sprite(6), self.atlas.get_sprite(0))
+
+    def test_draw(self):
+        screen = pygame.Surface((100, 100))
+        flights = [Flight("", None, x=20, y=30), Flight("", None, x=70, y=50)]
+        rects = self.atlas.draw(screen, flights)
+        self.assertEqual(len(rects), 2)
+        for rect, flight in zip(rects, flights):
+            self.assertEqual(rect.center, (flight.x, flight.y))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+"""Tests for background tasks."""
+
+import threading
+import unittest
+
+from airportgame.tasks import BackgroundTask
+
+
+class TestBackgroundTask(unittest.TestCase):
+
+    def test_result(self):
+        event = threading.Event()
+
+        def wait_and_add(a, b):
+            event.wait()
+            return a + b
+
+        task = BackgroundTask(wait_and_add, 1, 2)
+        self.assertFalse(task.done())
+        event.set()
+        self.assertEqual(task.result(), 3)
+        self.assertTrue(task.done())
+
+    def test_error(self):
+        def fail():
+            raise ValueError("fail")
+
+        task = BackgroundTask(fail)
+        with self.assertRaises(ValueError):
+            task.result()
+
+
+if __name__ == '__main__':
+    unittest.main()
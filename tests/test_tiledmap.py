@@ -0,0 +1,57 @@
+"""Tests for the tiled map."""
+
+import unittest
+
+import pygame
+
+from airportgame.camera import Camera
+from airportgame.tiledmap import TiledMap
+
+
+class TestTiledMap(unittest.TestCase):
+
+    def setUp(self):
+        self.rendered = []
+        self.map = TiledMap(250, 120, self.render_tile, tile_size=100,
+                            cache_size=4)
+
+    def render_tile(self, tile, rect):
+        self.rendered.append(rect.topleft)
+        tile.fill((rect.left // 100, rect.top // 100, 50))
+
+    def test_tiles(self):
+        self.assertEqual((self.map.columns, self.map.rows), (3, 2))
+        self.assertEqual(self.map.get_tile_rect(2, 1),
+                         pygame.Rect(200, 100, 50, 20))
+        self.assertEqual(
+            self.map.get_visible_tiles(pygame.Rect(150, 50, 60, 60)),
+            [(1, 0), (2, 0), (1, 1), (2, 1)])
+        self.assertEqual(
+            self.map.get_visible_tiles(pygame.Rect(300, 0, 10, 10)), [])
+
+    def test_cache(self):
+        tile = self.map.get_tile(0, 0)
+        self.assertIs(self.map.get_tile(0, 0), tile)
+        self.assertEqual(self.rendered, [(0, 0)])
+        for column in range(3):
+            self.map.get_tile(column, 1)
+        self.map.get_tile(1, 0)
+        # The least recently used tile was dropped
+        self.assertIsNot(self.map.get_tile(0, 0), tile)
+        self.map.invalidate()
+        self.map.get_tile(1, 0)
+        self.assertEqual(len(self.rendered), 7)
+
+    def test_draw(self):
+        screen = pygame.Surface((100, 100))
+        camera = Camera(100, 100, x=160, y=90, zoom=2.0)
+        rect = self.map.draw(screen, (0, 0), camera)
+        self.assertEqual(rect, pygame.Rect(0, 0, 100, 60))
+        self.assertEqual(sorted(self.rendered),
+                         [(100, 0), (100, 100), (200, 0), (200, 100)])
+        self.assertEqual(screen.get_at((10, 5))[:3], (1, 0, 50))
+        self.assertEqual(screen.get_at((90, 30))[:3], (2, 1, 50))
+
+
+if __name__ == '__main__':
+    unittest.main()